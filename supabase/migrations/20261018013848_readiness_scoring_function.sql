@@ -0,0 +1,136 @@
+-- Set-based readiness scoring for readiness_v1 v1
+create or replace function readiness_v1.score_assessments(assessment_ids uuid[] default null)
+returns table (id uuid, overall_score integer, dimension_scores jsonb)
+language sql
+stable
+as $function$
+  with inputs as (
+    select
+      a.id,
+      coalesce(p.profile_json, '{}'::jsonb) as profile,
+      coalesce(
+        (
+          select jsonb_object_agg(aa.question_id, aa.answer_value)
+          from readiness_v1.assessment_answers aa
+          where aa.assessment_id = a.id
+        ),
+        '{}'::jsonb
+      ) as answers
+    from readiness_v1.assessments a
+    left join readiness_v1.profile_intake p on p.subject_id = a.subject_id
+    where a.assessment_id = 'readiness_v1'
+      and a.schema_version = 'v1'
+      and (assessment_ids is null or a.id = any(assessment_ids))
+  ),
+  cells as (
+    select i.id, c.section_id, c.weight, c.fraction
+    from inputs i
+    cross join lateral (values
+      ('1', 1::numeric, case i.answers->>'1.1.A.1' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case when (i.answers->>'1.1.A.1' in ('yes', 'partial')) is true then case i.answers->>'1.1.A.2' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('1', 1::numeric, case i.answers->>'1.1.A.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case when (i.answers->>'1.1.A.3' in ('yes', 'partial')) is true then case i.answers->>'1.1.A.4' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('1', 1::numeric, case i.answers->>'1.1.A.5' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case i.answers->>'1.1.A.6' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case when ((i.answers->>'1.1.B.1' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.3' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.5' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.7' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.8' in ('yes', 'partial')) is true) then case i.answers->>'1.1.A.7' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('1', 1::numeric, case i.answers->>'1.1.B.1' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case when (i.answers->>'1.1.B.1' in ('yes', 'partial')) is true then case i.answers->>'1.1.B.2' when 'yes' then 1 when 'partial' then 0.5 when 'not_sure' then 0.25 end end),
+      ('1', 1::numeric, case i.answers->>'1.1.B.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case when (i.answers->>'1.1.B.3' in ('yes', 'partial')) is true then case i.answers->>'1.1.B.4' when 'yes' then 1 when 'partial' then 0.5 when 'not_sure' then 0.25 end end),
+      ('1', 1::numeric, case when (i.answers->>'1.1.B.3' in ('yes', 'partial')) is true then case i.answers->>'1.1.B.4a' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('1', 1::numeric, case i.answers->>'1.1.B.5' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case when (i.answers->>'1.1.B.5' in ('yes', 'partial')) is true then case i.answers->>'1.1.B.6' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('1', 1::numeric, case i.answers->>'1.1.B.7' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case i.answers->>'1.1.B.8' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case i.answers->>'1.1.B.9' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('1', 1::numeric, case when ((i.answers->>'1.1.B.1' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.3' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.5' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.7' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.8' in ('yes', 'partial')) is true) then case i.answers->>'1.1.B.10' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('1', 1::numeric, case when ((i.answers->>'1.1.B.1' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.3' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.5' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.7' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.8' in ('yes', 'partial')) is true) then case i.answers->>'1.1.B.11' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('2', 1::numeric, case i.answers->>'2.1' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('2', 1::numeric, case when (i.answers->>'2.1' in ('yes', 'partial')) is true then case i.answers->>'2.2' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('2', 1::numeric, case i.answers->>'2.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('2', 1::numeric, case when ((i.answers->>'2.1' in ('yes', 'partial')) is true or (i.answers->>'2.3' in ('yes', 'partial')) is true or (i.answers->>'1.1.B.7' in ('yes', 'partial')) is true) then case i.answers->>'2.4' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('2', 1::numeric, case i.answers->>'2.5' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('2', 1::numeric, case i.answers->>'2.6' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('2', 1::numeric, case i.answers->>'2.7' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('2', 1::numeric, case i.answers->>'2.8' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('3', 1::numeric, case i.answers->>'3.1' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('3', 1::numeric, case i.answers->>'3.2' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('3', 1::numeric, case when (i.profile#>'{financial,has_beneficiary_accounts}' = 'true'::jsonb) is true then case i.answers->>'3.4' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('3', 1::numeric, case when (i.profile#>'{financial,has_beneficiary_accounts}' = 'true'::jsonb) is true then case i.answers->>'3.5' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('3', 1::numeric, case i.answers->>'3.6' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('3', 1::numeric, case i.answers->>'3.7' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('3', 1::numeric, case i.answers->>'3.8' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('3', 1::numeric, case i.answers->>'3.9' when 'yes' then 0 when 'no' then 1 when 'not_sure' then 0.25 end),
+      ('4', 1::numeric, case i.answers->>'4.2' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('4', 1::numeric, case i.answers->>'4.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('4', 1::numeric, case i.answers->>'4.4' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('5', 1::numeric, case i.answers->>'5.1' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('5', 1::numeric, case i.answers->>'5.2' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('5', 1::numeric, case when (i.profile#>'{pets,has_pets}' = 'true'::jsonb) is true then case i.answers->>'5.4' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('5', 1::numeric, case when (i.profile#>'{pets,has_pets}' = 'true'::jsonb) is true then case i.answers->>'5.5' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('6', 1::numeric, case i.answers->>'6.1' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('6', 1::numeric, case i.answers->>'6.2' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('6', 1::numeric, case i.answers->>'6.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('6', 1::numeric, case i.answers->>'6.4' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('6', 1::numeric, case i.answers->>'6.5' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('6', 1::numeric, case when (i.profile#>'{digital,owns_crypto}' = 'true'::jsonb) is true then case i.answers->>'6.7' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('6', 1::numeric, case i.answers->>'6.8' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('7', 1::numeric, case i.answers->>'7.1' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('7', 1::numeric, case i.answers->>'7.2' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('7', 1::numeric, case i.answers->>'7.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('7', 1::numeric, case i.answers->>'7.4' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('8', 1::numeric, case when (i.profile#>'{emotional,has_spiritual_practices}' = 'true'::jsonb) is true then case i.answers->>'8.1' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('8', 1::numeric, case when (i.profile#>'{emotional,has_spiritual_practices}' = 'true'::jsonb) is true then case i.answers->>'8.2' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('8', 1::numeric, case i.answers->>'8.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('9', 1::numeric, case when (i.profile#>'{family,supports_aging_parent}' = 'true'::jsonb) is true then case i.answers->>'9.2' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('9', 1::numeric, case when (i.profile#>'{family,supports_aging_parent}' = 'true'::jsonb) is true then case i.answers->>'9.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('9', 1::numeric, case when (i.profile#>'{family,supports_aging_parent}' = 'true'::jsonb) is true then case i.answers->>'9.4' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('10', 1::numeric, case when (i.profile#>'{home,owns_real_property}' = 'true'::jsonb) is true then case i.answers->>'10.1' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('10', 1::numeric, case when (i.profile#>'{home,owns_real_property}' = 'true'::jsonb) is true then case i.answers->>'10.2' when 'yes' then 1 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('10', 1::numeric, case i.answers->>'10.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('10', 1::numeric, case when (i.profile#>'{home,has_significant_personal_property}' = 'true'::jsonb) is true then case i.answers->>'10.5' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end end),
+      ('11', 1::numeric, case i.answers->>'11.1' when 'yes' then 1 when 'partial' then 0.5 when 'not_sure' then 0.25 end),
+      ('11', 1::numeric, case i.answers->>'11.2' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('11', 1::numeric, case i.answers->>'11.3' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end),
+      ('11', 1::numeric, case i.answers->>'11.4' when 'yes' then 1 when 'partial' then 0.5 when 'no' then 0 when 'not_sure' then 0.25 end)
+    ) as c(section_id, weight, fraction)
+  ),
+  scored as (
+    select
+      c.id,
+      c.section_id,
+      floor(sum(c.fraction * 100 * c.weight) / sum(c.weight) + 0.5)::integer as score
+    from cells c
+    where c.fraction is not null
+    group by c.id, c.section_id
+  )
+  select
+    i.id,
+    coalesce(
+      floor(
+        sum(s.score * w.weight)
+          / nullif(sum(w.weight) filter (where s.score is not null), 0)
+          + 0.5
+      )::integer,
+      0
+    ) as overall_score,
+    jsonb_object_agg(w.section_id, coalesce(s.score, 0)) as dimension_scores
+  from inputs i
+  cross join (values
+      ('1', 25::numeric),
+      ('2', 15::numeric),
+      ('3', 20::numeric),
+      ('4', 10::numeric),
+      ('5', 10::numeric),
+      ('6', 5::numeric),
+      ('7', 5::numeric),
+      ('8', 3::numeric),
+      ('9', 2::numeric),
+      ('10', 3::numeric),
+      ('11', 2::numeric)
+  ) as w(section_id, weight)
+  left join scored s on s.id = i.id and s.section_id = w.section_id
+  group by i.id
+$function$;
+
+grant execute on function readiness_v1.score_assessments(uuid[]) to authenticated, service_role;
@@ -0,0 +1,15 @@
+-- Per-section readiness schema shards (rows written by supabase/seed/generate_readiness_schema.py)
+create table if not exists readiness_v1.assessment_schema_shards (
+  assessment_id text not null,
+  version text not null,
+  shard_key text not null,
+  content_hash text not null,
+  shard_json jsonb not null,
+  created_at timestamptz not null default now(),
+  updated_at timestamptz not null default now(),
+  constraint assessment_schema_shards_pkey primary key (assessment_id, version, shard_key),
+  constraint assessment_schema_shards_schema_fkey foreign key (assessment_id, version)
+    references readiness_v1.assessment_schemas (assessment_id, version) on delete cascade
+);
+
+alter table readiness_v1.assessment_schema_shards enable row level security;
@@ -0,0 +1,8 @@
+-- Cheap staleness checks for cached readiness schemas: services compare
+-- schema_hash (a few bytes, no detoasting of schema_json) before refetching.
+-- built_at stays text because timestamptz casts are not immutable.
+alter table readiness_v1.assessment_schemas
+  add column if not exists schema_hash text
+    generated always as (schema_json->>'content_hash') stored,
+  add column if not exists built_at text
+    generated always as (schema_json->>'built_at') stored;
@@ -0,0 +1,3415 @@
+-- Update readiness schema -> 05aec9a39f3c087cc9b09fc0edbeab8e0961639ad71f8e1f5252bbe388974b3b
+insert into readiness_v1.assessment_schemas (assessment_id, version, schema_json)
+values ('readiness_v1', 'v1', $$
+{
+  "assessment_id": "readiness_v1",
+  "version": "v1",
+  "content_hash": "05aec9a39f3c087cc9b09fc0edbeab8e0961639ad71f8e1f5252bbe388974b3b",
+  "built_at": "2026-10-18T02:23:24Z",
+  "dimensions": [
+    {
+      "id": "Legal_Planning",
+      "label": "Legal Planning & Decision Makers"
+    },
+    {
+      "id": "Health_Care",
+      "label": "Health Care"
+    },
+    {
+      "id": "Financial_Insurance",
+      "label": "Financial & Insurance Planning"
+    },
+    {
+      "id": "Family_Relationships",
+      "label": "Family Relationships & Roles"
+    },
+    {
+      "id": "Home_Pet_Daily_Life",
+      "label": "Home, Pet & Daily Life"
+    },
+    {
+      "id": "Digital_Life",
+      "label": "Digital Life & Online Presence"
+    },
+    {
+      "id": "Funeral_Memorial",
+      "label": "Funeral, Memorial & Body Disposition"
+    },
+    {
+      "id": "Emotional_Spiritual",
+      "label": "Emotional & Spiritual"
+    },
+    {
+      "id": "Supporting_Aging_Parents",
+      "label": "Supporting Aging Parents"
+    },
+    {
+      "id": "Home_Personal_Property",
+      "label": "Home & Personal Property"
+    },
+    {
+      "id": "Document_Storage",
+      "label": "Document Storage"
+    }
+  ],
+  "sections": [
+    {
+      "id": "1",
+      "label": "Legal Planning & Decision Makers",
+      "dimension": "Legal_Planning",
+      "weight": 25
+    },
+    {
+      "id": "2",
+      "label": "Health Care",
+      "dimension": "Health_Care",
+      "weight": 15
+    },
+    {
+      "id": "3",
+      "label": "Financial & Insurance Planning",
+      "dimension": "Financial_Insurance",
+      "weight": 20
+    },
+    {
+      "id": "4",
+      "label": "Family Relationships & Roles",
+      "dimension": "Family_Relationships",
+      "weight": 10
+    },
+    {
+      "id": "5",
+      "label": "Home, Pet & Daily Life",
+      "dimension": "Home_Pet_Daily_Life",
+      "weight": 10
+    },
+    {
+      "id": "6",
+      "label": "Digital Life & Online Presence",
+      "dimension": "Digital_Life",
+      "weight": 5
+    },
+    {
+      "id": "7",
+      "label": "Funeral, Memorial & Body Disposition",
+      "dimension": "Funeral_Memorial",
+      "weight": 5
+    },
+    {
+      "id": "8",
+      "label": "Emotional & Spiritual",
+      "dimension": "Emotional_Spiritual",
+      "weight": 3
+    },
+    {
+      "id": "9",
+      "label": "Supporting Aging Parents",
+      "dimension": "Supporting_Aging_Parents",
+      "weight": 2
+    },
+    {
+      "id": "10",
+      "label": "Home & Personal Property",
+      "dimension": "Home_Personal_Property",
+      "weight": 3
+    },
+    {
+      "id": "11",
+      "label": "Document Storage",
+      "dimension": "Document_Storage",
+      "weight": 2
+    }
+  ],
+  "profile_questions": [
+    {
+      "id": "profile.financial.has_beneficiary_accounts",
+      "field": "financial.has_beneficiary_accounts",
+      "prompt": "Do any of your accounts allow you to name beneficiaries?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        }
+      ],
+      "value_map": {
+        "yes": true,
+        "no": false
+      }
+    },
+    {
+      "id": "profile.household.has_dependents",
+      "field": "household.has_dependents",
+      "prompt": "Do other people depend on you for care or financial support?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        }
+      ],
+      "value_map": {
+        "yes": true,
+        "no": false
+      }
+    },
+    {
+      "id": "profile.pets.has_pets",
+      "field": "pets.has_pets",
+      "prompt": "Do you have pets that depend on you?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        }
+      ],
+      "value_map": {
+        "yes": true,
+        "no": false
+      }
+    },
+    {
+      "id": "profile.digital.owns_crypto",
+      "field": "digital.owns_crypto",
+      "prompt": "Do you own any digital or cryptocurrency assets?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        }
+      ],
+      "value_map": {
+        "yes": true,
+        "no": false
+      }
+    },
+    {
+      "id": "profile.family.supports_aging_parent",
+      "field": "family.supports_aging_parent",
+      "prompt": "Are you currently helping support an aging parent?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        }
+      ],
+      "value_map": {
+        "yes": true,
+        "no": false
+      }
+    },
+    {
+      "id": "profile.home.owns_real_property",
+      "field": "home.owns_real_property",
+      "prompt": "Do you own your home or other real property?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        }
+      ],
+      "value_map": {
+        "yes": true,
+        "no": false
+      }
+    },
+    {
+      "id": "profile.home.has_significant_personal_property",
+      "field": "home.has_significant_personal_property",
+      "prompt": "Do you own items of significant personal value?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        }
+      ],
+      "value_map": {
+        "yes": true,
+        "no": false
+      }
+    },
+    {
+      "id": "profile.emotional.has_spiritual_practices",
+      "field": "emotional.has_spiritual_practices",
+      "prompt": "Do you have spiritual or cultural practices you would want included?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        }
+      ],
+      "value_map": {
+        "yes": true,
+        "no": false
+      }
+    }
+  ],
+  "profile_gates": [
+    {
+      "when": "profile.financial.has_beneficiary_accounts == false",
+      "questions": [
+        "3.4",
+        "3.5"
+      ],
+      "result": "na",
+      "flag": "not_applicable",
+      "when_ref": "c_71a9c855"
+    },
+    {
+      "when": "profile.pets.has_pets == false",
+      "questions": [
+        "5.4",
+        "5.5"
+      ],
+      "result": "na",
+      "flag": "not_applicable",
+      "when_ref": "c_44c97601"
+    },
+    {
+      "when": "profile.emotional.has_spiritual_practices == false",
+      "questions": [
+        "8.1",
+        "8.2"
+      ],
+      "result": "na",
+      "flag": "not_applicable",
+      "when_ref": "c_35d0006c"
+    },
+    {
+      "when": "profile.digital.owns_crypto == false",
+      "questions": [
+        "6.7"
+      ],
+      "result": "na",
+      "flag": "not_applicable",
+      "when_ref": "c_c46c3b05"
+    },
+    {
+      "when": "profile.family.supports_aging_parent == false",
+      "questions": [
+        "9.2",
+        "9.3",
+        "9.4"
+      ],
+      "result": "na",
+      "flag": "not_applicable",
+      "when_ref": "c_dd44c9df"
+    },
+    {
+      "when": "profile.home.owns_real_property == false",
+      "questions": [
+        "10.1",
+        "10.2"
+      ],
+      "result": "na",
+      "flag": "not_applicable",
+      "when_ref": "c_2812c509"
+    },
+    {
+      "when": "profile.home.has_significant_personal_property == false",
+      "questions": [
+        "10.5"
+      ],
+      "result": "na",
+      "flag": "not_applicable",
+      "when_ref": "c_7ea309c9"
+    }
+  ],
+  "soft_gates": [
+    {
+      "when": "answers['1.1.A.1'] in ['yes','partial']",
+      "questions": [
+        "1.1.A.2"
+      ],
+      "result": "ask",
+      "when_ref": "c_bd26a082"
+    },
+    {
+      "when": "answers['1.1.A.1'] in ['no','not_sure']",
+      "questions": [
+        "1.1.A.2"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_5d8307d4"
+    },
+    {
+      "when": "answers['1.1.A.3'] in ['yes','partial']",
+      "questions": [
+        "1.1.A.4"
+      ],
+      "result": "ask",
+      "when_ref": "c_c9957568"
+    },
+    {
+      "when": "answers['1.1.A.3'] in ['no','not_sure']",
+      "questions": [
+        "1.1.A.4"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_46ad8ea8"
+    },
+    {
+      "when": "answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']",
+      "questions": [
+        "1.1.A.7"
+      ],
+      "result": "ask",
+      "when_ref": "c_be8dc78e"
+    },
+    {
+      "when": "answers['1.1.B.1'] in ['no','not_sure'] and answers['1.1.B.3'] in ['no','not_sure'] and answers['1.1.B.5'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure'] and answers['1.1.B.8'] in ['no','not_sure','na']",
+      "questions": [
+        "1.1.A.7"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_a9c72514"
+    },
+    {
+      "when": "answers['1.1.B.1'] in ['yes','partial']",
+      "questions": [
+        "1.1.B.2"
+      ],
+      "result": "ask",
+      "when_ref": "c_373e5ca7"
+    },
+    {
+      "when": "answers['1.1.B.1'] in ['no','not_sure']",
+      "questions": [
+        "1.1.B.2"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_a150bc7e"
+    },
+    {
+      "when": "answers['1.1.B.3'] in ['yes','partial']",
+      "questions": [
+        "1.1.B.4"
+      ],
+      "result": "ask",
+      "when_ref": "c_f0cea0af"
+    },
+    {
+      "when": "answers['1.1.B.3'] in ['no','not_sure']",
+      "questions": [
+        "1.1.B.4"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_91b314f5"
+    },
+    {
+      "when": "answers['1.1.B.3'] in ['yes','partial']",
+      "questions": [
+        "1.1.B.4a"
+      ],
+      "result": "ask",
+      "when_ref": "c_f0cea0af"
+    },
+    {
+      "when": "answers['1.1.B.3'] in ['no','not_sure']",
+      "questions": [
+        "1.1.B.4a"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_91b314f5"
+    },
+    {
+      "when": "answers['1.1.B.5'] in ['yes','partial']",
+      "questions": [
+        "1.1.B.6"
+      ],
+      "result": "ask",
+      "when_ref": "c_cc9afa90"
+    },
+    {
+      "when": "answers['1.1.B.5'] in ['no','not_sure']",
+      "questions": [
+        "1.1.B.6"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_83c98497"
+    },
+    {
+      "when": "answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']",
+      "questions": [
+        "1.1.B.10"
+      ],
+      "result": "ask",
+      "when_ref": "c_be8dc78e"
+    },
+    {
+      "when": "answers['1.1.B.1'] in ['no','not_sure'] and answers['1.1.B.3'] in ['no','not_sure'] and answers['1.1.B.5'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure'] and answers['1.1.B.8'] in ['no','not_sure','na']",
+      "questions": [
+        "1.1.B.10"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_a9c72514"
+    },
+    {
+      "when": "answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']",
+      "questions": [
+        "1.1.B.11"
+      ],
+      "result": "ask",
+      "when_ref": "c_be8dc78e"
+    },
+    {
+      "when": "answers['1.1.B.1'] in ['no','not_sure'] and answers['1.1.B.3'] in ['no','not_sure'] and answers['1.1.B.5'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure'] and answers['1.1.B.8'] in ['no','not_sure','na']",
+      "questions": [
+        "1.1.B.11"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_a9c72514"
+    },
+    {
+      "when": "answers['2.1'] in ['yes','partial']",
+      "questions": [
+        "2.2"
+      ],
+      "result": "ask",
+      "when_ref": "c_21f0f63c"
+    },
+    {
+      "when": "answers['2.1'] in ['no','not_sure']",
+      "questions": [
+        "2.2"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_e4d28c2f"
+    },
+    {
+      "when": "answers['2.1'] in ['yes','partial'] or answers['2.3'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial']",
+      "questions": [
+        "2.4"
+      ],
+      "result": "ask",
+      "when_ref": "c_4c3f9770"
+    },
+    {
+      "when": "answers['2.1'] in ['no','not_sure'] and answers['2.3'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure']",
+      "questions": [
+        "2.4"
+      ],
+      "result": "na",
+      "flag": "follow_up",
+      "when_ref": "c_4b382279"
+    }
+  ],
+  "answer_scoring": {
+    "yes": 1.0,
+    "partial": 0.5,
+    "no": 0.0,
+    "not_sure": 0.25,
+    "na": null
+  },
+  "flags": {
+    "review_on": [
+      "not_sure"
+    ],
+    "follow_up_on": [
+      "na"
+    ],
+    "risk_on": []
+  },
+  "score_bands": [
+    {
+      "min": 80,
+      "max": 100,
+      "label": "Highly Prepared"
+    },
+    {
+      "min": 60,
+      "max": 79,
+      "label": "Moderately Prepared"
+    },
+    {
+      "min": 40,
+      "max": 59,
+      "label": "Limited Preparedness"
+    },
+    {
+      "min": 0,
+      "max": 39,
+      "label": "Low Readiness / High Risk"
+    }
+  ],
+  "questions": [
+    {
+      "id": "1.1.A.1",
+      "item_id": "legal.will.evaluation",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Have you ever evaluated whether you need a will?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, evaluation completed"
+        },
+        {
+          "value": "partial",
+          "label": "Evaluation started but not completed"
+        },
+        {
+          "value": "no",
+          "label": "No, never evaluated"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.A.2",
+      "item_id": "legal.will.evaluation_determination",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "If evaluated, was a determination made about whether a will is appropriate for you?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, determination made and documented"
+        },
+        {
+          "value": "partial",
+          "label": "Determination made but not documented"
+        },
+        {
+          "value": "no",
+          "label": "No determination made"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "answers['1.1.A.1'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_bd26a082"
+    },
+    {
+      "id": "1.1.A.3",
+      "item_id": "legal.trust.evaluation",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Have you ever evaluated whether a trust may be appropriate for your situation?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, evaluation completed"
+        },
+        {
+          "value": "partial",
+          "label": "Evaluation started but not completed"
+        },
+        {
+          "value": "no",
+          "label": "No, never evaluated"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.A.4",
+      "item_id": "legal.trust.evaluation_determination",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "If evaluated, was a determination made about whether a trust is appropriate?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, determination made and documented"
+        },
+        {
+          "value": "partial",
+          "label": "Determination made but not documented"
+        },
+        {
+          "value": "no",
+          "label": "No determination made"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "answers['1.1.A.3'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_c9957568"
+    },
+    {
+      "id": "1.1.A.5",
+      "item_id": "legal.evaluation.professional_input",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Was any part of your legal planning evaluation done with professional input?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.A.6",
+      "item_id": "legal.plan.review_triggers",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Have you identified events that would trigger a review of your legal plan?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, documented"
+        },
+        {
+          "value": "partial",
+          "label": "Identified but not documented"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.A.7",
+      "item_id": "legal.documents.align_with_evaluation",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Do you believe your current legal documents reflect your most recent legal planning evaluation?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_be8dc78e"
+    },
+    {
+      "id": "1.1.B.1",
+      "item_id": "legal.will.exists",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Do you currently have a legally valid will?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, completed and signed"
+        },
+        {
+          "value": "partial",
+          "label": "Drafted but not signed"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.B.2",
+      "item_id": "legal.will.access",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Is the original or a court-acceptable copy of your will easy to locate if needed?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Location exists but unclear"
+        },
+        {
+          "value": "partial",
+          "label": "Draft only"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "answers['1.1.B.1'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_373e5ca7"
+    },
+    {
+      "id": "1.1.B.3",
+      "item_id": "legal.trust.exists",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Do you have a revocable living trust?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, completed and signed"
+        },
+        {
+          "value": "partial",
+          "label": "Drafted but not signed"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.B.4",
+      "item_id": "legal.trust.access",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "If you have a trust, can the signed trust document be easily located if needed?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Location exists but unclear"
+        },
+        {
+          "value": "partial",
+          "label": "Only a draft exists"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "answers['1.1.B.3'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_f0cea0af"
+    },
+    {
+      "id": "1.1.B.4a",
+      "item_id": "legal.trust.funding",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Have assets been moved into your trust (often called 'funding' the trust)?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, most or all"
+        },
+        {
+          "value": "partial",
+          "label": "Some assets"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "answers['1.1.B.3'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_f0cea0af"
+    },
+    {
+      "id": "1.1.B.5",
+      "item_id": "legal.fpoa.exists",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Do you have a financial power of attorney?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, completed and signed"
+        },
+        {
+          "value": "partial",
+          "label": "Drafted but not signed"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.B.6",
+      "item_id": "legal.fpoa.acceptance",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "If someone needed to use your financial power of attorney, would your banks accept it?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, all major institutions"
+        },
+        {
+          "value": "partial",
+          "label": "Some institutions"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "answers['1.1.B.5'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_cc9afa90"
+    },
+    {
+      "id": "1.1.B.7",
+      "item_id": "legal.hpoa.exists",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Do you have a healthcare power of attorney or healthcare proxy?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, completed and signed"
+        },
+        {
+          "value": "partial",
+          "label": "Drafted but not signed"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.B.8",
+      "item_id": "legal.body_disposition.document",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Do you have a written document that explains what should happen to your body after death (where required by law)?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, completed and signed"
+        },
+        {
+          "value": "partial",
+          "label": "Written but not finalized"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.B.9",
+      "item_id": "legal.practical_guide.exists",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Do you have a written guide (separate from legal documents) that explains practical information like where things are or what to do first?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, completed and accessible"
+        },
+        {
+          "value": "partial",
+          "label": "Exists but incomplete"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "1.1.B.10",
+      "item_id": "legal.documents.current",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Are all completed legal documents current and up to date?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, all"
+        },
+        {
+          "value": "partial",
+          "label": "Some outdated"
+        },
+        {
+          "value": "no",
+          "label": "Most outdated"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_be8dc78e"
+    },
+    {
+      "id": "1.1.B.11",
+      "item_id": "legal.documents.shared",
+      "section_id": "1",
+      "dimension": "Legal_Planning",
+      "weight": 1,
+      "prompt": "Have copies of completed legal documents been shared with the people who may need them?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, all"
+        },
+        {
+          "value": "partial",
+          "label": "Some"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_be8dc78e"
+    },
+    {
+      "id": "2.1",
+      "item_id": "healthcare.advance_directive.exists",
+      "section_id": "2",
+      "dimension": "Health_Care",
+      "weight": 1,
+      "prompt": "Do you have an advance directive or living will?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, completed and signed"
+        },
+        {
+          "value": "partial",
+          "label": "Drafted but not signed"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "2.2",
+      "item_id": "healthcare.advance_directive.instructions",
+      "section_id": "2",
+      "dimension": "Health_Care",
+      "weight": 1,
+      "prompt": "Does your advance directive include any written medical instructions (you do not need to know or share what they are)?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "answers['2.1'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_21f0f63c"
+    },
+    {
+      "id": "2.3",
+      "item_id": "healthcare.hipaa_release.exists",
+      "section_id": "2",
+      "dimension": "Health_Care",
+      "weight": 1,
+      "prompt": "Do you have a HIPAA authorization or medical information release?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, completed and signed"
+        },
+        {
+          "value": "partial",
+          "label": "Drafted but not signed"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "2.4",
+      "item_id": "healthcare.documents.on_file",
+      "section_id": "2",
+      "dimension": "Health_Care",
+      "weight": 1,
+      "prompt": "Are your healthcare documents on file with your doctors or in a patient portal?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "answers['2.1'] in ['yes','partial'] or answers['2.3'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial']",
+      "system_na": true,
+      "applies_if_ref": "c_4c3f9770"
+    },
+    {
+      "id": "2.5",
+      "item_id": "healthcare.medical_info.list_access",
+      "section_id": "2",
+      "dimension": "Health_Care",
+      "weight": 1,
+      "prompt": "Is there a list of your medications, allergies, and doctors that someone could easily access?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, complete"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "2.6",
+      "item_id": "healthcare.access_plan.home_phone",
+      "section_id": "2",
+      "dimension": "Health_Care",
+      "weight": 1,
+      "prompt": "Is there a plan for how someone could access your home or phone if you were incapacitated?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Informal only"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "2.7",
+      "item_id": "healthcare.organ_donor.registered",
+      "section_id": "2",
+      "dimension": "Health_Care",
+      "weight": 1,
+      "prompt": "Are you registered as an organ donor or otherwise documented?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "2.8",
+      "item_id": "healthcare.body_donation.enrollment",
+      "section_id": "2",
+      "dimension": "Health_Care",
+      "weight": 1,
+      "prompt": "If applicable, have you completed any body donation enrollment paperwork?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "3.1",
+      "item_id": "financial.assets_debts.list",
+      "section_id": "3",
+      "dimension": "Financial_Insurance",
+      "weight": 1,
+      "prompt": "Is there a list of your assets and debts that someone could access if needed?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, complete"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "3.2",
+      "item_id": "financial.accounts.manageability",
+      "section_id": "3",
+      "dimension": "Financial_Insurance",
+      "weight": 1,
+      "prompt": "Could someone step in and manage key accounts and obligations within about 30 days?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "3.4",
+      "item_id": "financial.beneficiaries.set",
+      "section_id": "3",
+      "dimension": "Financial_Insurance",
+      "weight": 1,
+      "prompt": "Are beneficiaries set up on all applicable accounts?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "All complete"
+        },
+        {
+          "value": "partial",
+          "label": "Some missing"
+        },
+        {
+          "value": "no",
+          "label": "Most missing"
+        },
+        {
+          "value": "no",
+          "label": "None"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "profile.financial.has_beneficiary_accounts == true",
+      "system_na": true,
+      "applies_if_ref": "c_5e6adc87"
+    },
+    {
+      "id": "3.5",
+      "item_id": "financial.beneficiaries.reviewed",
+      "section_id": "3",
+      "dimension": "Financial_Insurance",
+      "weight": 1,
+      "prompt": "Have beneficiary designations been reviewed in the last 5 years?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "profile.financial.has_beneficiary_accounts == true",
+      "system_na": true,
+      "applies_if_ref": "c_5e6adc87"
+    },
+    {
+      "id": "3.6",
+      "item_id": "financial.insurance.coverage",
+      "section_id": "3",
+      "dimension": "Financial_Insurance",
+      "weight": 1,
+      "prompt": "Do you currently have any life, long-term care, disability, or health insurance?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "3.7",
+      "item_id": "financial.final_expenses.plan",
+      "section_id": "3",
+      "dimension": "Financial_Insurance",
+      "weight": 1,
+      "prompt": "Is there a plan in place to cover final expenses?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, funded or prepaid"
+        },
+        {
+          "value": "partial",
+          "label": "Planned but not funded"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "3.8",
+      "item_id": "financial.recurring_bills.list",
+      "section_id": "3",
+      "dimension": "Financial_Insurance",
+      "weight": 1,
+      "prompt": "Is there a list of recurring bills, debts, or obligations someone could follow?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "3.9",
+      "item_id": "financial.manageability.self_assessed",
+      "section_id": "3",
+      "dimension": "Financial_Insurance",
+      "weight": 1,
+      "prompt": "Do you feel your finances could be difficult for others to manage if something happened?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes",
+          "score_value": "no"
+        },
+        {
+          "value": "no",
+          "label": "No",
+          "score_value": "yes"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "4.2",
+      "item_id": "family.emergency_contacts.list",
+      "section_id": "4",
+      "dimension": "Family_Relationships",
+      "weight": 1,
+      "prompt": "Is there a written list of who should be contacted in an emergency?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "4.3",
+      "item_id": "family.documents.shared",
+      "section_id": "4",
+      "dimension": "Family_Relationships",
+      "weight": 1,
+      "prompt": "Have you shared where important documents are and who can make decisions?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partially"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "4.4",
+      "item_id": "family.exclusions.guidance",
+      "section_id": "4",
+      "dimension": "Family_Relationships",
+      "weight": 1,
+      "prompt": "Is there written guidance about anyone who should not be involved in decisions?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Verbal only"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "5.1",
+      "item_id": "home.daily_responsibilities.plan",
+      "section_id": "5",
+      "dimension": "Home_Pet_Daily_Life",
+      "weight": 1,
+      "prompt": "Is there a plan for how your home and daily responsibilities would be handled?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Informal"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "5.2",
+      "item_id": "home.utilities.access_info",
+      "section_id": "5",
+      "dimension": "Home_Pet_Daily_Life",
+      "weight": 1,
+      "prompt": "Are utilities, access instructions, and service contacts written down somewhere?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "5.4",
+      "item_id": "home.pets.care_plan",
+      "section_id": "5",
+      "dimension": "Home_Pet_Daily_Life",
+      "weight": 1,
+      "prompt": "If yes, is there a written plan for their care?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.pets.has_pets == true",
+      "system_na": true,
+      "applies_if_ref": "c_13f13693"
+    },
+    {
+      "id": "5.5",
+      "item_id": "home.pets.records_access",
+      "section_id": "5",
+      "dimension": "Home_Pet_Daily_Life",
+      "weight": 1,
+      "prompt": "Are pet records and care instructions easy to find?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.pets.has_pets == true",
+      "system_na": true,
+      "applies_if_ref": "c_13f13693"
+    },
+    {
+      "id": "6.1",
+      "item_id": "digital.account_access.method",
+      "section_id": "6",
+      "dimension": "Digital_Life",
+      "weight": 1,
+      "prompt": "Is there a way someone could access your online accounts if needed (for example, a password manager)?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, complete"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "6.2",
+      "item_id": "digital.device_access.guidance",
+      "section_id": "6",
+      "dimension": "Digital_Life",
+      "weight": 1,
+      "prompt": "Is there guidance for accessing your phone or computer in an emergency?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "6.3",
+      "item_id": "digital.accounts.list",
+      "section_id": "6",
+      "dimension": "Digital_Life",
+      "weight": 1,
+      "prompt": "Is there a list of your important online accounts?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "6.4",
+      "item_id": "digital.account_inactivity_settings",
+      "section_id": "6",
+      "dimension": "Digital_Life",
+      "weight": 1,
+      "prompt": "On platforms like Apple, Google, or social media, have you set up settings for what happens to your account if you cannot use it?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, on all platforms"
+        },
+        {
+          "value": "partial",
+          "label": "Yes, on some"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "6.5",
+      "item_id": "digital.files.backup_access",
+      "section_id": "6",
+      "dimension": "Digital_Life",
+      "weight": 1,
+      "prompt": "Are important digital files backed up and accessible?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "6.7",
+      "item_id": "digital.assets.crypto.access_plan",
+      "section_id": "6",
+      "dimension": "Digital_Life",
+      "weight": 1,
+      "prompt": "If yes, is there a way someone could access or recover them if needed?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.digital.owns_crypto == true",
+      "system_na": true,
+      "applies_if_ref": "c_d75da198"
+    },
+    {
+      "id": "6.8",
+      "item_id": "digital.assets.mentioned_in_estate_docs",
+      "section_id": "6",
+      "dimension": "Digital_Life",
+      "weight": 1,
+      "prompt": "Do your estate documents mention digital assets?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "7.1",
+      "item_id": "final.guidance.after_death",
+      "section_id": "7",
+      "dimension": "Funeral_Memorial",
+      "weight": 1,
+      "prompt": "Is there written guidance about what should happen after death?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes, accessible"
+        },
+        {
+          "value": "partial",
+          "label": "Exists but hard to find"
+        },
+        {
+          "value": "partial",
+          "label": "Verbal only"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "7.2",
+      "item_id": "final.arrangements.prepaid",
+      "section_id": "7",
+      "dimension": "Funeral_Memorial",
+      "weight": 1,
+      "prompt": "Have any funeral or cremation arrangements been prepaid or set up?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "7.3",
+      "item_id": "final.arrangements.guidance",
+      "section_id": "7",
+      "dimension": "Funeral_Memorial",
+      "weight": 1,
+      "prompt": "Is there written guidance to help others handle arrangements?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "7.4",
+      "item_id": "final.charitable_gifts.documented",
+      "section_id": "7",
+      "dimension": "Funeral_Memorial",
+      "weight": 1,
+      "prompt": "Are any charitable gifts at death written down somewhere?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "8.1",
+      "item_id": "emotional.spiritual_practices.documented",
+      "section_id": "8",
+      "dimension": "Emotional_Spiritual",
+      "weight": 1,
+      "prompt": "Are any spiritual or cultural practices written down?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Verbal only"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "profile.emotional.has_spiritual_practices == true",
+      "system_na": true,
+      "applies_if_ref": "c_dc3a5e24"
+    },
+    {
+      "id": "8.2",
+      "item_id": "emotional.spiritual_contacts.list",
+      "section_id": "8",
+      "dimension": "Emotional_Spiritual",
+      "weight": 1,
+      "prompt": "Is there a written note about who to contact for spiritual support, if applicable?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "profile.emotional.has_spiritual_practices == true",
+      "system_na": true,
+      "applies_if_ref": "c_dc3a5e24"
+    },
+    {
+      "id": "8.3",
+      "item_id": "emotional.messages.prepared",
+      "section_id": "8",
+      "dimension": "Emotional_Spiritual",
+      "weight": 1,
+      "prompt": "Have you prepared any messages or notes you would want others to receive?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "In progress"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "9.2",
+      "item_id": "parents.legal_permission",
+      "section_id": "9",
+      "dimension": "Supporting_Aging_Parents",
+      "weight": 1,
+      "prompt": "If yes, do you have legal permission to help make decisions if needed?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.family.supports_aging_parent == true",
+      "system_na": true,
+      "applies_if_ref": "c_c1066466"
+    },
+    {
+      "id": "9.3",
+      "item_id": "parents.key_info.list",
+      "section_id": "9",
+      "dimension": "Supporting_Aging_Parents",
+      "weight": 1,
+      "prompt": "Is there a list of your parent's key information you could access?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.family.supports_aging_parent == true",
+      "system_na": true,
+      "applies_if_ref": "c_c1066466"
+    },
+    {
+      "id": "9.4",
+      "item_id": "parents.documents.access_speed",
+      "section_id": "9",
+      "dimension": "Supporting_Aging_Parents",
+      "weight": 1,
+      "prompt": "If needed, how quickly could you find their important documents?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Within 24 hours"
+        },
+        {
+          "value": "partial",
+          "label": "Within a week"
+        },
+        {
+          "value": "no",
+          "label": "Longer"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.family.supports_aging_parent == true",
+      "system_na": true,
+      "applies_if_ref": "c_c1066466"
+    },
+    {
+      "id": "10.1",
+      "item_id": "home.title.documents_access",
+      "section_id": "10",
+      "dimension": "Home_Personal_Property",
+      "weight": 1,
+      "prompt": "Are ownership or title documents easy to find?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.home.owns_real_property == true",
+      "system_na": true,
+      "applies_if_ref": "c_b78af515"
+    },
+    {
+      "id": "10.2",
+      "item_id": "home.maintenance.issues_documented",
+      "section_id": "10",
+      "dimension": "Home_Personal_Property",
+      "weight": 1,
+      "prompt": "Are any major home maintenance issues written down?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.home.owns_real_property == true",
+      "system_na": true,
+      "applies_if_ref": "c_b78af515"
+    },
+    {
+      "id": "10.3",
+      "item_id": "home.belongings.reduced",
+      "section_id": "10",
+      "dimension": "Home_Personal_Property",
+      "weight": 1,
+      "prompt": "Have you reduced belongings to make things easier for others?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "10.5",
+      "item_id": "home.personal_property.plan",
+      "section_id": "10",
+      "dimension": "Home_Personal_Property",
+      "weight": 1,
+      "prompt": "If yes, is there a written list or plan for those items?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        },
+        {
+          "value": "na",
+          "label": "Not applicable"
+        }
+      ],
+      "applies_if": "profile.home.has_significant_personal_property == true",
+      "system_na": true,
+      "applies_if_ref": "c_d99f7134"
+    },
+    {
+      "id": "11.1",
+      "item_id": "documents.storage.single_location",
+      "section_id": "11",
+      "dimension": "Document_Storage",
+      "weight": 1,
+      "prompt": "Are most important documents kept in one main place?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Multiple locations"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "11.2",
+      "item_id": "documents.storage.access_shared",
+      "section_id": "11",
+      "dimension": "Document_Storage",
+      "weight": 1,
+      "prompt": "Do trusted people know how to access those documents?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "11.3",
+      "item_id": "documents.storage.start_guide",
+      "section_id": "11",
+      "dimension": "Document_Storage",
+      "weight": 1,
+      "prompt": "Is there a single 'start here' guide explaining what exists and where it is?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Partial"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    },
+    {
+      "id": "11.4",
+      "item_id": "documents.storage.originals_access",
+      "section_id": "11",
+      "dimension": "Document_Storage",
+      "weight": 1,
+      "prompt": "Are original documents accessible if needed?",
+      "type": "single_select",
+      "options": [
+        {
+          "value": "yes",
+          "label": "Yes"
+        },
+        {
+          "value": "partial",
+          "label": "Access may be difficult"
+        },
+        {
+          "value": "no",
+          "label": "No"
+        },
+        {
+          "value": "not_sure",
+          "label": "Not sure"
+        }
+      ],
+      "applies_if": "always"
+    }
+  ],
+  "conditions": {
+    "c_bd26a082": {
+      "expression": "answers['1.1.A.1'] in ['yes','partial']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.A.1",
+        "values": [
+          "yes",
+          "partial"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.A.1",
+          [
+            "yes",
+            "partial"
+          ]
+        ]
+      ]
+    },
+    "c_c9957568": {
+      "expression": "answers['1.1.A.3'] in ['yes','partial']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.A.3",
+        "values": [
+          "yes",
+          "partial"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.A.3",
+          [
+            "yes",
+            "partial"
+          ]
+        ]
+      ]
+    },
+    "c_be8dc78e": {
+      "expression": "answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']",
+      "ast": {
+        "op": "or",
+        "args": [
+          {
+            "op": "in",
+            "answer": "1.1.B.1",
+            "values": [
+              "yes",
+              "partial"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.3",
+            "values": [
+              "yes",
+              "partial"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.5",
+            "values": [
+              "yes",
+              "partial"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.7",
+            "values": [
+              "yes",
+              "partial"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.8",
+            "values": [
+              "yes",
+              "partial"
+            ]
+          }
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.B.1",
+          [
+            "yes",
+            "partial"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.3",
+          [
+            "yes",
+            "partial"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.5",
+          [
+            "yes",
+            "partial"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.7",
+          [
+            "yes",
+            "partial"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.8",
+          [
+            "yes",
+            "partial"
+          ]
+        ],
+        [
+          "or",
+          5
+        ]
+      ]
+    },
+    "c_373e5ca7": {
+      "expression": "answers['1.1.B.1'] in ['yes','partial']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.B.1",
+        "values": [
+          "yes",
+          "partial"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.B.1",
+          [
+            "yes",
+            "partial"
+          ]
+        ]
+      ]
+    },
+    "c_f0cea0af": {
+      "expression": "answers['1.1.B.3'] in ['yes','partial']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.B.3",
+        "values": [
+          "yes",
+          "partial"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.B.3",
+          [
+            "yes",
+            "partial"
+          ]
+        ]
+      ]
+    },
+    "c_cc9afa90": {
+      "expression": "answers['1.1.B.5'] in ['yes','partial']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.B.5",
+        "values": [
+          "yes",
+          "partial"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.B.5",
+          [
+            "yes",
+            "partial"
+          ]
+        ]
+      ]
+    },
+    "c_21f0f63c": {
+      "expression": "answers['2.1'] in ['yes','partial']",
+      "ast": {
+        "op": "in",
+        "answer": "2.1",
+        "values": [
+          "yes",
+          "partial"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "2.1",
+          [
+            "yes",
+            "partial"
+          ]
+        ]
+      ]
+    },
+    "c_4c3f9770": {
+      "expression": "answers['2.1'] in ['yes','partial'] or answers['2.3'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial']",
+      "ast": {
+        "op": "or",
+        "args": [
+          {
+            "op": "in",
+            "answer": "2.1",
+            "values": [
+              "yes",
+              "partial"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "2.3",
+            "values": [
+              "yes",
+              "partial"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.7",
+            "values": [
+              "yes",
+              "partial"
+            ]
+          }
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "2.1",
+          [
+            "yes",
+            "partial"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "2.3",
+          [
+            "yes",
+            "partial"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.7",
+          [
+            "yes",
+            "partial"
+          ]
+        ],
+        [
+          "or",
+          3
+        ]
+      ]
+    },
+    "c_5e6adc87": {
+      "expression": "profile.financial.has_beneficiary_accounts == true",
+      "ast": {
+        "op": "eq",
+        "profile": "financial.has_beneficiary_accounts",
+        "value": true
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "financial.has_beneficiary_accounts",
+          true
+        ]
+      ]
+    },
+    "c_13f13693": {
+      "expression": "profile.pets.has_pets == true",
+      "ast": {
+        "op": "eq",
+        "profile": "pets.has_pets",
+        "value": true
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "pets.has_pets",
+          true
+        ]
+      ]
+    },
+    "c_d75da198": {
+      "expression": "profile.digital.owns_crypto == true",
+      "ast": {
+        "op": "eq",
+        "profile": "digital.owns_crypto",
+        "value": true
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "digital.owns_crypto",
+          true
+        ]
+      ]
+    },
+    "c_dc3a5e24": {
+      "expression": "profile.emotional.has_spiritual_practices == true",
+      "ast": {
+        "op": "eq",
+        "profile": "emotional.has_spiritual_practices",
+        "value": true
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "emotional.has_spiritual_practices",
+          true
+        ]
+      ]
+    },
+    "c_c1066466": {
+      "expression": "profile.family.supports_aging_parent == true",
+      "ast": {
+        "op": "eq",
+        "profile": "family.supports_aging_parent",
+        "value": true
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "family.supports_aging_parent",
+          true
+        ]
+      ]
+    },
+    "c_b78af515": {
+      "expression": "profile.home.owns_real_property == true",
+      "ast": {
+        "op": "eq",
+        "profile": "home.owns_real_property",
+        "value": true
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "home.owns_real_property",
+          true
+        ]
+      ]
+    },
+    "c_d99f7134": {
+      "expression": "profile.home.has_significant_personal_property == true",
+      "ast": {
+        "op": "eq",
+        "profile": "home.has_significant_personal_property",
+        "value": true
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "home.has_significant_personal_property",
+          true
+        ]
+      ]
+    },
+    "c_71a9c855": {
+      "expression": "profile.financial.has_beneficiary_accounts == false",
+      "ast": {
+        "op": "eq",
+        "profile": "financial.has_beneficiary_accounts",
+        "value": false
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "financial.has_beneficiary_accounts",
+          false
+        ]
+      ]
+    },
+    "c_44c97601": {
+      "expression": "profile.pets.has_pets == false",
+      "ast": {
+        "op": "eq",
+        "profile": "pets.has_pets",
+        "value": false
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "pets.has_pets",
+          false
+        ]
+      ]
+    },
+    "c_35d0006c": {
+      "expression": "profile.emotional.has_spiritual_practices == false",
+      "ast": {
+        "op": "eq",
+        "profile": "emotional.has_spiritual_practices",
+        "value": false
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "emotional.has_spiritual_practices",
+          false
+        ]
+      ]
+    },
+    "c_c46c3b05": {
+      "expression": "profile.digital.owns_crypto == false",
+      "ast": {
+        "op": "eq",
+        "profile": "digital.owns_crypto",
+        "value": false
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "digital.owns_crypto",
+          false
+        ]
+      ]
+    },
+    "c_dd44c9df": {
+      "expression": "profile.family.supports_aging_parent == false",
+      "ast": {
+        "op": "eq",
+        "profile": "family.supports_aging_parent",
+        "value": false
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "family.supports_aging_parent",
+          false
+        ]
+      ]
+    },
+    "c_2812c509": {
+      "expression": "profile.home.owns_real_property == false",
+      "ast": {
+        "op": "eq",
+        "profile": "home.owns_real_property",
+        "value": false
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "home.owns_real_property",
+          false
+        ]
+      ]
+    },
+    "c_7ea309c9": {
+      "expression": "profile.home.has_significant_personal_property == false",
+      "ast": {
+        "op": "eq",
+        "profile": "home.has_significant_personal_property",
+        "value": false
+      },
+      "ops": [
+        [
+          "eq",
+          "profile",
+          "home.has_significant_personal_property",
+          false
+        ]
+      ]
+    },
+    "c_5d8307d4": {
+      "expression": "answers['1.1.A.1'] in ['no','not_sure']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.A.1",
+        "values": [
+          "no",
+          "not_sure"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.A.1",
+          [
+            "no",
+            "not_sure"
+          ]
+        ]
+      ]
+    },
+    "c_46ad8ea8": {
+      "expression": "answers['1.1.A.3'] in ['no','not_sure']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.A.3",
+        "values": [
+          "no",
+          "not_sure"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.A.3",
+          [
+            "no",
+            "not_sure"
+          ]
+        ]
+      ]
+    },
+    "c_a9c72514": {
+      "expression": "answers['1.1.B.1'] in ['no','not_sure'] and answers['1.1.B.3'] in ['no','not_sure'] and answers['1.1.B.5'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure'] and answers['1.1.B.8'] in ['no','not_sure','na']",
+      "ast": {
+        "op": "and",
+        "args": [
+          {
+            "op": "in",
+            "answer": "1.1.B.1",
+            "values": [
+              "no",
+              "not_sure"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.3",
+            "values": [
+              "no",
+              "not_sure"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.5",
+            "values": [
+              "no",
+              "not_sure"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.7",
+            "values": [
+              "no",
+              "not_sure"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.8",
+            "values": [
+              "no",
+              "not_sure",
+              "na"
+            ]
+          }
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.B.1",
+          [
+            "no",
+            "not_sure"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.3",
+          [
+            "no",
+            "not_sure"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.5",
+          [
+            "no",
+            "not_sure"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.7",
+          [
+            "no",
+            "not_sure"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.8",
+          [
+            "no",
+            "not_sure",
+            "na"
+          ]
+        ],
+        [
+          "and",
+          5
+        ]
+      ]
+    },
+    "c_a150bc7e": {
+      "expression": "answers['1.1.B.1'] in ['no','not_sure']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.B.1",
+        "values": [
+          "no",
+          "not_sure"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.B.1",
+          [
+            "no",
+            "not_sure"
+          ]
+        ]
+      ]
+    },
+    "c_91b314f5": {
+      "expression": "answers['1.1.B.3'] in ['no','not_sure']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.B.3",
+        "values": [
+          "no",
+          "not_sure"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.B.3",
+          [
+            "no",
+            "not_sure"
+          ]
+        ]
+      ]
+    },
+    "c_83c98497": {
+      "expression": "answers['1.1.B.5'] in ['no','not_sure']",
+      "ast": {
+        "op": "in",
+        "answer": "1.1.B.5",
+        "values": [
+          "no",
+          "not_sure"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "1.1.B.5",
+          [
+            "no",
+            "not_sure"
+          ]
+        ]
+      ]
+    },
+    "c_e4d28c2f": {
+      "expression": "answers['2.1'] in ['no','not_sure']",
+      "ast": {
+        "op": "in",
+        "answer": "2.1",
+        "values": [
+          "no",
+          "not_sure"
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "2.1",
+          [
+            "no",
+            "not_sure"
+          ]
+        ]
+      ]
+    },
+    "c_4b382279": {
+      "expression": "answers['2.1'] in ['no','not_sure'] and answers['2.3'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure']",
+      "ast": {
+        "op": "and",
+        "args": [
+          {
+            "op": "in",
+            "answer": "2.1",
+            "values": [
+              "no",
+              "not_sure"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "2.3",
+            "values": [
+              "no",
+              "not_sure"
+            ]
+          },
+          {
+            "op": "in",
+            "answer": "1.1.B.7",
+            "values": [
+              "no",
+              "not_sure"
+            ]
+          }
+        ]
+      },
+      "ops": [
+        [
+          "in",
+          "answer",
+          "2.1",
+          [
+            "no",
+            "not_sure"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "2.3",
+          [
+            "no",
+            "not_sure"
+          ]
+        ],
+        [
+          "in",
+          "answer",
+          "1.1.B.7",
+          [
+            "no",
+            "not_sure"
+          ]
+        ],
+        [
+          "and",
+          3
+        ]
+      ]
+    }
+  },
+  "table_shard": {
+    "key": "tables",
+    "content_hash": "02d0ab6e61d732b927b09400d4071c1b2f2bc242580ee5b1ae7321fd3144f399",
+    "tables": [
+      "dependencies",
+      "profile_applicability",
+      "routing",
+      "score_tables",
+      "encoding"
+    ]
+  }
+}
+$$::jsonb)
+on conflict (assessment_id, version)
+ do update set schema_json = excluded.schema_json;
+
+-- Readiness schema shards cba62106e180 (13 rows)
+insert into readiness_v1.assessment_schema_shards (assessment_id, version, shard_key, content_hash, shard_json)
+values
+  ('readiness_v1', 'v1', 'index', 'cba62106e180a4271f847ee00a205993441acfe835cd0409a1c5bb76ed578293', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"cba62106e180a4271f847ee00a205993441acfe835cd0409a1c5bb76ed578293","schema_content_hash":"05aec9a39f3c087cc9b09fc0edbeab8e0961639ad71f8e1f5252bbe388974b3b","dimensions":[{"id":"Legal_Planning","label":"Legal Planning & Decision Makers"},{"id":"Health_Care","label":"Health Care"},{"id":"Financial_Insurance","label":"Financial & Insurance Planning"},{"id":"Family_Relationships","label":"Family Relationships & Roles"},{"id":"Home_Pet_Daily_Life","label":"Home, Pet & Daily Life"},{"id":"Digital_Life","label":"Digital Life & Online Presence"},{"id":"Funeral_Memorial","label":"Funeral, Memorial & Body Disposition"},{"id":"Emotional_Spiritual","label":"Emotional & Spiritual"},{"id":"Supporting_Aging_Parents","label":"Supporting Aging Parents"},{"id":"Home_Personal_Property","label":"Home & Personal Property"},{"id":"Document_Storage","label":"Document Storage"}],"sections":[{"id":"1","label":"Legal Planning & Decision Makers","dimension":"Legal_Planning","weight":25},{"id":"2","label":"Health Care","dimension":"Health_Care","weight":15},{"id":"3","label":"Financial & Insurance Planning","dimension":"Financial_Insurance","weight":20},{"id":"4","label":"Family Relationships & Roles","dimension":"Family_Relationships","weight":10},{"id":"5","label":"Home, Pet & Daily Life","dimension":"Home_Pet_Daily_Life","weight":10},{"id":"6","label":"Digital Life & Online Presence","dimension":"Digital_Life","weight":5},{"id":"7","label":"Funeral, Memorial & Body Disposition","dimension":"Funeral_Memorial","weight":5},{"id":"8","label":"Emotional & Spiritual","dimension":"Emotional_Spiritual","weight":3},{"id":"9","label":"Supporting Aging Parents","dimension":"Supporting_Aging_Parents","weight":2},{"id":"10","label":"Home & Personal Property","dimension":"Home_Personal_Property","weight":3},{"id":"11","label":"Document Storage","dimension":"Document_Storage","weight":2}],"profile_questions":[{"id":"profile.financial.has_beneficiary_accounts","field":"financial.has_beneficiary_accounts","prompt":"Do any of your accounts allow you to name beneficiaries?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"}],"value_map":{"yes":true,"no":false}},{"id":"profile.household.has_dependents","field":"household.has_dependents","prompt":"Do other people depend on you for care or financial support?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"}],"value_map":{"yes":true,"no":false}},{"id":"profile.pets.has_pets","field":"pets.has_pets","prompt":"Do you have pets that depend on you?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"}],"value_map":{"yes":true,"no":false}},{"id":"profile.digital.owns_crypto","field":"digital.owns_crypto","prompt":"Do you own any digital or cryptocurrency assets?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"}],"value_map":{"yes":true,"no":false}},{"id":"profile.family.supports_aging_parent","field":"family.supports_aging_parent","prompt":"Are you currently helping support an aging parent?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"}],"value_map":{"yes":true,"no":false}},{"id":"profile.home.owns_real_property","field":"home.owns_real_property","prompt":"Do you own your home or other real property?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"}],"value_map":{"yes":true,"no":false}},{"id":"profile.home.has_significant_personal_property","field":"home.has_significant_personal_property","prompt":"Do you own items of significant personal value?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"}],"value_map":{"yes":true,"no":false}},{"id":"profile.emotional.has_spiritual_practices","field":"emotional.has_spiritual_practices","prompt":"Do you have spiritual or cultural practices you would want included?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"}],"value_map":{"yes":true,"no":false}}],"profile_gates":[{"when":"profile.financial.has_beneficiary_accounts == false","questions":["3.4","3.5"],"result":"na","flag":"not_applicable","when_ref":"c_71a9c855"},{"when":"profile.pets.has_pets == false","questions":["5.4","5.5"],"result":"na","flag":"not_applicable","when_ref":"c_44c97601"},{"when":"profile.emotional.has_spiritual_practices == false","questions":["8.1","8.2"],"result":"na","flag":"not_applicable","when_ref":"c_35d0006c"},{"when":"profile.digital.owns_crypto == false","questions":["6.7"],"result":"na","flag":"not_applicable","when_ref":"c_c46c3b05"},{"when":"profile.family.supports_aging_parent == false","questions":["9.2","9.3","9.4"],"result":"na","flag":"not_applicable","when_ref":"c_dd44c9df"},{"when":"profile.home.owns_real_property == false","questions":["10.1","10.2"],"result":"na","flag":"not_applicable","when_ref":"c_2812c509"},{"when":"profile.home.has_significant_personal_property == false","questions":["10.5"],"result":"na","flag":"not_applicable","when_ref":"c_7ea309c9"}],"conditions":{"c_2812c509":{"expression":"profile.home.owns_real_property == false","ast":{"op":"eq","profile":"home.owns_real_property","value":false},"ops":[["eq","profile","home.owns_real_property",false]]},"c_35d0006c":{"expression":"profile.emotional.has_spiritual_practices == false","ast":{"op":"eq","profile":"emotional.has_spiritual_practices","value":false},"ops":[["eq","profile","emotional.has_spiritual_practices",false]]},"c_44c97601":{"expression":"profile.pets.has_pets == false","ast":{"op":"eq","profile":"pets.has_pets","value":false},"ops":[["eq","profile","pets.has_pets",false]]},"c_71a9c855":{"expression":"profile.financial.has_beneficiary_accounts == false","ast":{"op":"eq","profile":"financial.has_beneficiary_accounts","value":false},"ops":[["eq","profile","financial.has_beneficiary_accounts",false]]},"c_7ea309c9":{"expression":"profile.home.has_significant_personal_property == false","ast":{"op":"eq","profile":"home.has_significant_personal_property","value":false},"ops":[["eq","profile","home.has_significant_personal_property",false]]},"c_c46c3b05":{"expression":"profile.digital.owns_crypto == false","ast":{"op":"eq","profile":"digital.owns_crypto","value":false},"ops":[["eq","profile","digital.owns_crypto",false]]},"c_dd44c9df":{"expression":"profile.family.supports_aging_parent == false","ast":{"op":"eq","profile":"family.supports_aging_parent","value":false},"ops":[["eq","profile","family.supports_aging_parent",false]]}},"answer_scoring":{"yes":1.0,"partial":0.5,"no":0.0,"not_sure":0.25,"na":null},"flags":{"review_on":["not_sure"],"follow_up_on":["na"],"risk_on":[]},"score_bands":[{"min":80,"max":100,"label":"Highly Prepared"},{"min":60,"max":79,"label":"Moderately Prepared"},{"min":40,"max":59,"label":"Limited Preparedness"},{"min":0,"max":39,"label":"Low Readiness / High Risk"}],"score_tables":{"band_lookup":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"section_weight_total":100,"section_weight_shares":{"1":0.25,"2":0.15,"3":0.2,"4":0.1,"5":0.1,"6":0.05,"7":0.05,"8":0.03,"9":0.02,"10":0.03,"11":0.02},"section_max_points":{"1":1900.0,"2":800.0,"3":800.0,"4":300.0,"5":400.0,"6":700.0,"7":400.0,"8":300.0,"9":300.0,"10":400.0,"11":400.0}},"shards":{"1":{"key":"section:1","file":"section_1.json","content_hash":"f0c58b9c8b7f1966a7495b6fa285025a15247cbd4ed8ec432463e187ef552ea3","question_count":19},"2":{"key":"section:2","file":"section_2.json","content_hash":"dfdf2c20ceafe76c7c3d620f3f76568a777408a527144caa2ebf64e45e8b8ed9","question_count":8},"3":{"key":"section:3","file":"section_3.json","content_hash":"223993af3ebee178feb2bfdf6ab885bd56f1a2e835d8fdf6b02b00a3d7ae3cd3","question_count":8},"4":{"key":"section:4","file":"section_4.json","content_hash":"51c0fc627357315bdc5ed143f85064493c8c4c1a71ab9e4feb06180097ffa19d","question_count":3},"5":{"key":"section:5","file":"section_5.json","content_hash":"c380ab9bcfb37955360c6d26199efc696627512f3be316a83bb5aab11b9bc2a7","question_count":4},"6":{"key":"section:6","file":"section_6.json","content_hash":"6568349a906a5107a708457bf4f5222fe0b5643f640e311b8ad42da11e7a9c4c","question_count":7},"7":{"key":"section:7","file":"section_7.json","content_hash":"701fc1aa52966e931a570aac9df5e123af64fd57c89772ea4126b4bfba34b724","question_count":4},"8":{"key":"section:8","file":"section_8.json","content_hash":"88df2bc7d133124e53aa5971879083146806844c23b52931d3328b2d650bf407","question_count":3},"9":{"key":"section:9","file":"section_9.json","content_hash":"2e43cceb30ba93f89b14af7b9032a4f64a1f64083130d5d1f0449ea5ec0979d7","question_count":3},"10":{"key":"section:10","file":"section_10.json","content_hash":"a6a275ba0f9fca0902a864e568a5f5a81afd592fdc358f26c21d5be12157a97d","question_count":4},"11":{"key":"section:11","file":"section_11.json","content_hash":"d68eeda50fb8e52effd470615de58c0bfdd9825ae923fba535f3e45cd398a8ab","question_count":4},"tables":{"key":"tables","file":"tables.json","content_hash":"02d0ab6e61d732b927b09400d4071c1b2f2bc242580ee5b1ae7321fd3144f399"}}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:1', 'f0c58b9c8b7f1966a7495b6fa285025a15247cbd4ed8ec432463e187ef552ea3', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"f0c58b9c8b7f1966a7495b6fa285025a15247cbd4ed8ec432463e187ef552ea3","section_id":"1","section":{"id":"1","label":"Legal Planning & Decision Makers","dimension":"Legal_Planning","weight":25},"questions":[{"id":"1.1.A.1","item_id":"legal.will.evaluation","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Have you ever evaluated whether you need a will?","type":"single_select","options":[{"value":"yes","label":"Yes, evaluation completed"},{"value":"partial","label":"Evaluation started but not completed"},{"value":"no","label":"No, never evaluated"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.A.2","item_id":"legal.will.evaluation_determination","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"If evaluated, was a determination made about whether a will is appropriate for you?","type":"single_select","options":[{"value":"yes","label":"Yes, determination made and documented"},{"value":"partial","label":"Determination made but not documented"},{"value":"no","label":"No determination made"},{"value":"na","label":"Not applicable"},{"value":"not_sure","label":"Not sure"}],"applies_if":"answers['1.1.A.1'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_bd26a082"},{"id":"1.1.A.3","item_id":"legal.trust.evaluation","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Have you ever evaluated whether a trust may be appropriate for your situation?","type":"single_select","options":[{"value":"yes","label":"Yes, evaluation completed"},{"value":"partial","label":"Evaluation started but not completed"},{"value":"no","label":"No, never evaluated"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.A.4","item_id":"legal.trust.evaluation_determination","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"If evaluated, was a determination made about whether a trust is appropriate?","type":"single_select","options":[{"value":"yes","label":"Yes, determination made and documented"},{"value":"partial","label":"Determination made but not documented"},{"value":"no","label":"No determination made"},{"value":"na","label":"Not applicable"},{"value":"not_sure","label":"Not sure"}],"applies_if":"answers['1.1.A.3'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_c9957568"},{"id":"1.1.A.5","item_id":"legal.evaluation.professional_input","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Was any part of your legal planning evaluation done with professional input?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.A.6","item_id":"legal.plan.review_triggers","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Have you identified events that would trigger a review of your legal plan?","type":"single_select","options":[{"value":"yes","label":"Yes, documented"},{"value":"partial","label":"Identified but not documented"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.A.7","item_id":"legal.documents.align_with_evaluation","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Do you believe your current legal documents reflect your most recent legal planning evaluation?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_be8dc78e"},{"id":"1.1.B.1","item_id":"legal.will.exists","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Do you currently have a legally valid will?","type":"single_select","options":[{"value":"yes","label":"Yes, completed and signed"},{"value":"partial","label":"Drafted but not signed"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.B.2","item_id":"legal.will.access","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Is the original or a court-acceptable copy of your will easy to locate if needed?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Location exists but unclear"},{"value":"partial","label":"Draft only"},{"value":"na","label":"Not applicable"},{"value":"not_sure","label":"Not sure"}],"applies_if":"answers['1.1.B.1'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_373e5ca7"},{"id":"1.1.B.3","item_id":"legal.trust.exists","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Do you have a revocable living trust?","type":"single_select","options":[{"value":"yes","label":"Yes, completed and signed"},{"value":"partial","label":"Drafted but not signed"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.B.4","item_id":"legal.trust.access","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"If you have a trust, can the signed trust document be easily located if needed?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Location exists but unclear"},{"value":"partial","label":"Only a draft exists"},{"value":"na","label":"Not applicable"},{"value":"not_sure","label":"Not sure"}],"applies_if":"answers['1.1.B.3'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_f0cea0af"},{"id":"1.1.B.4a","item_id":"legal.trust.funding","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Have assets been moved into your trust (often called 'funding' the trust)?","type":"single_select","options":[{"value":"yes","label":"Yes, most or all"},{"value":"partial","label":"Some assets"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"answers['1.1.B.3'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_f0cea0af"},{"id":"1.1.B.5","item_id":"legal.fpoa.exists","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Do you have a financial power of attorney?","type":"single_select","options":[{"value":"yes","label":"Yes, completed and signed"},{"value":"partial","label":"Drafted but not signed"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.B.6","item_id":"legal.fpoa.acceptance","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"If someone needed to use your financial power of attorney, would your banks accept it?","type":"single_select","options":[{"value":"yes","label":"Yes, all major institutions"},{"value":"partial","label":"Some institutions"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"answers['1.1.B.5'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_cc9afa90"},{"id":"1.1.B.7","item_id":"legal.hpoa.exists","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Do you have a healthcare power of attorney or healthcare proxy?","type":"single_select","options":[{"value":"yes","label":"Yes, completed and signed"},{"value":"partial","label":"Drafted but not signed"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.B.8","item_id":"legal.body_disposition.document","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Do you have a written document that explains what should happen to your body after death (where required by law)?","type":"single_select","options":[{"value":"yes","label":"Yes, completed and signed"},{"value":"partial","label":"Written but not finalized"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"always"},{"id":"1.1.B.9","item_id":"legal.practical_guide.exists","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Do you have a written guide (separate from legal documents) that explains practical information like where things are or what to do first?","type":"single_select","options":[{"value":"yes","label":"Yes, completed and accessible"},{"value":"partial","label":"Exists but incomplete"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"1.1.B.10","item_id":"legal.documents.current","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Are all completed legal documents current and up to date?","type":"single_select","options":[{"value":"yes","label":"Yes, all"},{"value":"partial","label":"Some outdated"},{"value":"no","label":"Most outdated"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_be8dc78e"},{"id":"1.1.B.11","item_id":"legal.documents.shared","section_id":"1","dimension":"Legal_Planning","weight":1,"prompt":"Have copies of completed legal documents been shared with the people who may need them?","type":"single_select","options":[{"value":"yes","label":"Yes, all"},{"value":"partial","label":"Some"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_be8dc78e"}],"soft_gates":[{"when":"answers['1.1.A.1'] in ['yes','partial']","questions":["1.1.A.2"],"result":"ask","when_ref":"c_bd26a082"},{"when":"answers['1.1.A.1'] in ['no','not_sure']","questions":["1.1.A.2"],"result":"na","flag":"follow_up","when_ref":"c_5d8307d4"},{"when":"answers['1.1.A.3'] in ['yes','partial']","questions":["1.1.A.4"],"result":"ask","when_ref":"c_c9957568"},{"when":"answers['1.1.A.3'] in ['no','not_sure']","questions":["1.1.A.4"],"result":"na","flag":"follow_up","when_ref":"c_46ad8ea8"},{"when":"answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']","questions":["1.1.A.7"],"result":"ask","when_ref":"c_be8dc78e"},{"when":"answers['1.1.B.1'] in ['no','not_sure'] and answers['1.1.B.3'] in ['no','not_sure'] and answers['1.1.B.5'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure'] and answers['1.1.B.8'] in ['no','not_sure','na']","questions":["1.1.A.7"],"result":"na","flag":"follow_up","when_ref":"c_a9c72514"},{"when":"answers['1.1.B.1'] in ['yes','partial']","questions":["1.1.B.2"],"result":"ask","when_ref":"c_373e5ca7"},{"when":"answers['1.1.B.1'] in ['no','not_sure']","questions":["1.1.B.2"],"result":"na","flag":"follow_up","when_ref":"c_a150bc7e"},{"when":"answers['1.1.B.3'] in ['yes','partial']","questions":["1.1.B.4"],"result":"ask","when_ref":"c_f0cea0af"},{"when":"answers['1.1.B.3'] in ['no','not_sure']","questions":["1.1.B.4"],"result":"na","flag":"follow_up","when_ref":"c_91b314f5"},{"when":"answers['1.1.B.3'] in ['yes','partial']","questions":["1.1.B.4a"],"result":"ask","when_ref":"c_f0cea0af"},{"when":"answers['1.1.B.3'] in ['no','not_sure']","questions":["1.1.B.4a"],"result":"na","flag":"follow_up","when_ref":"c_91b314f5"},{"when":"answers['1.1.B.5'] in ['yes','partial']","questions":["1.1.B.6"],"result":"ask","when_ref":"c_cc9afa90"},{"when":"answers['1.1.B.5'] in ['no','not_sure']","questions":["1.1.B.6"],"result":"na","flag":"follow_up","when_ref":"c_83c98497"},{"when":"answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']","questions":["1.1.B.10"],"result":"ask","when_ref":"c_be8dc78e"},{"when":"answers['1.1.B.1'] in ['no','not_sure'] and answers['1.1.B.3'] in ['no','not_sure'] and answers['1.1.B.5'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure'] and answers['1.1.B.8'] in ['no','not_sure','na']","questions":["1.1.B.10"],"result":"na","flag":"follow_up","when_ref":"c_a9c72514"},{"when":"answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']","questions":["1.1.B.11"],"result":"ask","when_ref":"c_be8dc78e"},{"when":"answers['1.1.B.1'] in ['no','not_sure'] and answers['1.1.B.3'] in ['no','not_sure'] and answers['1.1.B.5'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure'] and answers['1.1.B.8'] in ['no','not_sure','na']","questions":["1.1.B.11"],"result":"na","flag":"follow_up","when_ref":"c_a9c72514"}],"conditions":{"c_373e5ca7":{"expression":"answers['1.1.B.1'] in ['yes','partial']","ast":{"op":"in","answer":"1.1.B.1","values":["yes","partial"]},"ops":[["in","answer","1.1.B.1",["yes","partial"]]]},"c_46ad8ea8":{"expression":"answers['1.1.A.3'] in ['no','not_sure']","ast":{"op":"in","answer":"1.1.A.3","values":["no","not_sure"]},"ops":[["in","answer","1.1.A.3",["no","not_sure"]]]},"c_5d8307d4":{"expression":"answers['1.1.A.1'] in ['no','not_sure']","ast":{"op":"in","answer":"1.1.A.1","values":["no","not_sure"]},"ops":[["in","answer","1.1.A.1",["no","not_sure"]]]},"c_83c98497":{"expression":"answers['1.1.B.5'] in ['no','not_sure']","ast":{"op":"in","answer":"1.1.B.5","values":["no","not_sure"]},"ops":[["in","answer","1.1.B.5",["no","not_sure"]]]},"c_91b314f5":{"expression":"answers['1.1.B.3'] in ['no','not_sure']","ast":{"op":"in","answer":"1.1.B.3","values":["no","not_sure"]},"ops":[["in","answer","1.1.B.3",["no","not_sure"]]]},"c_a150bc7e":{"expression":"answers['1.1.B.1'] in ['no','not_sure']","ast":{"op":"in","answer":"1.1.B.1","values":["no","not_sure"]},"ops":[["in","answer","1.1.B.1",["no","not_sure"]]]},"c_a9c72514":{"expression":"answers['1.1.B.1'] in ['no','not_sure'] and answers['1.1.B.3'] in ['no','not_sure'] and answers['1.1.B.5'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure'] and answers['1.1.B.8'] in ['no','not_sure','na']","ast":{"op":"and","args":[{"op":"in","answer":"1.1.B.1","values":["no","not_sure"]},{"op":"in","answer":"1.1.B.3","values":["no","not_sure"]},{"op":"in","answer":"1.1.B.5","values":["no","not_sure"]},{"op":"in","answer":"1.1.B.7","values":["no","not_sure"]},{"op":"in","answer":"1.1.B.8","values":["no","not_sure","na"]}]},"ops":[["in","answer","1.1.B.1",["no","not_sure"]],["in","answer","1.1.B.3",["no","not_sure"]],["in","answer","1.1.B.5",["no","not_sure"]],["in","answer","1.1.B.7",["no","not_sure"]],["in","answer","1.1.B.8",["no","not_sure","na"]],["and",5]]},"c_bd26a082":{"expression":"answers['1.1.A.1'] in ['yes','partial']","ast":{"op":"in","answer":"1.1.A.1","values":["yes","partial"]},"ops":[["in","answer","1.1.A.1",["yes","partial"]]]},"c_be8dc78e":{"expression":"answers['1.1.B.1'] in ['yes','partial'] or answers['1.1.B.3'] in ['yes','partial'] or answers['1.1.B.5'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial'] or answers['1.1.B.8'] in ['yes','partial']","ast":{"op":"or","args":[{"op":"in","answer":"1.1.B.1","values":["yes","partial"]},{"op":"in","answer":"1.1.B.3","values":["yes","partial"]},{"op":"in","answer":"1.1.B.5","values":["yes","partial"]},{"op":"in","answer":"1.1.B.7","values":["yes","partial"]},{"op":"in","answer":"1.1.B.8","values":["yes","partial"]}]},"ops":[["in","answer","1.1.B.1",["yes","partial"]],["in","answer","1.1.B.3",["yes","partial"]],["in","answer","1.1.B.5",["yes","partial"]],["in","answer","1.1.B.7",["yes","partial"]],["in","answer","1.1.B.8",["yes","partial"]],["or",5]]},"c_c9957568":{"expression":"answers['1.1.A.3'] in ['yes','partial']","ast":{"op":"in","answer":"1.1.A.3","values":["yes","partial"]},"ops":[["in","answer","1.1.A.3",["yes","partial"]]]},"c_cc9afa90":{"expression":"answers['1.1.B.5'] in ['yes','partial']","ast":{"op":"in","answer":"1.1.B.5","values":["yes","partial"]},"ops":[["in","answer","1.1.B.5",["yes","partial"]]]},"c_f0cea0af":{"expression":"answers['1.1.B.3'] in ['yes','partial']","ast":{"op":"in","answer":"1.1.B.3","values":["yes","partial"]},"ops":[["in","answer","1.1.B.3",["yes","partial"]]]}},"routing":{"start":0,"stop":19,"steps":[{"id":"1.1.A.1","applies_if_ref":null,"next":[1,2]},{"id":"1.1.A.2","applies_if_ref":"c_bd26a082","next":[2]},{"id":"1.1.A.3","applies_if_ref":null,"next":[3,4]},{"id":"1.1.A.4","applies_if_ref":"c_c9957568","next":[4]},{"id":"1.1.A.5","applies_if_ref":null,"next":[5]},{"id":"1.1.A.6","applies_if_ref":null,"next":[6,7]},{"id":"1.1.A.7","applies_if_ref":"c_be8dc78e","next":[7]},{"id":"1.1.B.1","applies_if_ref":null,"next":[8,9]},{"id":"1.1.B.2","applies_if_ref":"c_373e5ca7","next":[9]},{"id":"1.1.B.3","applies_if_ref":null,"next":[10,11,12]},{"id":"1.1.B.4","applies_if_ref":"c_f0cea0af","next":[11,12]},{"id":"1.1.B.4a","applies_if_ref":"c_f0cea0af","next":[12]},{"id":"1.1.B.5","applies_if_ref":null,"next":[13,14]},{"id":"1.1.B.6","applies_if_ref":"c_cc9afa90","next":[14]},{"id":"1.1.B.7","applies_if_ref":null,"next":[15]},{"id":"1.1.B.8","applies_if_ref":null,"next":[16]},{"id":"1.1.B.9","applies_if_ref":null,"next":[17,18,19]},{"id":"1.1.B.10","applies_if_ref":"c_be8dc78e","next":[18,19]},{"id":"1.1.B.11","applies_if_ref":"c_be8dc78e","next":[19]}]},"question_max_points":{"1.1.A.1":100.0,"1.1.A.2":100.0,"1.1.A.3":100.0,"1.1.A.4":100.0,"1.1.A.5":100.0,"1.1.A.6":100.0,"1.1.A.7":100.0,"1.1.B.1":100.0,"1.1.B.2":100.0,"1.1.B.3":100.0,"1.1.B.4":100.0,"1.1.B.4a":100.0,"1.1.B.5":100.0,"1.1.B.6":100.0,"1.1.B.7":100.0,"1.1.B.8":100.0,"1.1.B.9":100.0,"1.1.B.10":100.0,"1.1.B.11":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:2', 'dfdf2c20ceafe76c7c3d620f3f76568a777408a527144caa2ebf64e45e8b8ed9', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"dfdf2c20ceafe76c7c3d620f3f76568a777408a527144caa2ebf64e45e8b8ed9","section_id":"2","section":{"id":"2","label":"Health Care","dimension":"Health_Care","weight":15},"questions":[{"id":"2.1","item_id":"healthcare.advance_directive.exists","section_id":"2","dimension":"Health_Care","weight":1,"prompt":"Do you have an advance directive or living will?","type":"single_select","options":[{"value":"yes","label":"Yes, completed and signed"},{"value":"partial","label":"Drafted but not signed"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"2.2","item_id":"healthcare.advance_directive.instructions","section_id":"2","dimension":"Health_Care","weight":1,"prompt":"Does your advance directive include any written medical instructions (you do not need to know or share what they are)?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"answers['2.1'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_21f0f63c"},{"id":"2.3","item_id":"healthcare.hipaa_release.exists","section_id":"2","dimension":"Health_Care","weight":1,"prompt":"Do you have a HIPAA authorization or medical information release?","type":"single_select","options":[{"value":"yes","label":"Yes, completed and signed"},{"value":"partial","label":"Drafted but not signed"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"2.4","item_id":"healthcare.documents.on_file","section_id":"2","dimension":"Health_Care","weight":1,"prompt":"Are your healthcare documents on file with your doctors or in a patient portal?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"answers['2.1'] in ['yes','partial'] or answers['2.3'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial']","system_na":true,"applies_if_ref":"c_4c3f9770"},{"id":"2.5","item_id":"healthcare.medical_info.list_access","section_id":"2","dimension":"Health_Care","weight":1,"prompt":"Is there a list of your medications, allergies, and doctors that someone could easily access?","type":"single_select","options":[{"value":"yes","label":"Yes, complete"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"2.6","item_id":"healthcare.access_plan.home_phone","section_id":"2","dimension":"Health_Care","weight":1,"prompt":"Is there a plan for how someone could access your home or phone if you were incapacitated?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Informal only"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"2.7","item_id":"healthcare.organ_donor.registered","section_id":"2","dimension":"Health_Care","weight":1,"prompt":"Are you registered as an organ donor or otherwise documented?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"2.8","item_id":"healthcare.body_donation.enrollment","section_id":"2","dimension":"Health_Care","weight":1,"prompt":"If applicable, have you completed any body donation enrollment paperwork?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"na","label":"Not applicable"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"}],"soft_gates":[{"when":"answers['2.1'] in ['yes','partial']","questions":["2.2"],"result":"ask","when_ref":"c_21f0f63c"},{"when":"answers['2.1'] in ['no','not_sure']","questions":["2.2"],"result":"na","flag":"follow_up","when_ref":"c_e4d28c2f"},{"when":"answers['2.1'] in ['yes','partial'] or answers['2.3'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial']","questions":["2.4"],"result":"ask","when_ref":"c_4c3f9770"},{"when":"answers['2.1'] in ['no','not_sure'] and answers['2.3'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure']","questions":["2.4"],"result":"na","flag":"follow_up","when_ref":"c_4b382279"}],"conditions":{"c_21f0f63c":{"expression":"answers['2.1'] in ['yes','partial']","ast":{"op":"in","answer":"2.1","values":["yes","partial"]},"ops":[["in","answer","2.1",["yes","partial"]]]},"c_4b382279":{"expression":"answers['2.1'] in ['no','not_sure'] and answers['2.3'] in ['no','not_sure'] and answers['1.1.B.7'] in ['no','not_sure']","ast":{"op":"and","args":[{"op":"in","answer":"2.1","values":["no","not_sure"]},{"op":"in","answer":"2.3","values":["no","not_sure"]},{"op":"in","answer":"1.1.B.7","values":["no","not_sure"]}]},"ops":[["in","answer","2.1",["no","not_sure"]],["in","answer","2.3",["no","not_sure"]],["in","answer","1.1.B.7",["no","not_sure"]],["and",3]]},"c_4c3f9770":{"expression":"answers['2.1'] in ['yes','partial'] or answers['2.3'] in ['yes','partial'] or answers['1.1.B.7'] in ['yes','partial']","ast":{"op":"or","args":[{"op":"in","answer":"2.1","values":["yes","partial"]},{"op":"in","answer":"2.3","values":["yes","partial"]},{"op":"in","answer":"1.1.B.7","values":["yes","partial"]}]},"ops":[["in","answer","2.1",["yes","partial"]],["in","answer","2.3",["yes","partial"]],["in","answer","1.1.B.7",["yes","partial"]],["or",3]]},"c_e4d28c2f":{"expression":"answers['2.1'] in ['no','not_sure']","ast":{"op":"in","answer":"2.1","values":["no","not_sure"]},"ops":[["in","answer","2.1",["no","not_sure"]]]}},"routing":{"start":19,"stop":27,"steps":[{"id":"2.1","applies_if_ref":null,"next":[20,21]},{"id":"2.2","applies_if_ref":"c_21f0f63c","next":[21]},{"id":"2.3","applies_if_ref":null,"next":[22,23]},{"id":"2.4","applies_if_ref":"c_4c3f9770","next":[23]},{"id":"2.5","applies_if_ref":null,"next":[24]},{"id":"2.6","applies_if_ref":null,"next":[25]},{"id":"2.7","applies_if_ref":null,"next":[26]},{"id":"2.8","applies_if_ref":null,"next":[27]}]},"question_max_points":{"2.1":100.0,"2.2":100.0,"2.3":100.0,"2.4":100.0,"2.5":100.0,"2.6":100.0,"2.7":100.0,"2.8":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:3', '223993af3ebee178feb2bfdf6ab885bd56f1a2e835d8fdf6b02b00a3d7ae3cd3', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"223993af3ebee178feb2bfdf6ab885bd56f1a2e835d8fdf6b02b00a3d7ae3cd3","section_id":"3","section":{"id":"3","label":"Financial & Insurance Planning","dimension":"Financial_Insurance","weight":20},"questions":[{"id":"3.1","item_id":"financial.assets_debts.list","section_id":"3","dimension":"Financial_Insurance","weight":1,"prompt":"Is there a list of your assets and debts that someone could access if needed?","type":"single_select","options":[{"value":"yes","label":"Yes, complete"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"3.2","item_id":"financial.accounts.manageability","section_id":"3","dimension":"Financial_Insurance","weight":1,"prompt":"Could someone step in and manage key accounts and obligations within about 30 days?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"3.4","item_id":"financial.beneficiaries.set","section_id":"3","dimension":"Financial_Insurance","weight":1,"prompt":"Are beneficiaries set up on all applicable accounts?","type":"single_select","options":[{"value":"yes","label":"All complete"},{"value":"partial","label":"Some missing"},{"value":"no","label":"Most missing"},{"value":"no","label":"None"},{"value":"not_sure","label":"Not sure"}],"applies_if":"profile.financial.has_beneficiary_accounts == true","system_na":true,"applies_if_ref":"c_5e6adc87"},{"id":"3.5","item_id":"financial.beneficiaries.reviewed","section_id":"3","dimension":"Financial_Insurance","weight":1,"prompt":"Have beneficiary designations been reviewed in the last 5 years?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"profile.financial.has_beneficiary_accounts == true","system_na":true,"applies_if_ref":"c_5e6adc87"},{"id":"3.6","item_id":"financial.insurance.coverage","section_id":"3","dimension":"Financial_Insurance","weight":1,"prompt":"Do you currently have any life, long-term care, disability, or health insurance?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"3.7","item_id":"financial.final_expenses.plan","section_id":"3","dimension":"Financial_Insurance","weight":1,"prompt":"Is there a plan in place to cover final expenses?","type":"single_select","options":[{"value":"yes","label":"Yes, funded or prepaid"},{"value":"partial","label":"Planned but not funded"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"3.8","item_id":"financial.recurring_bills.list","section_id":"3","dimension":"Financial_Insurance","weight":1,"prompt":"Is there a list of recurring bills, debts, or obligations someone could follow?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"3.9","item_id":"financial.manageability.self_assessed","section_id":"3","dimension":"Financial_Insurance","weight":1,"prompt":"Do you feel your finances could be difficult for others to manage if something happened?","type":"single_select","options":[{"value":"yes","label":"Yes","score_value":"no"},{"value":"no","label":"No","score_value":"yes"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"}],"soft_gates":[],"conditions":{"c_5e6adc87":{"expression":"profile.financial.has_beneficiary_accounts == true","ast":{"op":"eq","profile":"financial.has_beneficiary_accounts","value":true},"ops":[["eq","profile","financial.has_beneficiary_accounts",true]]}},"routing":{"start":27,"stop":35,"steps":[{"id":"3.1","applies_if_ref":null,"next":[28]},{"id":"3.2","applies_if_ref":null,"next":[29,30,31]},{"id":"3.4","applies_if_ref":"c_5e6adc87","next":[30,31]},{"id":"3.5","applies_if_ref":"c_5e6adc87","next":[31]},{"id":"3.6","applies_if_ref":null,"next":[32]},{"id":"3.7","applies_if_ref":null,"next":[33]},{"id":"3.8","applies_if_ref":null,"next":[34]},{"id":"3.9","applies_if_ref":null,"next":[35]}]},"question_max_points":{"3.1":100.0,"3.2":100.0,"3.4":100.0,"3.5":100.0,"3.6":100.0,"3.7":100.0,"3.8":100.0,"3.9":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:4', '51c0fc627357315bdc5ed143f85064493c8c4c1a71ab9e4feb06180097ffa19d', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"51c0fc627357315bdc5ed143f85064493c8c4c1a71ab9e4feb06180097ffa19d","section_id":"4","section":{"id":"4","label":"Family Relationships & Roles","dimension":"Family_Relationships","weight":10},"questions":[{"id":"4.2","item_id":"family.emergency_contacts.list","section_id":"4","dimension":"Family_Relationships","weight":1,"prompt":"Is there a written list of who should be contacted in an emergency?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"4.3","item_id":"family.documents.shared","section_id":"4","dimension":"Family_Relationships","weight":1,"prompt":"Have you shared where important documents are and who can make decisions?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partially"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"4.4","item_id":"family.exclusions.guidance","section_id":"4","dimension":"Family_Relationships","weight":1,"prompt":"Is there written guidance about anyone who should not be involved in decisions?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Verbal only"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"}],"soft_gates":[],"conditions":{},"routing":{"start":35,"stop":38,"steps":[{"id":"4.2","applies_if_ref":null,"next":[36]},{"id":"4.3","applies_if_ref":null,"next":[37]},{"id":"4.4","applies_if_ref":null,"next":[38]}]},"question_max_points":{"4.2":100.0,"4.3":100.0,"4.4":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:5', 'c380ab9bcfb37955360c6d26199efc696627512f3be316a83bb5aab11b9bc2a7', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"c380ab9bcfb37955360c6d26199efc696627512f3be316a83bb5aab11b9bc2a7","section_id":"5","section":{"id":"5","label":"Home, Pet & Daily Life","dimension":"Home_Pet_Daily_Life","weight":10},"questions":[{"id":"5.1","item_id":"home.daily_responsibilities.plan","section_id":"5","dimension":"Home_Pet_Daily_Life","weight":1,"prompt":"Is there a plan for how your home and daily responsibilities would be handled?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Informal"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"5.2","item_id":"home.utilities.access_info","section_id":"5","dimension":"Home_Pet_Daily_Life","weight":1,"prompt":"Are utilities, access instructions, and service contacts written down somewhere?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"5.4","item_id":"home.pets.care_plan","section_id":"5","dimension":"Home_Pet_Daily_Life","weight":1,"prompt":"If yes, is there a written plan for their care?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.pets.has_pets == true","system_na":true,"applies_if_ref":"c_13f13693"},{"id":"5.5","item_id":"home.pets.records_access","section_id":"5","dimension":"Home_Pet_Daily_Life","weight":1,"prompt":"Are pet records and care instructions easy to find?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.pets.has_pets == true","system_na":true,"applies_if_ref":"c_13f13693"}],"soft_gates":[],"conditions":{"c_13f13693":{"expression":"profile.pets.has_pets == true","ast":{"op":"eq","profile":"pets.has_pets","value":true},"ops":[["eq","profile","pets.has_pets",true]]}},"routing":{"start":38,"stop":42,"steps":[{"id":"5.1","applies_if_ref":null,"next":[39]},{"id":"5.2","applies_if_ref":null,"next":[40,41,42]},{"id":"5.4","applies_if_ref":"c_13f13693","next":[41,42]},{"id":"5.5","applies_if_ref":"c_13f13693","next":[42]}]},"question_max_points":{"5.1":100.0,"5.2":100.0,"5.4":100.0,"5.5":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:6', '6568349a906a5107a708457bf4f5222fe0b5643f640e311b8ad42da11e7a9c4c', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"6568349a906a5107a708457bf4f5222fe0b5643f640e311b8ad42da11e7a9c4c","section_id":"6","section":{"id":"6","label":"Digital Life & Online Presence","dimension":"Digital_Life","weight":5},"questions":[{"id":"6.1","item_id":"digital.account_access.method","section_id":"6","dimension":"Digital_Life","weight":1,"prompt":"Is there a way someone could access your online accounts if needed (for example, a password manager)?","type":"single_select","options":[{"value":"yes","label":"Yes, complete"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"6.2","item_id":"digital.device_access.guidance","section_id":"6","dimension":"Digital_Life","weight":1,"prompt":"Is there guidance for accessing your phone or computer in an emergency?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"6.3","item_id":"digital.accounts.list","section_id":"6","dimension":"Digital_Life","weight":1,"prompt":"Is there a list of your important online accounts?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"6.4","item_id":"digital.account_inactivity_settings","section_id":"6","dimension":"Digital_Life","weight":1,"prompt":"On platforms like Apple, Google, or social media, have you set up settings for what happens to your account if you cannot use it?","type":"single_select","options":[{"value":"yes","label":"Yes, on all platforms"},{"value":"partial","label":"Yes, on some"},{"value":"no","label":"No"},{"value":"na","label":"Not applicable"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"6.5","item_id":"digital.files.backup_access","section_id":"6","dimension":"Digital_Life","weight":1,"prompt":"Are important digital files backed up and accessible?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"6.7","item_id":"digital.assets.crypto.access_plan","section_id":"6","dimension":"Digital_Life","weight":1,"prompt":"If yes, is there a way someone could access or recover them if needed?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.digital.owns_crypto == true","system_na":true,"applies_if_ref":"c_d75da198"},{"id":"6.8","item_id":"digital.assets.mentioned_in_estate_docs","section_id":"6","dimension":"Digital_Life","weight":1,"prompt":"Do your estate documents mention digital assets?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"always"}],"soft_gates":[],"conditions":{"c_d75da198":{"expression":"profile.digital.owns_crypto == true","ast":{"op":"eq","profile":"digital.owns_crypto","value":true},"ops":[["eq","profile","digital.owns_crypto",true]]}},"routing":{"start":42,"stop":49,"steps":[{"id":"6.1","applies_if_ref":null,"next":[43]},{"id":"6.2","applies_if_ref":null,"next":[44]},{"id":"6.3","applies_if_ref":null,"next":[45]},{"id":"6.4","applies_if_ref":null,"next":[46]},{"id":"6.5","applies_if_ref":null,"next":[47,48]},{"id":"6.7","applies_if_ref":"c_d75da198","next":[48]},{"id":"6.8","applies_if_ref":null,"next":[49]}]},"question_max_points":{"6.1":100.0,"6.2":100.0,"6.3":100.0,"6.4":100.0,"6.5":100.0,"6.7":100.0,"6.8":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:7', '701fc1aa52966e931a570aac9df5e123af64fd57c89772ea4126b4bfba34b724', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"701fc1aa52966e931a570aac9df5e123af64fd57c89772ea4126b4bfba34b724","section_id":"7","section":{"id":"7","label":"Funeral, Memorial & Body Disposition","dimension":"Funeral_Memorial","weight":5},"questions":[{"id":"7.1","item_id":"final.guidance.after_death","section_id":"7","dimension":"Funeral_Memorial","weight":1,"prompt":"Is there written guidance about what should happen after death?","type":"single_select","options":[{"value":"yes","label":"Yes, accessible"},{"value":"partial","label":"Exists but hard to find"},{"value":"partial","label":"Verbal only"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"7.2","item_id":"final.arrangements.prepaid","section_id":"7","dimension":"Funeral_Memorial","weight":1,"prompt":"Have any funeral or cremation arrangements been prepaid or set up?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"7.3","item_id":"final.arrangements.guidance","section_id":"7","dimension":"Funeral_Memorial","weight":1,"prompt":"Is there written guidance to help others handle arrangements?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"7.4","item_id":"final.charitable_gifts.documented","section_id":"7","dimension":"Funeral_Memorial","weight":1,"prompt":"Are any charitable gifts at death written down somewhere?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"}],"soft_gates":[],"conditions":{},"routing":{"start":49,"stop":53,"steps":[{"id":"7.1","applies_if_ref":null,"next":[50]},{"id":"7.2","applies_if_ref":null,"next":[51]},{"id":"7.3","applies_if_ref":null,"next":[52]},{"id":"7.4","applies_if_ref":null,"next":[53,54,55]}]},"question_max_points":{"7.1":100.0,"7.2":100.0,"7.3":100.0,"7.4":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:8', '88df2bc7d133124e53aa5971879083146806844c23b52931d3328b2d650bf407', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"88df2bc7d133124e53aa5971879083146806844c23b52931d3328b2d650bf407","section_id":"8","section":{"id":"8","label":"Emotional & Spiritual","dimension":"Emotional_Spiritual","weight":3},"questions":[{"id":"8.1","item_id":"emotional.spiritual_practices.documented","section_id":"8","dimension":"Emotional_Spiritual","weight":1,"prompt":"Are any spiritual or cultural practices written down?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Verbal only"},{"value":"no","label":"No"},{"value":"na","label":"Not applicable"},{"value":"not_sure","label":"Not sure"}],"applies_if":"profile.emotional.has_spiritual_practices == true","system_na":true,"applies_if_ref":"c_dc3a5e24"},{"id":"8.2","item_id":"emotional.spiritual_contacts.list","section_id":"8","dimension":"Emotional_Spiritual","weight":1,"prompt":"Is there a written note about who to contact for spiritual support, if applicable?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"na","label":"Not applicable"},{"value":"not_sure","label":"Not sure"}],"applies_if":"profile.emotional.has_spiritual_practices == true","system_na":true,"applies_if_ref":"c_dc3a5e24"},{"id":"8.3","item_id":"emotional.messages.prepared","section_id":"8","dimension":"Emotional_Spiritual","weight":1,"prompt":"Have you prepared any messages or notes you would want others to receive?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"In progress"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"}],"soft_gates":[],"conditions":{"c_dc3a5e24":{"expression":"profile.emotional.has_spiritual_practices == true","ast":{"op":"eq","profile":"emotional.has_spiritual_practices","value":true},"ops":[["eq","profile","emotional.has_spiritual_practices",true]]}},"routing":{"start":53,"stop":56,"steps":[{"id":"8.1","applies_if_ref":"c_dc3a5e24","next":[54,55]},{"id":"8.2","applies_if_ref":"c_dc3a5e24","next":[55]},{"id":"8.3","applies_if_ref":null,"next":[56,57,58,59,60,61]}]},"question_max_points":{"8.1":100.0,"8.2":100.0,"8.3":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:9', '2e43cceb30ba93f89b14af7b9032a4f64a1f64083130d5d1f0449ea5ec0979d7', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"2e43cceb30ba93f89b14af7b9032a4f64a1f64083130d5d1f0449ea5ec0979d7","section_id":"9","section":{"id":"9","label":"Supporting Aging Parents","dimension":"Supporting_Aging_Parents","weight":2},"questions":[{"id":"9.2","item_id":"parents.legal_permission","section_id":"9","dimension":"Supporting_Aging_Parents","weight":1,"prompt":"If yes, do you have legal permission to help make decisions if needed?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.family.supports_aging_parent == true","system_na":true,"applies_if_ref":"c_c1066466"},{"id":"9.3","item_id":"parents.key_info.list","section_id":"9","dimension":"Supporting_Aging_Parents","weight":1,"prompt":"Is there a list of your parent's key information you could access?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.family.supports_aging_parent == true","system_na":true,"applies_if_ref":"c_c1066466"},{"id":"9.4","item_id":"parents.documents.access_speed","section_id":"9","dimension":"Supporting_Aging_Parents","weight":1,"prompt":"If needed, how quickly could you find their important documents?","type":"single_select","options":[{"value":"yes","label":"Within 24 hours"},{"value":"partial","label":"Within a week"},{"value":"no","label":"Longer"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.family.supports_aging_parent == true","system_na":true,"applies_if_ref":"c_c1066466"}],"soft_gates":[],"conditions":{"c_c1066466":{"expression":"profile.family.supports_aging_parent == true","ast":{"op":"eq","profile":"family.supports_aging_parent","value":true},"ops":[["eq","profile","family.supports_aging_parent",true]]}},"routing":{"start":56,"stop":59,"steps":[{"id":"9.2","applies_if_ref":"c_c1066466","next":[57,58,59,60,61]},{"id":"9.3","applies_if_ref":"c_c1066466","next":[58,59,60,61]},{"id":"9.4","applies_if_ref":"c_c1066466","next":[59,60,61]}]},"question_max_points":{"9.2":100.0,"9.3":100.0,"9.4":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:10', 'a6a275ba0f9fca0902a864e568a5f5a81afd592fdc358f26c21d5be12157a97d', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"a6a275ba0f9fca0902a864e568a5f5a81afd592fdc358f26c21d5be12157a97d","section_id":"10","section":{"id":"10","label":"Home & Personal Property","dimension":"Home_Personal_Property","weight":3},"questions":[{"id":"10.1","item_id":"home.title.documents_access","section_id":"10","dimension":"Home_Personal_Property","weight":1,"prompt":"Are ownership or title documents easy to find?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.home.owns_real_property == true","system_na":true,"applies_if_ref":"c_b78af515"},{"id":"10.2","item_id":"home.maintenance.issues_documented","section_id":"10","dimension":"Home_Personal_Property","weight":1,"prompt":"Are any major home maintenance issues written down?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.home.owns_real_property == true","system_na":true,"applies_if_ref":"c_b78af515"},{"id":"10.3","item_id":"home.belongings.reduced","section_id":"10","dimension":"Home_Personal_Property","weight":1,"prompt":"Have you reduced belongings to make things easier for others?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"10.5","item_id":"home.personal_property.plan","section_id":"10","dimension":"Home_Personal_Property","weight":1,"prompt":"If yes, is there a written list or plan for those items?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"},{"value":"na","label":"Not applicable"}],"applies_if":"profile.home.has_significant_personal_property == true","system_na":true,"applies_if_ref":"c_d99f7134"}],"soft_gates":[],"conditions":{"c_b78af515":{"expression":"profile.home.owns_real_property == true","ast":{"op":"eq","profile":"home.owns_real_property","value":true},"ops":[["eq","profile","home.owns_real_property",true]]},"c_d99f7134":{"expression":"profile.home.has_significant_personal_property == true","ast":{"op":"eq","profile":"home.has_significant_personal_property","value":true},"ops":[["eq","profile","home.has_significant_personal_property",true]]}},"routing":{"start":59,"stop":63,"steps":[{"id":"10.1","applies_if_ref":"c_b78af515","next":[60,61]},{"id":"10.2","applies_if_ref":"c_b78af515","next":[61]},{"id":"10.3","applies_if_ref":null,"next":[62,63]},{"id":"10.5","applies_if_ref":"c_d99f7134","next":[63]}]},"question_max_points":{"10.1":100.0,"10.2":100.0,"10.3":100.0,"10.5":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'section:11', 'd68eeda50fb8e52effd470615de58c0bfdd9825ae923fba535f3e45cd398a8ab', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"d68eeda50fb8e52effd470615de58c0bfdd9825ae923fba535f3e45cd398a8ab","section_id":"11","section":{"id":"11","label":"Document Storage","dimension":"Document_Storage","weight":2},"questions":[{"id":"11.1","item_id":"documents.storage.single_location","section_id":"11","dimension":"Document_Storage","weight":1,"prompt":"Are most important documents kept in one main place?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Multiple locations"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"11.2","item_id":"documents.storage.access_shared","section_id":"11","dimension":"Document_Storage","weight":1,"prompt":"Do trusted people know how to access those documents?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"11.3","item_id":"documents.storage.start_guide","section_id":"11","dimension":"Document_Storage","weight":1,"prompt":"Is there a single 'start here' guide explaining what exists and where it is?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Partial"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"},{"id":"11.4","item_id":"documents.storage.originals_access","section_id":"11","dimension":"Document_Storage","weight":1,"prompt":"Are original documents accessible if needed?","type":"single_select","options":[{"value":"yes","label":"Yes"},{"value":"partial","label":"Access may be difficult"},{"value":"no","label":"No"},{"value":"not_sure","label":"Not sure"}],"applies_if":"always"}],"soft_gates":[],"conditions":{},"routing":{"start":63,"stop":67,"steps":[{"id":"11.1","applies_if_ref":null,"next":[64]},{"id":"11.2","applies_if_ref":null,"next":[65]},{"id":"11.3","applies_if_ref":null,"next":[66]},{"id":"11.4","applies_if_ref":null,"next":[]}]},"question_max_points":{"11.1":100.0,"11.2":100.0,"11.3":100.0,"11.4":100.0}}$json$::jsonb),
+  ('readiness_v1', 'v1', 'tables', '02d0ab6e61d732b927b09400d4071c1b2f2bc242580ee5b1ae7321fd3144f399', $json${"assessment_id":"readiness_v1","version":"v1","content_hash":"02d0ab6e61d732b927b09400d4071c1b2f2bc242580ee5b1ae7321fd3144f399","dependencies":{"answers":{"1.1.A.1":{"questions":["1.1.A.2"],"profile_gates":[],"soft_gates":[0,1]},"1.1.A.3":{"questions":["1.1.A.4"],"profile_gates":[],"soft_gates":[2,3]},"1.1.B.1":{"questions":["1.1.A.7","1.1.B.2","1.1.B.10","1.1.B.11"],"profile_gates":[],"soft_gates":[4,5,6,7,14,15,16,17]},"1.1.B.3":{"questions":["1.1.A.7","1.1.B.4","1.1.B.4a","1.1.B.10","1.1.B.11"],"profile_gates":[],"soft_gates":[4,5,8,9,10,11,14,15,16,17]},"1.1.B.5":{"questions":["1.1.A.7","1.1.B.6","1.1.B.10","1.1.B.11"],"profile_gates":[],"soft_gates":[4,5,12,13,14,15,16,17]},"1.1.B.7":{"questions":["1.1.A.7","1.1.B.10","1.1.B.11","2.4"],"profile_gates":[],"soft_gates":[4,5,14,15,16,17,20,21]},"1.1.B.8":{"questions":["1.1.A.7","1.1.B.10","1.1.B.11"],"profile_gates":[],"soft_gates":[4,5,14,15,16,17]},"2.1":{"questions":["2.2","2.4"],"profile_gates":[],"soft_gates":[18,19,20,21]},"2.3":{"questions":["2.4"],"profile_gates":[],"soft_gates":[20,21]}},"profile":{"financial.has_beneficiary_accounts":{"questions":["3.4","3.5"],"profile_gates":[0],"soft_gates":[]},"pets.has_pets":{"questions":["5.4","5.5"],"profile_gates":[1],"soft_gates":[]},"digital.owns_crypto":{"questions":["6.7"],"profile_gates":[3],"soft_gates":[]},"emotional.has_spiritual_practices":{"questions":["8.1","8.2"],"profile_gates":[2],"soft_gates":[]},"family.supports_aging_parent":{"questions":["9.2","9.3","9.4"],"profile_gates":[4],"soft_gates":[]},"home.owns_real_property":{"questions":["10.1","10.2"],"profile_gates":[5],"soft_gates":[]},"home.has_significant_personal_property":{"questions":["10.5"],"profile_gates":[6],"soft_gates":[]}},"order":["1.1.A.1","1.1.A.2","1.1.A.3","1.1.A.4","1.1.A.5","1.1.A.6","1.1.B.1","1.1.B.2","1.1.B.3","1.1.B.4","1.1.B.4a","1.1.B.5","1.1.B.6","1.1.B.7","1.1.B.8","1.1.A.7","1.1.B.9","1.1.B.10","1.1.B.11","2.1","2.2","2.3","2.4","2.5","2.6","2.7","2.8","3.1","3.2","3.4","3.5","3.6","3.7","3.8","3.9","4.2","4.3","4.4","5.1","5.2","5.4","5.5","6.1","6.2","6.3","6.4","6.5","6.7","6.8","7.1","7.2","7.3","7.4","8.1","8.2","8.3","9.2","9.3","9.4","10.1","10.2","10.3","10.5","11.1","11.2","11.3","11.4"]},"profile_applicability":{"fields":["financial.has_beneficiary_accounts","pets.has_pets","digital.owns_crypto","family.supports_aging_parent","home.owns_real_property","home.has_significant_personal_property","emotional.has_spiritual_practices"],"question_masks":["0x7a09f7cff9fffffff","0x7a09f7cffffffffff","0x7a09f7fff9fffffff","0x7a09f7fffffffffff","0x7a09ffcff9fffffff","0x7a09ffcffffffffff","0x7a09fffff9fffffff","0x7a09fffffffffffff","0x7a79f7cff9fffffff","0x7a79f7cffffffffff","0x7a79f7fff9fffffff","0x7a79f7fffffffffff","0x7a79ffcff9fffffff","0x7a79ffcffffffffff","0x7a79fffff9fffffff","0x7a79fffffffffffff","0x7b89f7cff9fffffff","0x7b89f7cffffffffff","0x7b89f7fff9fffffff","0x7b89f7fffffffffff","0x7b89ffcff9fffffff","0x7b89ffcffffffffff","0x7b89fffff9fffffff","0x7b89fffffffffffff","0x7bf9f7cff9fffffff","0x7bf9f7cffffffffff","0x7bf9f7fff9fffffff","0x7bf9f7fffffffffff","0x7bf9ffcff9fffffff","0x7bf9ffcffffffffff","0x7bf9fffff9fffffff","0x7bf9fffffffffffff","0x7e09f7cff9fffffff","0x7e09f7cffffffffff","0x7e09f7fff9fffffff","0x7e09f7fffffffffff","0x7e09ffcff9fffffff","0x7e09ffcffffffffff","0x7e09fffff9fffffff","0x7e09fffffffffffff","0x7e79f7cff9fffffff","0x7e79f7cffffffffff","0x7e79f7fff9fffffff","0x7e79f7fffffffffff","0x7e79ffcff9fffffff","0x7e79ffcffffffffff","0x7e79fffff9fffffff","0x7e79fffffffffffff","0x7f89f7cff9fffffff","0x7f89f7cffffffffff","0x7f89f7fff9fffffff","0x7f89f7fffffffffff","0x7f89ffcff9fffffff","0x7f89ffcffffffffff","0x7f89fffff9fffffff","0x7f89fffffffffffff","0x7ff9f7cff9fffffff","0x7ff9f7cffffffffff","0x7ff9f7fff9fffffff","0x7ff9f7fffffffffff","0x7ff9ffcff9fffffff","0x7ff9ffcffffffffff","0x7ff9fffff9fffffff","0x7ff9fffffffffffff","0x7a0ff7cff9fffffff","0x7a0ff7cffffffffff","0x7a0ff7fff9fffffff","0x7a0ff7fffffffffff","0x7a0fffcff9fffffff","0x7a0fffcffffffffff","0x7a0ffffff9fffffff","0x7a0ffffffffffffff","0x7a7ff7cff9fffffff","0x7a7ff7cffffffffff","0x7a7ff7fff9fffffff","0x7a7ff7fffffffffff","0x7a7fffcff9fffffff","0x7a7fffcffffffffff","0x7a7ffffff9fffffff","0x7a7ffffffffffffff","0x7b8ff7cff9fffffff","0x7b8ff7cffffffffff","0x7b8ff7fff9fffffff","0x7b8ff7fffffffffff","0x7b8fffcff9fffffff","0x7b8fffcffffffffff","0x7b8ffffff9fffffff","0x7b8ffffffffffffff","0x7bfff7cff9fffffff","0x7bfff7cffffffffff","0x7bfff7fff9fffffff","0x7bfff7fffffffffff","0x7bffffcff9fffffff","0x7bffffcffffffffff","0x7bfffffff9fffffff","0x7bfffffffffffffff","0x7e0ff7cff9fffffff","0x7e0ff7cffffffffff","0x7e0ff7fff9fffffff","0x7e0ff7fffffffffff","0x7e0fffcff9fffffff","0x7e0fffcffffffffff","0x7e0ffffff9fffffff","0x7e0ffffffffffffff","0x7e7ff7cff9fffffff","0x7e7ff7cffffffffff","0x7e7ff7fff9fffffff","0x7e7ff7fffffffffff","0x7e7fffcff9fffffff","0x7e7fffcffffffffff","0x7e7ffffff9fffffff","0x7e7ffffffffffffff","0x7f8ff7cff9fffffff","0x7f8ff7cffffffffff","0x7f8ff7fff9fffffff","0x7f8ff7fffffffffff","0x7f8fffcff9fffffff","0x7f8fffcffffffffff","0x7f8ffffff9fffffff","0x7f8ffffffffffffff","0x7ffff7cff9fffffff","0x7ffff7cffffffffff","0x7ffff7fff9fffffff","0x7ffff7fffffffffff","0x7fffffcff9fffffff","0x7fffffcffffffffff","0x7ffffffff9fffffff","0x7ffffffffffffffff"],"section_counts":[[19,8,6,3,2,6,4,1,0,1,4],[19,8,8,3,2,6,4,1,0,1,4],[19,8,6,3,4,6,4,1,0,1,4],[19,8,8,3,4,6,4,1,0,1,4],[19,8,6,3,2,7,4,1,0,1,4],[19,8,8,3,2,7,4,1,0,1,4],[19,8,6,3,4,7,4,1,0,1,4],[19,8,8,3,4,7,4,1,0,1,4],[19,8,6,3,2,6,4,1,3,1,4],[19,8,8,3,2,6,4,1,3,1,4],[19,8,6,3,4,6,4,1,3,1,4],[19,8,8,3,4,6,4,1,3,1,4],[19,8,6,3,2,7,4,1,3,1,4],[19,8,8,3,2,7,4,1,3,1,4],[19,8,6,3,4,7,4,1,3,1,4],[19,8,8,3,4,7,4,1,3,1,4],[19,8,6,3,2,6,4,1,0,3,4],[19,8,8,3,2,6,4,1,0,3,4],[19,8,6,3,4,6,4,1,0,3,4],[19,8,8,3,4,6,4,1,0,3,4],[19,8,6,3,2,7,4,1,0,3,4],[19,8,8,3,2,7,4,1,0,3,4],[19,8,6,3,4,7,4,1,0,3,4],[19,8,8,3,4,7,4,1,0,3,4],[19,8,6,3,2,6,4,1,3,3,4],[19,8,8,3,2,6,4,1,3,3,4],[19,8,6,3,4,6,4,1,3,3,4],[19,8,8,3,4,6,4,1,3,3,4],[19,8,6,3,2,7,4,1,3,3,4],[19,8,8,3,2,7,4,1,3,3,4],[19,8,6,3,4,7,4,1,3,3,4],[19,8,8,3,4,7,4,1,3,3,4],[19,8,6,3,2,6,4,1,0,2,4],[19,8,8,3,2,6,4,1,0,2,4],[19,8,6,3,4,6,4,1,0,2,4],[19,8,8,3,4,6,4,1,0,2,4],[19,8,6,3,2,7,4,1,0,2,4],[19,8,8,3,2,7,4,1,0,2,4],[19,8,6,3,4,7,4,1,0,2,4],[19,8,8,3,4,7,4,1,0,2,4],[19,8,6,3,2,6,4,1,3,2,4],[19,8,8,3,2,6,4,1,3,2,4],[19,8,6,3,4,6,4,1,3,2,4],[19,8,8,3,4,6,4,1,3,2,4],[19,8,6,3,2,7,4,1,3,2,4],[19,8,8,3,2,7,4,1,3,2,4],[19,8,6,3,4,7,4,1,3,2,4],[19,8,8,3,4,7,4,1,3,2,4],[19,8,6,3,2,6,4,1,0,4,4],[19,8,8,3,2,6,4,1,0,4,4],[19,8,6,3,4,6,4,1,0,4,4],[19,8,8,3,4,6,4,1,0,4,4],[19,8,6,3,2,7,4,1,0,4,4],[19,8,8,3,2,7,4,1,0,4,4],[19,8,6,3,4,7,4,1,0,4,4],[19,8,8,3,4,7,4,1,0,4,4],[19,8,6,3,2,6,4,1,3,4,4],[19,8,8,3,2,6,4,1,3,4,4],[19,8,6,3,4,6,4,1,3,4,4],[19,8,8,3,4,6,4,1,3,4,4],[19,8,6,3,2,7,4,1,3,4,4],[19,8,8,3,2,7,4,1,3,4,4],[19,8,6,3,4,7,4,1,3,4,4],[19,8,8,3,4,7,4,1,3,4,4],[19,8,6,3,2,6,4,3,0,1,4],[19,8,8,3,2,6,4,3,0,1,4],[19,8,6,3,4,6,4,3,0,1,4],[19,8,8,3,4,6,4,3,0,1,4],[19,8,6,3,2,7,4,3,0,1,4],[19,8,8,3,2,7,4,3,0,1,4],[19,8,6,3,4,7,4,3,0,1,4],[19,8,8,3,4,7,4,3,0,1,4],[19,8,6,3,2,6,4,3,3,1,4],[19,8,8,3,2,6,4,3,3,1,4],[19,8,6,3,4,6,4,3,3,1,4],[19,8,8,3,4,6,4,3,3,1,4],[19,8,6,3,2,7,4,3,3,1,4],[19,8,8,3,2,7,4,3,3,1,4],[19,8,6,3,4,7,4,3,3,1,4],[19,8,8,3,4,7,4,3,3,1,4],[19,8,6,3,2,6,4,3,0,3,4],[19,8,8,3,2,6,4,3,0,3,4],[19,8,6,3,4,6,4,3,0,3,4],[19,8,8,3,4,6,4,3,0,3,4],[19,8,6,3,2,7,4,3,0,3,4],[19,8,8,3,2,7,4,3,0,3,4],[19,8,6,3,4,7,4,3,0,3,4],[19,8,8,3,4,7,4,3,0,3,4],[19,8,6,3,2,6,4,3,3,3,4],[19,8,8,3,2,6,4,3,3,3,4],[19,8,6,3,4,6,4,3,3,3,4],[19,8,8,3,4,6,4,3,3,3,4],[19,8,6,3,2,7,4,3,3,3,4],[19,8,8,3,2,7,4,3,3,3,4],[19,8,6,3,4,7,4,3,3,3,4],[19,8,8,3,4,7,4,3,3,3,4],[19,8,6,3,2,6,4,3,0,2,4],[19,8,8,3,2,6,4,3,0,2,4],[19,8,6,3,4,6,4,3,0,2,4],[19,8,8,3,4,6,4,3,0,2,4],[19,8,6,3,2,7,4,3,0,2,4],[19,8,8,3,2,7,4,3,0,2,4],[19,8,6,3,4,7,4,3,0,2,4],[19,8,8,3,4,7,4,3,0,2,4],[19,8,6,3,2,6,4,3,3,2,4],[19,8,8,3,2,6,4,3,3,2,4],[19,8,6,3,4,6,4,3,3,2,4],[19,8,8,3,4,6,4,3,3,2,4],[19,8,6,3,2,7,4,3,3,2,4],[19,8,8,3,2,7,4,3,3,2,4],[19,8,6,3,4,7,4,3,3,2,4],[19,8,8,3,4,7,4,3,3,2,4],[19,8,6,3,2,6,4,3,0,4,4],[19,8,8,3,2,6,4,3,0,4,4],[19,8,6,3,4,6,4,3,0,4,4],[19,8,8,3,4,6,4,3,0,4,4],[19,8,6,3,2,7,4,3,0,4,4],[19,8,8,3,2,7,4,3,0,4,4],[19,8,6,3,4,7,4,3,0,4,4],[19,8,8,3,4,7,4,3,0,4,4],[19,8,6,3,2,6,4,3,3,4,4],[19,8,8,3,2,6,4,3,3,4,4],[19,8,6,3,4,6,4,3,3,4,4],[19,8,8,3,4,6,4,3,3,4,4],[19,8,6,3,2,7,4,3,3,4,4],[19,8,8,3,2,7,4,3,3,4,4],[19,8,6,3,4,7,4,3,3,4,4],[19,8,8,3,4,7,4,3,3,4,4]],"section_masks":[1791,1791,1791,1791,1791,1791,1791,1791,2047,2047,2047,2047,2047,2047,2047,2047,1791,1791,1791,1791,1791,1791,1791,1791,2047,2047,2047,2047,2047,2047,2047,2047,1791,1791,1791,1791,1791,1791,1791,1791,2047,2047,2047,2047,2047,2047,2047,2047,1791,1791,1791,1791,1791,1791,1791,1791,2047,2047,2047,2047,2047,2047,2047,2047,1791,1791,1791,1791,1791,1791,1791,1791,2047,2047,2047,2047,2047,2047,2047,2047,1791,1791,1791,1791,1791,1791,1791,1791,2047,2047,2047,2047,2047,2047,2047,2047,1791,1791,1791,1791,1791,1791,1791,1791,2047,2047,2047,2047,2047,2047,2047,2047,1791,1791,1791,1791,1791,1791,1791,1791,2047,2047,2047,2047,2047,2047,2047,2047]},"routing":{"sections":[{"section_id":"1","start":0,"stop":19},{"section_id":"2","start":19,"stop":27},{"section_id":"3","start":27,"stop":35},{"section_id":"4","start":35,"stop":38},{"section_id":"5","start":38,"stop":42},{"section_id":"6","start":42,"stop":49},{"section_id":"7","start":49,"stop":53},{"section_id":"8","start":53,"stop":56},{"section_id":"9","start":56,"stop":59},{"section_id":"10","start":59,"stop":63},{"section_id":"11","start":63,"stop":67}],"steps":[{"id":"1.1.A.1","applies_if_ref":null,"next":[1,2]},{"id":"1.1.A.2","applies_if_ref":"c_bd26a082","next":[2]},{"id":"1.1.A.3","applies_if_ref":null,"next":[3,4]},{"id":"1.1.A.4","applies_if_ref":"c_c9957568","next":[4]},{"id":"1.1.A.5","applies_if_ref":null,"next":[5]},{"id":"1.1.A.6","applies_if_ref":null,"next":[6,7]},{"id":"1.1.A.7","applies_if_ref":"c_be8dc78e","next":[7]},{"id":"1.1.B.1","applies_if_ref":null,"next":[8,9]},{"id":"1.1.B.2","applies_if_ref":"c_373e5ca7","next":[9]},{"id":"1.1.B.3","applies_if_ref":null,"next":[10,11,12]},{"id":"1.1.B.4","applies_if_ref":"c_f0cea0af","next":[11,12]},{"id":"1.1.B.4a","applies_if_ref":"c_f0cea0af","next":[12]},{"id":"1.1.B.5","applies_if_ref":null,"next":[13,14]},{"id":"1.1.B.6","applies_if_ref":"c_cc9afa90","next":[14]},{"id":"1.1.B.7","applies_if_ref":null,"next":[15]},{"id":"1.1.B.8","applies_if_ref":null,"next":[16]},{"id":"1.1.B.9","applies_if_ref":null,"next":[17,18,19]},{"id":"1.1.B.10","applies_if_ref":"c_be8dc78e","next":[18,19]},{"id":"1.1.B.11","applies_if_ref":"c_be8dc78e","next":[19]},{"id":"2.1","applies_if_ref":null,"next":[20,21]},{"id":"2.2","applies_if_ref":"c_21f0f63c","next":[21]},{"id":"2.3","applies_if_ref":null,"next":[22,23]},{"id":"2.4","applies_if_ref":"c_4c3f9770","next":[23]},{"id":"2.5","applies_if_ref":null,"next":[24]},{"id":"2.6","applies_if_ref":null,"next":[25]},{"id":"2.7","applies_if_ref":null,"next":[26]},{"id":"2.8","applies_if_ref":null,"next":[27]},{"id":"3.1","applies_if_ref":null,"next":[28]},{"id":"3.2","applies_if_ref":null,"next":[29,30,31]},{"id":"3.4","applies_if_ref":"c_5e6adc87","next":[30,31]},{"id":"3.5","applies_if_ref":"c_5e6adc87","next":[31]},{"id":"3.6","applies_if_ref":null,"next":[32]},{"id":"3.7","applies_if_ref":null,"next":[33]},{"id":"3.8","applies_if_ref":null,"next":[34]},{"id":"3.9","applies_if_ref":null,"next":[35]},{"id":"4.2","applies_if_ref":null,"next":[36]},{"id":"4.3","applies_if_ref":null,"next":[37]},{"id":"4.4","applies_if_ref":null,"next":[38]},{"id":"5.1","applies_if_ref":null,"next":[39]},{"id":"5.2","applies_if_ref":null,"next":[40,41,42]},{"id":"5.4","applies_if_ref":"c_13f13693","next":[41,42]},{"id":"5.5","applies_if_ref":"c_13f13693","next":[42]},{"id":"6.1","applies_if_ref":null,"next":[43]},{"id":"6.2","applies_if_ref":null,"next":[44]},{"id":"6.3","applies_if_ref":null,"next":[45]},{"id":"6.4","applies_if_ref":null,"next":[46]},{"id":"6.5","applies_if_ref":null,"next":[47,48]},{"id":"6.7","applies_if_ref":"c_d75da198","next":[48]},{"id":"6.8","applies_if_ref":null,"next":[49]},{"id":"7.1","applies_if_ref":null,"next":[50]},{"id":"7.2","applies_if_ref":null,"next":[51]},{"id":"7.3","applies_if_ref":null,"next":[52]},{"id":"7.4","applies_if_ref":null,"next":[53,54,55]},{"id":"8.1","applies_if_ref":"c_dc3a5e24","next":[54,55]},{"id":"8.2","applies_if_ref":"c_dc3a5e24","next":[55]},{"id":"8.3","applies_if_ref":null,"next":[56,57,58,59,60,61]},{"id":"9.2","applies_if_ref":"c_c1066466","next":[57,58,59,60,61]},{"id":"9.3","applies_if_ref":"c_c1066466","next":[58,59,60,61]},{"id":"9.4","applies_if_ref":"c_c1066466","next":[59,60,61]},{"id":"10.1","applies_if_ref":"c_b78af515","next":[60,61]},{"id":"10.2","applies_if_ref":"c_b78af515","next":[61]},{"id":"10.3","applies_if_ref":null,"next":[62,63]},{"id":"10.5","applies_if_ref":"c_d99f7134","next":[63]},{"id":"11.1","applies_if_ref":null,"next":[64]},{"id":"11.2","applies_if_ref":null,"next":[65]},{"id":"11.3","applies_if_ref":null,"next":[66]},{"id":"11.4","applies_if_ref":null,"next":[]}]},"score_tables":{"band_lookup":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"section_weight_total":100,"section_weight_shares":{"1":0.25,"2":0.15,"3":0.2,"4":0.1,"5":0.1,"6":0.05,"7":0.05,"8":0.03,"9":0.02,"10":0.03,"11":0.02},"question_max_points":{"1.1.A.1":100.0,"1.1.A.2":100.0,"1.1.A.3":100.0,"1.1.A.4":100.0,"1.1.A.5":100.0,"1.1.A.6":100.0,"1.1.A.7":100.0,"1.1.B.1":100.0,"1.1.B.2":100.0,"1.1.B.3":100.0,"1.1.B.4":100.0,"1.1.B.4a":100.0,"1.1.B.5":100.0,"1.1.B.6":100.0,"1.1.B.7":100.0,"1.1.B.8":100.0,"1.1.B.9":100.0,"1.1.B.10":100.0,"1.1.B.11":100.0,"2.1":100.0,"2.2":100.0,"2.3":100.0,"2.4":100.0,"2.5":100.0,"2.6":100.0,"2.7":100.0,"2.8":100.0,"3.1":100.0,"3.2":100.0,"3.4":100.0,"3.5":100.0,"3.6":100.0,"3.7":100.0,"3.8":100.0,"3.9":100.0,"4.2":100.0,"4.3":100.0,"4.4":100.0,"5.1":100.0,"5.2":100.0,"5.4":100.0,"5.5":100.0,"6.1":100.0,"6.2":100.0,"6.3":100.0,"6.4":100.0,"6.5":100.0,"6.7":100.0,"6.8":100.0,"7.1":100.0,"7.2":100.0,"7.3":100.0,"7.4":100.0,"8.1":100.0,"8.2":100.0,"8.3":100.0,"9.2":100.0,"9.3":100.0,"9.4":100.0,"10.1":100.0,"10.2":100.0,"10.3":100.0,"10.5":100.0,"11.1":100.0,"11.2":100.0,"11.3":100.0,"11.4":100.0},"section_max_points":{"1":1900.0,"2":800.0,"3":800.0,"4":300.0,"5":400.0,"6":700.0,"7":400.0,"8":300.0,"9":300.0,"10":400.0,"11":400.0}},"encoding":{"layout":1,"answer_bits":3,"profile_bits":2,"answer_codes":{"yes":1,"partial":2,"no":3,"not_sure":4,"na":5},"next_answer_code":6,"profile_codes":{"unknown":0,"false":1,"true":2},"profile_capacity":16,"profile_slots":8,"profile_fields":{"financial.has_beneficiary_accounts":0,"household.has_dependents":1,"pets.has_pets":2,"digital.owns_crypto":3,"family.supports_aging_parent":4,"home.owns_real_property":5,"home.has_significant_personal_property":6,"emotional.has_spiritual_practices":7},"question_slots":67,"questions":{"1.1.A.1":0,"1.1.A.2":1,"1.1.A.3":2,"1.1.A.4":3,"1.1.A.5":4,"1.1.A.6":5,"1.1.A.7":6,"1.1.B.1":7,"1.1.B.2":8,"1.1.B.3":9,"1.1.B.4":10,"1.1.B.4a":11,"1.1.B.5":12,"1.1.B.6":13,"1.1.B.7":14,"1.1.B.8":15,"1.1.B.9":16,"1.1.B.10":17,"1.1.B.11":18,"2.1":19,"2.2":20,"2.3":21,"2.4":22,"2.5":23,"2.6":24,"2.7":25,"2.8":26,"3.1":27,"3.2":28,"3.4":29,"3.5":30,"3.6":31,"3.7":32,"3.8":33,"3.9":34,"4.2":35,"4.3":36,"4.4":37,"5.1":38,"5.2":39,"5.4":40,"5.5":41,"6.1":42,"6.2":43,"6.3":44,"6.4":45,"6.5":46,"6.7":47,"6.8":48,"7.1":49,"7.2":50,"7.3":51,"7.4":52,"8.1":53,"8.2":54,"8.3":55,"9.2":56,"9.3":57,"9.4":58,"10.1":59,"10.2":60,"10.3":61,"10.5":62,"11.1":63,"11.2":64,"11.3":65,"11.4":66},"byte_length":35,"digests":["90a0194a"]}}$json$::jsonb)
+on conflict (assessment_id, version, shard_key)
+ do update set content_hash = excluded.content_hash,
+   shard_json = excluded.shard_json,
+   updated_at = now();
+
+delete from readiness_v1.assessment_schema_shards
+where assessment_id = 'readiness_v1'
+  and version = 'v1'
+  and shard_key not in ('index', 'section:1', 'section:2', 'section:3', 'section:4', 'section:5', 'section:6', 'section:7', 'section:8', 'section:9', 'section:10', 'section:11', 'tables');
@@ -0,0 +1,246 @@
+"""Benchmarks for schema generation, condition evaluation and scoring.
+
+Usage::
+
+    python supabase/seed/bench_readiness.py --output bench.json
+    python supabase/seed/bench_readiness.py --compare bench.json --threshold 0.25
+    python supabase/seed/bench_readiness.py --population synthetic --sizes 1000,100000
+
+Populations are uniformly random matrices by default; ``--population
+synthetic`` uses gate-respecting records from ``readiness_population``.
+Each case reports the best wall time over ``--repeat`` runs. Results are
+saved as JSON so a later run can be compared against them; ``--compare``
+exits non-zero when any shared case got slower than the threshold allows.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from generate_readiness_schema import build_schema
+from readiness_batch import BatchScorer, load_schema
+from readiness_conditions import (
+    ApplicabilityCache,
+    applicable_questions,
+    compile_condition_table,
+    compile_schema,
+    evaluate_condition_table,
+    evaluate_ops,
+)
+from readiness_gains import GainEngine
+from readiness_population import PopulationGenerator
+from readiness_state import AssessmentState
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+# Per-assessment Python paths are far slower than NumPy; cap their size.
+PYTHON_SIZE_LIMIT = 100_000
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_population(scorer: BatchScorer, size: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Uniformly random encoded answers and profiles; ignores gates on purpose."""
+    rng = np.random.default_rng(seed)
+    answers = rng.integers(
+        0, len(scorer.answer_values) + 1, (size, len(scorer.question_ids)), dtype=np.uint8
+    )
+    profile = rng.integers(-1, 2, (size, len(scorer.profile_fields)), dtype=np.int8)
+    return answers, profile
+
+
+def synthetic_population(
+    scorer: BatchScorer, size: int, seed: int
+) -> tuple[np.ndarray, np.ndarray]:
+    generator = PopulationGenerator(scorer.schema, seed=seed)
+    return scorer.encode((r["answers"], r["profile"]) for r in generator.records(size))
+
+
+def decode_population(
+    scorer: BatchScorer, answers: np.ndarray, profile: np.ndarray
+) -> list[tuple[dict, dict]]:
+    values = [None, *scorer.answer_values]
+    records = []
+    for answer_row, profile_row in zip(answers.tolist(), profile.tolist()):
+        record_answers = {
+            qid: values[code] for qid, code in zip(scorer.question_ids, answer_row) if code
+        }
+        record_profile: dict = {}
+        for field, code in zip(scorer.profile_fields, profile_row):
+            if code >= 0:
+                group, name = field.split(".", 1)
+                record_profile.setdefault(group, {})[name] = bool(code)
+        records.append((record_answers, record_profile))
+    return records
+
+
+def run_benchmarks(
+    sizes: list[int], repeat: int, seed: int, population: str = "uniform"
+) -> list[dict]:
+    schema = load_schema()
+    scorer = BatchScorer(schema)
+    engine = GainEngine(schema)
+    results: list[dict] = []
+
+    def record(name: str, size: int, seconds: float) -> None:
+        results.append(
+            {
+                "name": name,
+                "size": size,
+                "seconds": seconds,
+                "per_item_us": seconds / size * 1e6 if size else None,
+            }
+        )
+        print(f"{name:<36} {size:>9,} {seconds * 1000:>11.2f} ms", file=sys.stderr)
+
+    record("generate.build_schema", 1, measure(build_schema, repeat))
+    record(
+        "serialize.dumps_indent",
+        1,
+        measure(lambda: json.dumps(schema, indent=2, ensure_ascii=True), repeat),
+    )
+    record(
+        "serialize.dumps_compact",
+        1,
+        measure(lambda: json.dumps(schema, separators=(",", ":")), repeat),
+    )
+    text = json.dumps(schema)
+    record("serialize.loads", 1, measure(lambda: json.loads(text), repeat))
+
+    compiled = compile_schema(schema)
+    table = schema.get("conditions", {})
+    compiled_table = compile_condition_table(table)
+    for size in sizes:
+        build = synthetic_population if population == "synthetic" else random_population
+        answers, profile = build(scorer, size, seed)
+        record(
+            "applicability.numpy",
+            size,
+            measure(lambda: scorer.applicability(answers, profile), repeat),
+        )
+        record("score.numpy", size, measure(lambda: scorer.score_batch(answers, profile), repeat))
+        record("gains.numpy", size, measure(lambda: engine.gains(answers, profile), repeat))
+        if size > PYTHON_SIZE_LIMIT:
+            continue
+
+        decoded = decode_population(scorer, answers, profile)
+        record(
+            "applicability.closures",
+            size,
+            measure(lambda: [applicable_questions(compiled, a, p) for a, p in decoded], repeat),
+        )
+
+        def cached_applicability() -> list[tuple[bool, ...]]:
+            cache = ApplicabilityCache(schema)
+            return [cache.applicable(a, p) for a, p in decoded]
+
+        record("applicability.cached", size, measure(cached_applicability, repeat))
+        record(
+            "applicability.condition_table",
+            size,
+            measure(
+                lambda: [evaluate_condition_table(compiled_table, a, p) for a, p in decoded],
+                repeat,
+            ),
+        )
+        record(
+            "applicability.ops",
+            size,
+            measure(
+                lambda: [
+                    [evaluate_ops(entry["ops"], a, p) for entry in table.values()]
+                    for a, p in decoded
+                ],
+                repeat,
+            ),
+        )
+        record(
+            "score.assessment_state",
+            size,
+            measure(
+                lambda: [AssessmentState(schema, a, p).overall_score for a, p in decoded],
+                repeat,
+            ),
+        )
+
+        def replay_cached() -> list[int]:
+            cache = ApplicabilityCache(schema)
+            return [
+                AssessmentState(schema, a, p, applicability=cache).overall_score
+                for a, p in decoded
+            ]
+
+        record("score.assessment_state_cached", size, measure(replay_cached, repeat))
+    return results
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    previous = {(item["name"], item["size"]): item["seconds"] for item in baseline["results"]}
+    regressions = []
+    for item in results:
+        before = previous.get((item["name"], item["size"]))
+        if before and item["seconds"] > before * (1 + threshold):
+            regressions.append(
+                f"{item['name']} @ {item['size']:,}: {before * 1000:.2f} ms -> "
+                f"{item['seconds'] * 1000:.2f} ms (+{(item['seconds'] / before - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated population sizes",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--population", choices=("uniform", "synthetic"), default="uniform")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--compare", type=Path, help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown ratio")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    results = run_benchmarks(sizes, args.repeat, args.seed, args.population)
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "schema_hash": load_schema().get("content_hash"),
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "population": args.population,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
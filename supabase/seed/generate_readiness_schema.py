@@ -1,6 +1,58 @@
 
+"""Readiness schema definition and generator.
+
+``build_schema()`` assembles the schema in memory without touching the disk,
+so scoring workers can import this module and build or share it at
+startup. Running the module writes the seed JSON, the per-section shards
+and the migration, which also carries the
+``readiness_v1.score_assessments`` SQL scoring function and the shard rows
+whenever they change (see ``--help``).
+
+Migrations carry ``served_schema``, the seed document without the derived
+tables that live in the ``tables`` shard row. They are always new files: the
+first one upserts the whole row and every shard row (as does ``--full``);
+later ones are patches guarded on the ``content_hash`` that the newest
+generated migration leaves in the database.
+"""
+
+import argparse
+import copy
 import json
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Mapping
+
+from readiness_artifacts import (
+    full_migration_sql,
+    json_patch,
+    patch_migration_sql,
+    stored_content_hash,
+    with_built_at,
+    with_content_hash,
+    write_if_changed,
+)
+from readiness_conditions import validate_schema_conditions
+from readiness_shards import (
+    build_shards,
+    read_index,
+    served_schema,
+    shard_files,
+    shard_rows_sql,
+    table_shard_ref,
+)
+from readiness_sql import SCORING_FUNCTION, scoring_function_sql
+from readiness_v1_encoding import ENCODING
+from readiness_tables import (
+    build_dependency_index,
+    build_encoding,
+    build_profile_applicability,
+    build_routing_table,
+    build_score_tables,
+    derive_soft_gates,
+    intern_conditions,
+)
 
 
 def option(value: str, label: str, score_value: str | None = None) -> dict:
@@ -42,18 +94,28 @@ def question(
     return payload
 
 
-def gate(when: str, when_na: str, question_id: str) -> list[dict]:
-    return [
-        {"when": when, "questions": [question_id], "result": "ask"},
-        {"when": when_na, "questions": [question_id], "result": "na", "flag": "follow_up"},
-    ]
+def profile_gate(when: str, questions: list[str]) -> dict:
+    return {
+        "when": when,
+        "questions": questions,
+        "result": "na",
+        "flag": "not_applicable",
+    }
 
 
 ROOT = Path(__file__).resolve().parents[2]
 SCHEMA_PATH = ROOT / "supabase" / "seed" / "readiness_v1_schema.json"
-MIGRATION_PATH = (
-    ROOT / "supabase" / "migrations" / "20260109005000_update_readiness_schema.sql"
-)
+SHARDS_DIR = ROOT / "supabase" / "seed" / "readiness_v1_shards"
+ENCODING_PATH = ROOT / "supabase" / "seed" / "readiness_v1_encoding.py"
+ENCODING_SOURCE_HEADER = '''"""Packing slots of the readiness_v1 encoding, kept for every later build.
+
+Written by generate_readiness_schema.py; do not edit by hand. Stored packed
+assessments depend on these slots, so ``build_schema`` always extends this
+table instead of assigning slots from scratch (see ``build_encoding``).
+"""
+
+'''
+MIGRATIONS_DIR = ROOT / "supabase" / "migrations"
 
 dimensions = [
     {"id": "Legal_Planning", "label": "Legal Planning & Decision Makers"},
@@ -214,7 +276,7 @@ profile_questions = [
     {
         "id": "profile.emotional.has_spiritual_practices",
         "field": "emotional.has_spiritual_practices",
-        "prompt": "Do you have spiritual or cultural practices you'd want included?",
+        "prompt": "Do you have spiritual or cultural practices you would want included?",
         "type": "single_select",
         "options": [
             {"value": "yes", "label": "Yes"},
@@ -225,48 +287,13 @@ profile_questions = [
 ]
 
 profile_gates = [
-    {
-        "when": "profile.financial.has_beneficiary_accounts == false",
-        "questions": ["3.4", "3.5"],
-        "result": "na",
-        "flag": "not_applicable",
-    },
-    {
-        "when": "profile.pets.has_pets == false",
-        "questions": ["5.4", "5.5"],
-        "result": "na",
-        "flag": "not_applicable",
-    },
-    {
-        "when": "profile.emotional.has_spiritual_practices == false",
-        "questions": ["8.1", "8.2"],
-        "result": "na",
-        "flag": "not_applicable",
-    },
-    {
-        "when": "profile.digital.owns_crypto == false",
-        "questions": ["6.7"],
-        "result": "na",
-        "flag": "not_applicable",
-    },
-    {
-        "when": "profile.family.supports_aging_parent == false",
-        "questions": ["9.2", "9.3", "9.4"],
-        "result": "na",
-        "flag": "not_applicable",
-    },
-    {
-        "when": "profile.home.owns_real_property == false",
-        "questions": ["10.1", "10.2"],
-        "result": "na",
-        "flag": "not_applicable",
-    },
-    {
-        "when": "profile.home.has_significant_personal_property == false",
-        "questions": ["10.5"],
-        "result": "na",
-        "flag": "not_applicable",
-    },
+    profile_gate("profile.financial.has_beneficiary_accounts == false", ["3.4", "3.5"]),
+    profile_gate("profile.pets.has_pets == false", ["5.4", "5.5"]),
+    profile_gate("profile.emotional.has_spiritual_practices == false", ["8.1", "8.2"]),
+    profile_gate("profile.digital.owns_crypto == false", ["6.7"]),
+    profile_gate("profile.family.supports_aging_parent == false", ["9.2", "9.3", "9.4"]),
+    profile_gate("profile.home.owns_real_property == false", ["10.1", "10.2"]),
+    profile_gate("profile.home.has_significant_personal_property == false", ["10.5"]),
 ]
 
 questions = [
@@ -1219,130 +1246,197 @@ questions = [
         ],
     ),
 ]
-soft_gates: list[dict] = []
-soft_gates += gate(
-    "answers['1.1.A.1'] in ['yes','partial']",
-    "answers['1.1.A.1'] in ['no','not_sure']",
-    "1.1.A.2",
-)
-soft_gates += gate(
-    "answers['1.1.A.3'] in ['yes','partial']",
-    "answers['1.1.A.3'] in ['no','not_sure']",
-    "1.1.A.4",
-)
-soft_gates += gate(
-    "answers['1.1.B.1'] in ['yes','partial']",
-    "answers['1.1.B.1'] in ['no','not_sure']",
-    "1.1.B.2",
-)
-soft_gates += gate(
-    "answers['1.1.B.3'] in ['yes','partial']",
-    "answers['1.1.B.3'] in ['no','not_sure']",
-    "1.1.B.4",
-)
-soft_gates += gate(
-    "answers['1.1.B.3'] in ['yes','partial']",
-    "answers['1.1.B.3'] in ['no','not_sure']",
-    "1.1.B.4a",
-)
-soft_gates += gate(
-    "answers['1.1.B.5'] in ['yes','partial']",
-    "answers['1.1.B.5'] in ['no','not_sure']",
-    "1.1.B.6",
-)
-soft_gates += gate(
-    "answers['1.1.B.1'] in ['yes','partial'] or "
-    "answers['1.1.B.3'] in ['yes','partial'] or "
-    "answers['1.1.B.5'] in ['yes','partial'] or "
-    "answers['1.1.B.7'] in ['yes','partial'] or "
-    "answers['1.1.B.8'] in ['yes','partial']",
-    "answers['1.1.B.1'] in ['no','not_sure'] and "
-    "answers['1.1.B.3'] in ['no','not_sure'] and "
-    "answers['1.1.B.5'] in ['no','not_sure'] and "
-    "answers['1.1.B.7'] in ['no','not_sure'] and "
-    "answers['1.1.B.8'] in ['no','not_sure']",
-    "1.1.A.7",
-)
-soft_gates += gate(
-    "answers['1.1.B.1'] in ['yes','partial'] or "
-    "answers['1.1.B.3'] in ['yes','partial'] or "
-    "answers['1.1.B.5'] in ['yes','partial'] or "
-    "answers['1.1.B.7'] in ['yes','partial'] or "
-    "answers['1.1.B.8'] in ['yes','partial']",
-    "answers['1.1.B.1'] in ['no','not_sure'] and "
-    "answers['1.1.B.3'] in ['no','not_sure'] and "
-    "answers['1.1.B.5'] in ['no','not_sure'] and "
-    "answers['1.1.B.7'] in ['no','not_sure'] and "
-    "answers['1.1.B.8'] in ['no','not_sure']",
-    "1.1.B.10",
-)
-soft_gates += gate(
-    "answers['1.1.B.1'] in ['yes','partial'] or "
-    "answers['1.1.B.3'] in ['yes','partial'] or "
-    "answers['1.1.B.5'] in ['yes','partial'] or "
-    "answers['1.1.B.7'] in ['yes','partial'] or "
-    "answers['1.1.B.8'] in ['yes','partial']",
-    "answers['1.1.B.1'] in ['no','not_sure'] and "
-    "answers['1.1.B.3'] in ['no','not_sure'] and "
-    "answers['1.1.B.5'] in ['no','not_sure'] and "
-    "answers['1.1.B.7'] in ['no','not_sure'] and "
-    "answers['1.1.B.8'] in ['no','not_sure']",
-    "1.1.B.11",
-)
-soft_gates += gate(
-    "answers['2.1'] in ['yes','partial']",
-    "answers['2.1'] in ['no','not_sure']",
-    "2.2",
-)
-soft_gates += gate(
-    "answers['2.1'] in ['yes','partial'] or "
-    "answers['2.3'] in ['yes','partial'] or "
-    "answers['1.1.B.7'] in ['yes','partial']",
-    "answers['2.1'] in ['no','not_sure'] and "
-    "answers['2.3'] in ['no','not_sure'] and "
-    "answers['1.1.B.7'] in ['no','not_sure']",
-    "2.4",
-)
 
-schema = {
-    "assessment_id": "readiness_v1",
-    "version": "v1",
-    "dimensions": dimensions,
-    "sections": sections,
-    "profile_questions": profile_questions,
-    "profile_gates": profile_gates,
-    "soft_gates": soft_gates,
-    "answer_scoring": {
-        "yes": 1.0,
-        "partial": 0.5,
-        "no": 0.0,
-        "not_sure": 0.25,
-        "na": None,
-    },
-    "flags": {
-        "review_on": ["not_sure"],
-        "follow_up_on": ["na"],
-        "risk_on": [],
-    },
-    "score_bands": [
-        {"min": 80, "max": 100, "label": "Highly Prepared"},
-        {"min": 60, "max": 79, "label": "Moderately Prepared"},
-        {"min": 40, "max": 59, "label": "Limited Preparedness"},
-        {"min": 0, "max": 39, "label": "Low Readiness / High Risk"},
-    ],
-    "questions": questions,
-}
 
-SCHEMA_PATH.write_text(json.dumps(schema, indent=2, ensure_ascii=True), encoding="utf-8")
+def build_schema() -> dict:
+    """Assemble the full readiness schema in memory, including derived tables.
+
+    Every call returns a new document; nothing is read from or written to
+    disk. Packing slots come from the checked-in ``readiness_v1_encoding``
+    (see ``build_encoding``), so every build assigns the same ones. Use
+    ``cached_schema``/``schema_json`` to share one build.
+    """
+    schema = {
+        "assessment_id": "readiness_v1",
+        "version": "v1",
+        "dimensions": copy.deepcopy(dimensions),
+        "sections": copy.deepcopy(sections),
+        "profile_questions": copy.deepcopy(profile_questions),
+        "profile_gates": copy.deepcopy(profile_gates),
+        "soft_gates": [],
+        "answer_scoring": {
+            "yes": 1.0,
+            "partial": 0.5,
+            "no": 0.0,
+            "not_sure": 0.25,
+            "na": None,
+        },
+        "flags": {
+            "review_on": ["not_sure"],
+            "follow_up_on": ["na"],
+            "risk_on": [],
+        },
+        "score_bands": [
+            {"min": 80, "max": 100, "label": "Highly Prepared"},
+            {"min": 60, "max": 79, "label": "Moderately Prepared"},
+            {"min": 40, "max": 59, "label": "Limited Preparedness"},
+            {"min": 0, "max": 39, "label": "Low Readiness / High Risk"},
+        ],
+        "questions": copy.deepcopy(questions),
+    }
+
+    validate_schema_conditions(schema)
+    schema["soft_gates"] = derive_soft_gates(schema)
+    schema["dependencies"] = build_dependency_index(schema)
+    schema["profile_applicability"] = build_profile_applicability(schema)
+    schema["conditions"] = intern_conditions(schema)
+    schema["routing"] = build_routing_table(schema)
+    schema["score_tables"] = build_score_tables(schema)
+    schema["encoding"] = build_encoding(schema, ENCODING)
+    schema["table_shard"] = table_shard_ref(schema)
+    return with_content_hash(schema)
+
+
+def read_previous_schema(path: Path) -> dict | None:
+    try:
+        previous = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return previous if isinstance(previous, dict) else None
+
+
+@lru_cache(maxsize=1)
+def cached_schema() -> dict:
+    """Shared ``build_schema()`` for in-process callers; treat it as read-only.
+
+    Pure like ``build_schema``: it has no ``built_at``, which ``main`` stamps
+    from the previous seed file.
+    """
+    return build_schema()
+
+
+@lru_cache(maxsize=1)
+def schema_json() -> str:
+    """``cached_schema`` serialized like ``readiness_v1_schema.json``."""
+    return dump_schema_json(cached_schema())
+
+
+def encoding_source(encoding: Mapping) -> str:
+    """``readiness_v1_encoding.py`` holding ``encoding`` for the next build."""
+    return ENCODING_SOURCE_HEADER + f"ENCODING = {json.dumps(encoding, indent=4)}\n"
+
+
+def dump_schema_json(schema: Mapping) -> str:
+    return json.dumps(schema, indent=2, ensure_ascii=True)
+
+
+def served_schema_json(schema: Mapping) -> str:
+    """The ``schema_json`` row a full upsert writes (see ``served_schema``)."""
+    return dump_schema_json(served_schema(schema))
+
+
+def scoring_function_current(sql: str) -> bool:
+    """Whether the newest migration that defines the scoring function has ``sql``."""
+    marker = f"create or replace function {SCORING_FUNCTION}("
+    for path in sorted(MIGRATIONS_DIR.glob("*.sql"), reverse=True):
+        text = path.read_text(encoding="utf-8")
+        if marker in text:
+            return sql in text
+    return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate the readiness schema and migration.")
+    parser.add_argument("--force", action="store_true", help="rewrite outputs even if unchanged")
+    parser.add_argument(
+        "--check", action="store_true", help="exit non-zero if outputs are stale, write nothing"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="write a new migration upserting the whole schema instead of a patch migration",
+    )
+    args = parser.parse_args(argv)
+
+    previous = read_previous_schema(SCHEMA_PATH)
+    schema = with_built_at(build_schema(), previous)
+    new_hash = schema["content_hash"]
+    previous_hash = previous.get("content_hash") if previous else None
+    # What the database holds once every migration has run, not what the seed says.
+    stored_hash = stored_content_hash(MIGRATIONS_DIR)
+    scoring = scoring_function_sql(schema)
+    scoring_current = scoring_function_current(scoring)
+    full = args.full or stored_hash is None
+    index, shards = build_shards(schema)
+    # A full upsert carries every shard row, so it stands on its own.
+    previous_index = None if full else read_index(SHARDS_DIR)
+    shards_sql = shard_rows_sql(index, shards, previous_index)
+    up_to_date = (
+        previous == schema
+        and ENCODING == schema["encoding"]
+        and stored_hash == new_hash
+        and shards_sql is None
+        and scoring_current
+    )
+    if args.check:
+        print(f"readiness schema {new_hash[:12]}: {'up to date' if up_to_date else 'stale'}")
+        return 0 if up_to_date else 1
+    if up_to_date and not args.force:
+        print(f"readiness schema {new_hash[:12]} unchanged, nothing written")
+        return 0
+
+    if not full and previous_hash != stored_hash:
+        # Patches are diffed against the seed file, so it must match the stored row.
+        print(
+            f"{SCHEMA_PATH.name} is at {str(previous_hash)[:12]} but the migrations leave "
+            f"{stored_hash[:12]}; rerun with --full",
+            file=sys.stderr,
+        )
+        return 1
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    outputs = [
+        (SCHEMA_PATH, dump_schema_json(schema)),
+        (ENCODING_PATH, encoding_source(schema["encoding"])),
+    ]
+    SHARDS_DIR.mkdir(exist_ok=True)
+    outputs += [(SHARDS_DIR / name, text) for name, text in shard_files(index, shards).items()]
+    extra_sql = [] if scoring_current else [scoring]
+    if shards_sql is not None:
+        extra_sql.append(shards_sql)
+
+    # Applied migrations are never edited: every write is a new migration.
+    # Hash-excluded keys such as built_at can change on their own; patch them too.
+    if full:
+        sql = full_migration_sql(
+            served_schema_json(schema),
+            assessment_id=schema["assessment_id"],
+            version=schema["version"],
+            new_hash=new_hash,
+        )
+        sql = "\n".join([sql, *extra_sql])
+        outputs.append((MIGRATIONS_DIR / f"{stamp}_update_readiness_schema.sql", sql))
+    elif previous != schema:
+        sql = patch_migration_sql(
+            json_patch(served_schema(previous), served_schema(schema)),
+            assessment_id=schema["assessment_id"],
+            version=schema["version"],
+            old_hash=stored_hash,
+            new_hash=new_hash,
+        )
+        sql = "\n".join([sql, *extra_sql])
+        outputs.append((MIGRATIONS_DIR / f"{stamp}_patch_readiness_schema.sql", sql))
+    elif extra_sql:
+        sync_path = MIGRATIONS_DIR / f"{stamp}_sync_readiness_schema.sql"
+        outputs.append((sync_path, "\n".join(extra_sql)))
+
+    written = [
+        path for path, text in outputs if write_if_changed(path, text, force=args.force)
+    ]
+    for path in written:
+        print(f"wrote {path.relative_to(ROOT)}")
+    return 0
 
-schema_json = json.dumps(schema, indent=2, ensure_ascii=True)
-sql = f"""-- Update readiness schema
-insert into readiness_v1.assessment_schemas (assessment_id, version, schema_json)
-values ('readiness_v1', 'v1', $$
-{schema_json}
-$$::jsonb)
-on conflict (assessment_id, version)
- do update set schema_json = excluded.schema_json;
-"""
 
-MIGRATION_PATH.write_text(sql, encoding="utf-8")
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""Content hashing and atomic, skip-if-unchanged writes for generated files."""
+
+import hashlib
+import json
+import os
+import re
+import stat
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Mapping
+
+HASH_KEY = "content_hash"
+BUILT_AT_KEY = "built_at"
+HASH_EXCLUDED_KEYS = (HASH_KEY, BUILT_AT_KEY)
+
+# Generated schema migrations name the content hash they leave behind.
+_SCHEMA_WRITE_RE = re.compile(
+    r"^\s*(?:insert\s+into|update)\s+readiness_v1\.assessment_schemas\b", re.I | re.M
+)
+_STORED_HASH_RE = re.compile(r"^-- (?:Update|Patch) readiness schema .*-> ([0-9a-f]{64})", re.M)
+
+
+def content_hash(schema: Mapping) -> str:
+    """SHA-256 over the canonical JSON of the schema, ignoring volatile keys."""
+    payload = {key: value for key, value in schema.items() if key not in HASH_EXCLUDED_KEYS}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def with_content_hash(schema: Mapping, *, after: str = "version") -> dict:
+    """Return a copy with ``content_hash`` placed right after ``after``."""
+    digest = content_hash(schema)
+    result: dict = {}
+    for key, value in schema.items():
+        if key == HASH_KEY:
+            continue
+        result[key] = value
+        if key == after:
+            result[HASH_KEY] = digest
+    result.setdefault(HASH_KEY, digest)
+    return result
+
+
+def with_built_at(
+    schema: Mapping, previous: Mapping | None = None, *, now: datetime | None = None
+) -> dict:
+    """Return a copy with ``built_at`` placed right after ``content_hash``.
+
+    The previous document's timestamp is kept while its hash is unchanged,
+    so regenerating identical content does not touch the output.
+    """
+    if previous and previous.get(HASH_KEY) == schema[HASH_KEY] and previous.get(BUILT_AT_KEY):
+        built_at = previous[BUILT_AT_KEY]
+    else:
+        built_at = (now or datetime.now(timezone.utc)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    result: dict = {}
+    for key, value in schema.items():
+        if key == BUILT_AT_KEY:
+            continue
+        result[key] = value
+        if key == HASH_KEY:
+            result[BUILT_AT_KEY] = built_at
+    return result
+
+
+def read_content_hash(path: Path) -> str | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get(HASH_KEY)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _file_mode(path: Path) -> int:
+    """Mode of the existing ``path``, or what ``open`` would give a new file."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write via a temp file in the same directory and rename over the target.
+
+    ``mkstemp`` creates the temp file ``0600``; it gets the target's mode
+    first so the rename does not narrow permissions.
+    """
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as handle:
+            handle.write(text)
+        os.chmod(temp_name, _file_mode(path))
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def write_if_changed(path: Path, text: str, *, force: bool = False) -> bool:
+    try:
+        if not force and path.read_text(encoding="utf-8") == text:
+            return False
+    except FileNotFoundError:
+        pass
+    write_atomic(path, text)
+    return True
+
+
+def json_patch(old: object, new: object, *, max_depth: int = 2, path: tuple = ()) -> list[tuple]:
+    """Diff two JSON documents into ``("set", path, value)``/``("remove", path)``.
+
+    Objects and equal-length arrays are descended into until ``max_depth``
+    path segments, so a changed question becomes one ``questions/<index>``
+    replacement rather than a rewrite of the whole document.
+    """
+    if old == new:
+        return []
+    if len(path) < max_depth:
+        if isinstance(old, dict) and isinstance(new, dict):
+            ops: list[tuple] = []
+            for key, value in new.items():
+                if key not in old:
+                    ops.append(("set", path + (key,), value))
+                else:
+                    ops += json_patch(old[key], value, max_depth=max_depth, path=path + (key,))
+            ops += [("remove", path + (key,)) for key in old if key not in new]
+            return ops
+        if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+            ops = []
+            for index, (before, after) in enumerate(zip(old, new)):
+                ops += json_patch(before, after, max_depth=max_depth, path=path + (str(index),))
+            return ops
+    return [("set", path, new)]
+
+
+def _sql_text_path(path: tuple) -> str:
+    elements = ",".join(
+        '"' + part.replace("\\", "\\\\").replace('"', '\\"') + '"' for part in path
+    )
+    return "'{" + elements.replace("'", "''") + "}'"
+
+
+def full_migration_sql(text: str, *, assessment_id: str, version: str, new_hash: str) -> str:
+    """Render an upsert of the whole ``schema_json`` document ``text``."""
+    return f"""-- Update readiness schema -> {new_hash}
+insert into readiness_v1.assessment_schemas (assessment_id, version, schema_json)
+values ('{assessment_id}', '{version}', $$
+{text}
+$$::jsonb)
+on conflict (assessment_id, version)
+ do update set schema_json = excluded.schema_json;
+"""
+
+
+def patch_migration_sql(
+    ops: list[tuple], *, assessment_id: str, version: str, old_hash: str, new_hash: str
+) -> str:
+    """Render patch ops as a single guarded ``update`` of ``schema_json``.
+
+    All paths are applied in one nested expression so the row is rewritten
+    once, and only when the stored document still has ``old_hash``.
+    """
+    opens: list[str] = []
+    steps: list[str] = []
+    for op in ops:
+        if op[0] == "set":
+            value = json.dumps(op[2], separators=(",", ":"), ensure_ascii=True)
+            opens.append("jsonb_set(")
+            steps.append(f",\n      {_sql_text_path(op[1])}, $json${value}$json$::jsonb)")
+        else:
+            opens.append("(")
+            steps.append(f"\n      #- {_sql_text_path(op[1])})")
+    expression = "".join(reversed(opens)) + "schema_json" + "".join(steps)
+    return f"""-- Patch readiness schema {old_hash[:12]} -> {new_hash} ({len(ops)} paths)
+do $$
+begin
+  update readiness_v1.assessment_schemas
+  set schema_json = {expression}
+  where assessment_id = '{assessment_id}'
+    and version = '{version}'
+    and schema_json->>'{HASH_KEY}' = '{old_hash}';
+
+  if not found then
+    raise exception 'readiness schema % % is not at content_hash {old_hash}',
+      '{assessment_id}', '{version}';
+  end if;
+end
+$$;
+"""
+
+
+def stored_content_hash(migrations_dir: Path) -> str | None:
+    """``content_hash`` of the stored schema row after every migration has run.
+
+    Taken from the newest migration that writes ``assessment_schemas``. ``None``
+    when that migration is not a generated upsert or patch (the hand-written
+    ones before hashing, or a later manual edit), since then nothing is known
+    about the stored document and only a full upsert is safe.
+    """
+    for path in sorted(migrations_dir.glob("*.sql"), reverse=True):
+        text = path.read_text(encoding="utf-8")
+        if _SCHEMA_WRITE_RE.search(text):
+            match = _STORED_HASH_RE.search(text)
+            return match.group(1) if match else None
+    return None
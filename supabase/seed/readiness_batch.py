@@ -0,0 +1,290 @@
+"""Vectorized scoring of whole populations of readiness assessments.
+
+Assessments are encoded as small integer matrices so NumPy can score millions
+of rows at once:
+
+* ``answers_matrix`` is ``(N, Q)`` uint8 in schema question order, where
+  ``0`` means unanswered and ``1..`` are the ``answer_scoring`` keys in order
+  (``yes``, ``partial``, ``no``, ``not_sure``, ``na``).
+* ``profile_matrix`` is ``(N, P)`` int8 in ``profile_questions`` order with
+  ``1`` for true, ``0`` for false and ``-1`` for unanswered or non-boolean
+  values (see ``profile_code``).
+
+Scores follow the agent edge function: per-section averages of the scored
+applicable answers (weighted by question weight) rounded half up, then an
+overall average weighted by section weight over the sections with scores.
+``app_overall_score`` is the overall the Readiness page stores instead: the
+same weighted average taken over the unrounded section averages and rounded
+once, so the two can differ by one point. ``app_section_scores`` round the
+page's mean fraction times 100, which differs from the agent's mean percent
+only on float ties. The page ignores question weights, which are all 1.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+
+from readiness_conditions import ALWAYS, parse_condition
+from readiness_tables import build_score_tables
+
+SCHEMA_PATH = Path(__file__).resolve().parent / "readiness_v1_schema.json"
+
+UNANSWERED = 0
+PROFILE_TRUE = 1
+PROFILE_FALSE = 0
+PROFILE_UNKNOWN = -1
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+MatrixCondition = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+_PROFILE_VALUE_CODES = {True: PROFILE_TRUE, False: PROFILE_FALSE}
+
+
+def load_schema(path: Path = SCHEMA_PATH) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def profile_code(value: object) -> int:
+    """Matrix code of a stored profile value.
+
+    Only values equal to ``true`` or ``false`` (as ``compile_ast`` compares
+    them) are known; anything else, such as ``"no"``, is unknown, so ``==``
+    never matches it and ``!=`` always does.
+    """
+    if isinstance(value, (bool, int, float)):
+        return _PROFILE_VALUE_CODES.get(value, PROFILE_UNKNOWN)
+    return PROFILE_UNKNOWN
+
+
+def js_round(values: np.ndarray) -> np.ndarray:
+    """Round half up like ``Math.round`` instead of NumPy's half-to-even."""
+    return np.floor(values + 0.5)
+
+
+class BatchScorer:
+    def __init__(self, schema: Mapping):
+        self.schema = schema
+        self.question_ids = [q["id"] for q in schema["questions"]]
+        self.section_ids = [s["id"] for s in schema["sections"]]
+        self.profile_fields = [q["field"] for q in schema["profile_questions"]]
+        self.answer_values = list(schema["answer_scoring"])
+        self.answer_codes = {
+            value: code for code, value in enumerate(self.answer_values, start=1)
+        }
+        self.question_index = {qid: index for index, qid in enumerate(self.question_ids)}
+        self.profile_index = {field: index for index, field in enumerate(self.profile_fields)}
+
+        section_index = {sid: index for index, sid in enumerate(self.section_ids)}
+        question_count = len(self.question_ids)
+        code_count = len(self.answer_values) + 1
+
+        # The last option with a given value decides its score (NaN: unscored).
+        self.fractions = np.full((question_count, code_count), np.nan)
+        for q_index, question in enumerate(schema["questions"]):
+            for option in question["options"]:
+                if option["value"] not in self.answer_codes:
+                    continue
+                score = schema["answer_scoring"].get(option.get("score_value", option["value"]))
+                self.fractions[q_index, self.answer_codes[option["value"]]] = (
+                    np.nan if score is None else score
+                )
+
+        self.question_weights = np.array(
+            [q.get("weight", 1) for q in schema["questions"]], dtype=np.float64
+        )
+        self.section_weights = np.array(
+            [s["weight"] for s in schema["sections"]], dtype=np.float64
+        )
+        self.membership = np.zeros((question_count, len(self.section_ids)), dtype=np.float32)
+        for q_index, question in enumerate(schema["questions"]):
+            self.membership[q_index, section_index[question["section_id"]]] = 1.0
+
+        # Flat per-(question, answer code) tables so one take() scores a chunk.
+        # Points are whole multiples of 25, so float32 sums stay exact.
+        self.cell_offsets = (np.arange(question_count) * code_count).astype(np.int16)
+        self.cell_points = np.nan_to_num(
+            self.fractions * 100.0 * self.question_weights[:, None]
+        ).astype(np.float32).ravel()
+        self.cell_weights = (
+            ~np.isnan(self.fractions) * self.question_weights[:, None]
+        ).astype(np.float32).ravel()
+
+        self.band_labels = [band["label"] for band in schema["score_bands"]]
+        score_tables = schema.get("score_tables") or build_score_tables(schema)
+        self.band_lookup = np.array(score_tables["band_lookup"], dtype=np.int8)
+
+        self.conditions: list[tuple[list[int], MatrixCondition]] = []
+        grouped: dict[str, list[int]] = {}
+        for q_index, question in enumerate(schema["questions"]):
+            expression = question.get("applies_if") or ALWAYS
+            if expression != ALWAYS:
+                grouped.setdefault(expression, []).append(q_index)
+        for expression, indexes in grouped.items():
+            self.conditions.append((indexes, self.compile_matrix_condition(parse_condition(expression))))
+
+    def compile_matrix_condition(self, node: dict) -> MatrixCondition:
+        op = node["op"]
+        if op == ALWAYS:
+            return lambda answers, profile: np.ones(len(answers), dtype=bool)
+        if op == "not":
+            inner = self.compile_matrix_condition(node["arg"])
+            return lambda answers, profile: ~inner(answers, profile)
+        if op in ("and", "or"):
+            parts = [self.compile_matrix_condition(arg) for arg in node["args"]]
+            combine = np.logical_and if op == "and" else np.logical_or
+
+            def combined(answers: np.ndarray, profile: np.ndarray) -> np.ndarray:
+                result = parts[0](answers, profile)
+                for part in parts[1:]:
+                    result = combine(result, part(answers, profile))
+                return result
+
+            return combined
+
+        values = node["values"] if op == "in" else [node["value"]]
+        if "answer" in node:
+            column = self.question_index[node["answer"]]
+            table = np.zeros(len(self.answer_values) + 1, dtype=bool)
+            table[[self.answer_codes[value] for value in values]] = True
+            if op == "ne":
+                table = ~table
+            return lambda answers, profile: table[answers[:, column]]
+
+        column = self.profile_index[node["profile"]]
+        # Index with code + 1 so unanswered (-1) lands on slot 0.
+        table = np.zeros(3, dtype=bool)
+        for value in values:
+            if isinstance(value, bool):
+                table[(PROFILE_TRUE if value else PROFILE_FALSE) + 1] = True
+        if op == "ne":
+            table = ~table
+        return lambda answers, profile: table[profile[:, column] + 1]
+
+    def applicability(self, answers_matrix: np.ndarray, profile_matrix: np.ndarray) -> np.ndarray:
+        applicable = np.ones(answers_matrix.shape, dtype=bool)
+        for indexes, condition in self.conditions:
+            applicable[:, indexes] = condition(answers_matrix, profile_matrix)[:, None]
+        return applicable
+
+    def _score_chunk(self, answers: np.ndarray, profile: np.ndarray) -> dict:
+        applicable = self.applicability(answers, profile)
+
+        cells = answers + self.cell_offsets
+        section_totals = ((self.cell_points.take(cells) * applicable) @ self.membership).astype(
+            np.float64
+        )
+        section_weights = ((self.cell_weights.take(cells) * applicable) @ self.membership).astype(
+            np.float64
+        )
+        section_has_score = section_weights > 0
+        section_scores = js_round(
+            np.divide(
+                section_totals,
+                section_weights,
+                out=np.zeros_like(section_totals),
+                where=section_has_score,
+            )
+        )
+
+        counted_weights = section_has_score * self.section_weights
+        total_weight = counted_weights.sum(axis=1)
+        overall = js_round(
+            np.divide(
+                (section_scores * counted_weights).sum(axis=1),
+                total_weight,
+                out=np.zeros_like(total_weight),
+                where=total_weight > 0,
+            )
+        ).astype(np.int16)
+
+        # The Readiness page's float steps, in order, so ties round the same:
+        # mean fraction per section, then a running sum in section order.
+        section_fractions = np.divide(
+            section_totals / 100.0,
+            section_weights,
+            out=np.zeros_like(section_totals),
+            where=section_has_score,
+        )
+        app_total = np.zeros(len(answers))
+        for column in range(len(self.section_ids)):
+            app_total += section_fractions[:, column] * counted_weights[:, column]
+        app_overall = js_round(
+            np.divide(app_total, total_weight, out=np.zeros_like(total_weight), where=total_weight > 0)
+            * 100.0
+        ).astype(np.int16)
+
+        return {
+            "applicable": applicable,
+            "section_applicable": (applicable.astype(np.float32) @ self.membership) > 0,
+            "section_scored": section_has_score,
+            "section_scores": section_scores.astype(np.int16),
+            "overall_score": overall,
+            "app_section_scores": js_round(section_fractions * 100.0).astype(np.int16),
+            "app_overall_score": app_overall,
+            "band": self.band_lookup[overall],
+        }
+
+    def score_batch(
+        self,
+        answers_matrix: np.ndarray,
+        profile_matrix: np.ndarray,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> dict:
+        """Score every row; returns arrays keyed like the agent's section state."""
+        rows = len(answers_matrix)
+        results = {
+            "applicable": np.empty(answers_matrix.shape, dtype=bool),
+            "section_applicable": np.empty((rows, len(self.section_ids)), dtype=bool),
+            "section_scored": np.empty((rows, len(self.section_ids)), dtype=bool),
+            "section_scores": np.empty((rows, len(self.section_ids)), dtype=np.int16),
+            "overall_score": np.empty(rows, dtype=np.int16),
+            "app_section_scores": np.empty((rows, len(self.section_ids)), dtype=np.int16),
+            "app_overall_score": np.empty(rows, dtype=np.int16),
+            "band": np.empty(rows, dtype=np.int8),
+        }
+        for start in range(0, rows, chunk_size):
+            stop = min(start + chunk_size, rows)
+            chunk = self._score_chunk(answers_matrix[start:stop], profile_matrix[start:stop])
+            for key, values in chunk.items():
+                results[key][start:stop] = values
+        results["band_labels"] = self.band_labels
+        return results
+
+    def encode(
+        self, assessments: Iterable[tuple[Mapping, Mapping]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Encode ``(answers, profile)`` pairs into answer and profile matrices."""
+        answer_rows: list[list[int]] = []
+        profile_rows: list[list[int]] = []
+        question_count = len(self.question_ids)
+        question_index = self.question_index
+        answer_codes = self.answer_codes
+        profile_paths = [tuple(field.split(".")) for field in self.profile_fields]
+        for answers, profile in assessments:
+            answer_row = [UNANSWERED] * question_count
+            for question_id, value in answers.items():
+                index = question_index.get(question_id)
+                if index is not None:
+                    answer_row[index] = answer_codes.get(value, UNANSWERED)
+            answer_rows.append(answer_row)
+            profile_row = []
+            for path in profile_paths:
+                value: object = profile
+                for part in path:
+                    value = value.get(part) if isinstance(value, dict) else None
+                profile_row.append(profile_code(value))
+            profile_rows.append(profile_row)
+
+        answers_matrix = np.array(answer_rows, dtype=np.uint8).reshape(-1, len(self.question_ids))
+        profile_matrix = np.array(profile_rows, dtype=np.int8).reshape(-1, len(self.profile_fields))
+        return answers_matrix, profile_matrix
+
+
+def score_batch(
+    answers_matrix: np.ndarray, profile_matrix: np.ndarray, schema: Mapping | None = None
+) -> dict:
+    return BatchScorer(schema or load_schema()).score_batch(answers_matrix, profile_matrix)
@@ -0,0 +1,175 @@
+"""Fixed-size binary packing of readiness assessments.
+
+The schema's ``encoding`` table (see ``readiness_tables.build_encoding``)
+gives every profile field a 2-bit slot (0 unknown, 1 false, 2 true) and
+every question a 3-bit slot holding its answer code (0 unanswered, then
+``answer_codes``). A whole assessment packs into ``byte_length`` bytes --
+a layout byte, the encoding digest and a few dozen bytes of slots instead
+of kilobytes of JSON::
+
+    codec = AssessmentCodec(load_schema())
+    data = codec.pack(answers, profile)
+    answers, profile = codec.unpack(data)
+
+Slots and codes are never reused and new questions only extend the end, so
+bytes packed under an earlier encoding in ``digests`` are shorter and decode
+zero-extended; answers to removed questions or retired values are dropped.
+Blobs stamped with any other digest were packed with different slots and
+are rejected.
+``to_matrices`` unpacks many assessments at once straight into the
+``BatchScorer`` answer and profile matrices.
+"""
+
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from readiness_batch import (
+    PROFILE_FALSE,
+    PROFILE_TRUE,
+    PROFILE_UNKNOWN,
+    UNANSWERED,
+    profile_code,
+)
+from readiness_tables import build_encoding
+
+
+class AssessmentCodec:
+    def __init__(self, schema: Mapping):
+        self.encoding = schema.get("encoding") or build_encoding(schema)
+        encoding = self.encoding
+        self.layout: int = encoding["layout"]
+        # Blobs stamped with any digest in the encoding's history decode here.
+        self.digest = bytes.fromhex(encoding["digests"][-1])
+        self.digests = {bytes.fromhex(digest) for digest in encoding["digests"]}
+        self.header_length = 1 + len(self.digest)
+        self.byte_length: int = encoding["byte_length"]
+        self.answer_bits: int = encoding["answer_bits"]
+        self.profile_bits: int = encoding["profile_bits"]
+        self.answer_codes: dict[str, int] = encoding["answer_codes"]
+        self.answer_values = {code: value for value, code in self.answer_codes.items()}
+        self.questions: dict[str, int] = encoding["questions"]
+        self.profile_fields: dict[str, int] = encoding["profile_fields"]
+        self.question_slots: int = encoding["question_slots"]
+        self.profile_slots: int = encoding["profile_slots"]
+        self.profile_stop = self.profile_slots * self.profile_bits
+        self.answer_offset = encoding["profile_capacity"] * self.profile_bits
+        self.answer_stop = self.answer_offset + self.question_slots * self.answer_bits
+        self.profile_codes: dict[str, int] = encoding["profile_codes"]
+        self._answer_mask = (1 << self.answer_bits) - 1
+        self._profile_mask = (1 << self.profile_bits) - 1
+        self._profile_paths = {field: tuple(field.split(".")) for field in self.profile_fields}
+
+        # Slot -> BatchScorer column and code maps for vectorized unpacking.
+        self._question_slots = np.array(
+            [self.questions[question["id"]] for question in schema["questions"]], dtype=np.intp
+        )
+        self._field_slots = np.array(
+            [self.profile_fields[question["field"]] for question in schema["profile_questions"]],
+            dtype=np.intp,
+        )
+        batch_codes = {value: code for code, value in enumerate(schema["answer_scoring"], start=1)}
+        self._batch_answer_codes = np.full(1 << self.answer_bits, UNANSWERED, dtype=np.uint8)
+        for value, code in self.answer_codes.items():
+            self._batch_answer_codes[code] = batch_codes.get(value, UNANSWERED)
+        self._batch_profile_codes = np.full(1 << self.profile_bits, PROFILE_UNKNOWN, dtype=np.int8)
+        self._batch_profile_codes[self.profile_codes["false"]] = PROFILE_FALSE
+        self._batch_profile_codes[self.profile_codes["true"]] = PROFILE_TRUE
+        self._stored_profile_codes = {
+            PROFILE_TRUE: self.profile_codes["true"],
+            PROFILE_FALSE: self.profile_codes["false"],
+        }
+
+    def pack(self, answers: Mapping[str, str], profile: Mapping | None = None) -> bytes:
+        """Pack one assessment; unknown question ids or answer values raise.
+
+        Profile values are stored as ``profile_code`` reads them, so only
+        booleans survive and anything else is unknown.
+        """
+        packed = 0
+        for question_id, value in answers.items():
+            slot = self.questions.get(question_id)
+            if slot is None:
+                raise ValueError(f"Question {question_id!r} has no encoding slot")
+            code = self.answer_codes.get(value)
+            if code is None:
+                raise ValueError(f"Answer value {value!r} for {question_id} has no code")
+            packed |= code << (self.answer_offset + slot * self.answer_bits)
+
+        for field, path in self._profile_paths.items():
+            value: object = profile or {}
+            for part in path:
+                value = value.get(part) if isinstance(value, dict) else None
+            code = self._stored_profile_codes.get(profile_code(value))
+            if code is not None:
+                packed |= code << (self.profile_fields[field] * self.profile_bits)
+        payload = packed.to_bytes(self.byte_length - self.header_length, "little")
+        return bytes([self.layout]) + self.digest + payload
+
+    def _check(self, data: bytes) -> None:
+        if not data or data[0] != self.layout:
+            raise ValueError(f"Expected encoding layout {self.layout}, got {data[:1]!r}")
+        if data[1 : self.header_length] not in self.digests:
+            raise ValueError(
+                f"Encoding digest {data[1 : self.header_length].hex()!r} is not in this "
+                "encoding's history; the blob was packed with different slots"
+            )
+        if len(data) > self.byte_length:
+            raise ValueError(f"Expected at most {self.byte_length} bytes, got {len(data)}")
+
+    def unpack(self, data: bytes) -> tuple[dict[str, str], dict]:
+        """Inverse of ``pack``: ``(answers, nested profile)`` with unknowns omitted."""
+        self._check(data)
+        packed = int.from_bytes(data[self.header_length :], "little")
+        answers: dict[str, str] = {}
+        for question_id, slot in self.questions.items():
+            code = (packed >> (self.answer_offset + slot * self.answer_bits)) & self._answer_mask
+            value = self.answer_values.get(code)
+            if value is not None:
+                answers[question_id] = value
+
+        profile: dict = {}
+        for field, path in self._profile_paths.items():
+            code = (packed >> (self.profile_fields[field] * self.profile_bits)) & self._profile_mask
+            if code == self.profile_codes["unknown"]:
+                continue
+            target = profile
+            for part in path[:-1]:
+                target = target.setdefault(part, {})
+            target[path[-1]] = code == self.profile_codes["true"]
+        return answers, profile
+
+    def to_matrices(self, blobs: Sequence[bytes]) -> tuple[np.ndarray, np.ndarray]:
+        """Unpack packed assessments into ``BatchScorer`` answer/profile matrices."""
+        if all(len(data) == self.byte_length for data in blobs):
+            raw = np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(-1, self.byte_length)
+        else:
+            # Blobs packed under an older schema are shorter: zero-extend them.
+            raw = np.zeros((len(blobs), self.byte_length), dtype=np.uint8)
+            for row, data in enumerate(blobs):
+                self._check(data)
+                raw[row, : len(data)] = np.frombuffer(data, dtype=np.uint8)
+        if (raw[:, 0] != self.layout).any():
+            raise ValueError(f"Expected encoding layout {self.layout} in every blob")
+        header = raw[:, 1 : self.header_length]
+        known = np.zeros(len(raw), dtype=bool)
+        for digest in self.digests:
+            known |= (header == np.frombuffer(digest, dtype=np.uint8)).all(axis=1)
+        if not known.all():
+            raise ValueError("Some blobs carry an encoding digest not in this encoding's history")
+        bits = np.unpackbits(raw[:, self.header_length :], axis=1, bitorder="little")
+
+        answer_weights = 1 << np.arange(self.answer_bits, dtype=np.uint8)
+        answer_bits = bits[:, self.answer_offset : self.answer_stop].reshape(
+            len(raw), self.question_slots, self.answer_bits
+        )
+        codes = (answer_bits * answer_weights).sum(axis=2, dtype=np.uint8)
+        answers = self._batch_answer_codes[codes[:, self._question_slots]]
+
+        profile_weights = 1 << np.arange(self.profile_bits, dtype=np.uint8)
+        profile_bits = bits[:, : self.profile_stop].reshape(
+            len(raw), self.profile_slots, self.profile_bits
+        )
+        profile_codes = (profile_bits * profile_weights).sum(axis=2, dtype=np.uint8)
+        profile = self._batch_profile_codes[profile_codes[:, self._field_slots]]
+        return answers, profile
@@ -0,0 +1,212 @@
+"""Columnar, memory-mapped storage of encoded assessments for analytics.
+
+A store is a directory with one ``.npy`` column per question (uint8 answer
+codes as in ``readiness_batch``), one per profile field (int8), an
+``assessment_id`` column and ``manifest.json``. The manifest records the
+schema ``content_hash`` the codes were produced with, the code tables and
+the file of every column; opening a store against a different schema fails
+rather than silently misreading codes.
+
+Columns are opened with ``mmap_mode="r"``, so an aggregation over ``11.3``
+reads that one file and nothing else::
+
+    python supabase/seed/readiness_columns.py build exports.jsonl --store answers.store
+    python supabase/seed/readiness_columns.py counts answers.store 11.3
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from readiness_artifacts import HASH_KEY, write_atomic
+from readiness_batch import SCHEMA_PATH, UNANSWERED, BatchScorer, load_schema
+
+MANIFEST_NAME = "manifest.json"
+ID_DTYPE = np.dtype("S36")
+DEFAULT_CHUNK_ROWS = 65_536
+
+
+def _column_name(prefix: str, key: str) -> str:
+    return f"{prefix}{key.replace('/', '_')}.npy"
+
+
+def _finish_column(raw_path: Path, path: Path, dtype: np.dtype, rows: int) -> None:
+    """Prefix a raw column dump with an ``.npy`` header."""
+    header = {
+        "descr": np.lib.format.dtype_to_descr(dtype),
+        "fortran_order": False,
+        "shape": (rows,),
+    }
+    with path.open("wb") as target, raw_path.open("rb") as source:
+        np.lib.format.write_array_header_1_0(target, header)
+        shutil.copyfileobj(source, target, 1 << 20)
+    raw_path.unlink()
+
+
+def write_store(
+    directory: Path,
+    records: Iterable[Mapping],
+    schema: Mapping,
+    *,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> int:
+    """Encode ``{"assessment_id", "profile", "answers"}`` records into a store.
+
+    Records are encoded ``chunk_rows`` at a time and appended to per-column
+    files, so memory does not grow with the number of records. Returns the
+    number of rows written.
+    """
+    scorer = BatchScorer(schema)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / MANIFEST_NAME).unlink(missing_ok=True)
+    columns = [("assessment_id", "assessment_id.npy", ID_DTYPE)]
+    columns += [(qid, _column_name("q_", qid), np.dtype(np.uint8)) for qid in scorer.question_ids]
+    columns += [
+        (field, _column_name("p_", field), np.dtype(np.int8)) for field in scorer.profile_fields
+    ]
+    raw_paths = [directory / f".{file_name}.raw" for _key, file_name, _dtype in columns]
+    handles = [path.open("wb") for path in raw_paths]
+
+    rows = 0
+    try:
+        iterator = iter(records)
+        while True:
+            chunk = [record for _index, record in zip(range(chunk_rows), iterator)]
+            if not chunk:
+                break
+            answers, profile = scorer.encode(
+                (record.get("answers") or {}, record.get("profile") or {}) for record in chunk
+            )
+            ids = np.array([str(record["assessment_id"]).encode("ascii") for record in chunk])
+            if ids.dtype.itemsize > ID_DTYPE.itemsize:
+                raise ValueError(f"assessment_id longer than {ID_DTYPE.itemsize} characters")
+            handles[0].write(ids.astype(ID_DTYPE).tobytes())
+            for column, handle in zip(answers.T, handles[1 : 1 + len(scorer.question_ids)]):
+                handle.write(column.tobytes())
+            for column, handle in zip(profile.T, handles[1 + len(scorer.question_ids) :]):
+                handle.write(column.tobytes())
+            rows += len(chunk)
+    finally:
+        for handle in handles:
+            handle.close()
+
+    for raw_path, (_key, file_name, dtype) in zip(raw_paths, columns):
+        _finish_column(raw_path, directory / file_name, dtype, rows)
+
+    answer_columns = columns[1 : 1 + len(scorer.question_ids)]
+    profile_columns = columns[1 + len(scorer.question_ids) :]
+    manifest = {
+        "assessment_id": schema["assessment_id"],
+        "version": schema["version"],
+        HASH_KEY: schema[HASH_KEY],
+        "rows": rows,
+        "answer_values": scorer.answer_values,
+        "profile_codes": {"true": 1, "false": 0, "unknown": -1},
+        "id_column": "assessment_id.npy",
+        "answers": {qid: file_name for qid, file_name, _dtype in answer_columns},
+        "profile": {field: file_name for field, file_name, _dtype in profile_columns},
+    }
+    # The manifest goes last: a store without one is incomplete.
+    write_atomic(directory / MANIFEST_NAME, json.dumps(manifest, indent=2))
+    return rows
+
+
+class ColumnStore:
+    """Read-only view over a store; every column is memory-mapped on demand."""
+
+    def __init__(self, directory: Path, schema: Mapping | None = None):
+        self.directory = directory
+        self.manifest = json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if schema is not None and schema.get(HASH_KEY) != self.manifest[HASH_KEY]:
+            raise ValueError(
+                f"Store {directory} was built for schema {self.manifest[HASH_KEY][:12]}, "
+                f"not {str(schema.get(HASH_KEY))[:12]}"
+            )
+        self.rows = self.manifest["rows"]
+        self.answer_values = self.manifest["answer_values"]
+        self._sections: dict[str, list[str]] = {}
+        if schema is not None:
+            for question in schema["questions"]:
+                self._sections.setdefault(question["section_id"], []).append(question["id"])
+
+    def _load(self, file_name: str) -> np.ndarray:
+        return np.load(self.directory / file_name, mmap_mode="r")
+
+    def ids(self) -> np.ndarray:
+        return self._load(self.manifest["id_column"])
+
+    def answers(self, question_id: str) -> np.ndarray:
+        return self._load(self.manifest["answers"][question_id])
+
+    def profile(self, field: str) -> np.ndarray:
+        return self._load(self.manifest["profile"][field])
+
+    def answer_matrix(self, question_ids: Iterable[str] | None = None) -> np.ndarray:
+        """Stack the requested answer columns into an ``(N, k)`` uint8 matrix."""
+        question_ids = list(self.manifest["answers"] if question_ids is None else question_ids)
+        matrix = np.empty((self.rows, len(question_ids)), dtype=np.uint8)
+        for index, question_id in enumerate(question_ids):
+            matrix[:, index] = self.answers(question_id)
+        return matrix
+
+    def profile_matrix(self) -> np.ndarray:
+        fields = list(self.manifest["profile"])
+        matrix = np.empty((self.rows, len(fields)), dtype=np.int8)
+        for index, field in enumerate(fields):
+            matrix[:, index] = self.profile(field)
+        return matrix
+
+    def answer_counts(self, question_id: str) -> dict[str | None, int]:
+        """Count each answer value (``None`` for unanswered) for one question."""
+        counts = np.bincount(self.answers(question_id), minlength=len(self.answer_values) + 1)
+        labels = [None, *self.answer_values]
+        return {labels[code]: int(count) for code, count in enumerate(counts.tolist())}
+
+    def section_answer_counts(self, section_id: str) -> dict[str, dict[str | None, int]]:
+        """``answer_counts`` for every question of a section (needs the schema)."""
+        if not self._sections:
+            raise ValueError("Open the store with its schema to aggregate by section")
+        return {qid: self.answer_counts(qid) for qid in self._sections[section_id]}
+
+    def answered_rate(self, question_id: str) -> float:
+        column = self.answers(question_id)
+        return float(np.count_nonzero(column != UNANSWERED) / len(column)) if len(column) else 0.0
+
+
+def _read_jsonl(path: Path) -> Iterable[dict]:
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build or query a columnar readiness store.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="encode a JSONL export into a store")
+    build.add_argument("input", type=Path)
+    build.add_argument("--store", type=Path, required=True)
+    build.add_argument("--schema", type=Path, default=SCHEMA_PATH)
+    counts = commands.add_parser("counts", help="print answer counts for questions")
+    counts.add_argument("store", type=Path)
+    counts.add_argument("question_ids", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        rows = write_store(args.store, _read_jsonl(args.input), load_schema(args.schema))
+        print(f"wrote {rows:,} rows to {args.store}", file=sys.stderr)
+        return 0
+
+    store = ColumnStore(args.store)
+    for question_id in args.question_ids:
+        print(json.dumps({"question_id": question_id, "counts": store.answer_counts(question_id)}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
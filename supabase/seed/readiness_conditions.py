@@ -0,0 +1,648 @@
+"""Parser and compiler for the readiness condition mini-language.
+
+Conditions are the strings stored in ``applies_if`` and in the ``when`` field
+of profile and soft gates, for example::
+
+    answers['1.1.B.1'] in ['yes','partial'] or profile.pets.has_pets == true
+
+They are parsed once into a small JSON-compatible AST and compiled to plain
+closures taking ``(answers, profile)``. ``answers`` maps question ids to answer
+values and ``profile`` is the nested ``profile_json`` document.
+
+The edge functions rewrite the same strings into JavaScript for
+``new Function``, which cannot run every condition the parser accepts:
+``not``/``not in`` are not JavaScript, a parenthesised ``in`` breaks the
+rewrite, and reading ``profile.<group>.<field>`` with the group missing
+throws, making the whole condition false. ``validate_schema_conditions``
+therefore admits only ``==`` and ``in`` combined with ``and``/``or``, with no
+``or`` nested in an ``and`` and a profile comparison only as the last
+argument of an ``or``. Within that subset a missing input makes every
+comparison false and both evaluators agree. Outside it, the Python
+compilers here give ``!=`` and ``not in`` on a missing input ``true``.
+"""
+
+import re
+from collections import OrderedDict
+from functools import lru_cache, reduce
+from itertools import product
+from typing import Callable, Iterable, Mapping
+
+Condition = Callable[[Mapping, Mapping], bool]
+
+ALWAYS = "always"
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>'[^']*'|"[^"]*")
+      | (?P<op>==|!=|\[|\]|\(|\)|,|\.)
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    )
+    """,
+    re.VERBOSE,
+)
+_LITERALS = {"true": True, "false": False}
+
+
+class ConditionError(ValueError):
+    pass
+
+
+def _tokenize(expression: str) -> list[tuple[str, object]]:
+    tokens: list[tuple[str, object]] = []
+    position = 0
+    end = len(expression.rstrip())
+    while position < end:
+        match = _TOKEN_RE.match(expression, position)
+        if not match or match.end() == position:
+            raise ConditionError(
+                f"Unexpected character at {position} in condition: {expression!r}"
+            )
+        position = match.end()
+        if match.group("string") is not None:
+            tokens.append(("string", match.group("string")[1:-1]))
+        elif match.group("op") is not None:
+            tokens.append(("op", match.group("op")))
+        else:
+            tokens.append(("name", match.group("name")))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.index = 0
+
+    def error(self, message: str) -> ConditionError:
+        return ConditionError(f"{message} in condition: {self.expression!r}")
+
+    def peek(self) -> tuple[str, object] | None:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return None
+
+    def accept(self, kind: str, value: object) -> bool:
+        if self.peek() == (kind, value):
+            self.index += 1
+            return True
+        return False
+
+    def expect(self, kind: str, value: object | None = None) -> object:
+        token = self.peek()
+        if token is None or token[0] != kind or (value is not None and token[1] != value):
+            expected = value if value is not None else kind
+            raise self.error(f"Expected {expected!r}")
+        self.index += 1
+        return token[1]
+
+    def parse(self) -> dict:
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise self.error(f"Unexpected token {self.peek()[1]!r}")
+        return node
+
+    def parse_or(self) -> dict:
+        args = [self.parse_and()]
+        while self.accept("name", "or"):
+            args.append(self.parse_and())
+        return _combine("or", args)
+
+    def parse_and(self) -> dict:
+        args = [self.parse_not()]
+        while self.accept("name", "and"):
+            args.append(self.parse_not())
+        return _combine("and", args)
+
+    def parse_not(self) -> dict:
+        if self.accept("name", "not"):
+            return {"op": "not", "arg": self.parse_not()}
+        return self.parse_atom()
+
+    def parse_atom(self) -> dict:
+        if self.accept("op", "("):
+            node = self.parse_or()
+            self.expect("op", ")")
+            return node
+        if self.accept("name", ALWAYS):
+            return {"op": ALWAYS}
+
+        ref = self.parse_ref()
+        if self.accept("name", "in"):
+            return {"op": "in", **ref, "values": self.parse_list()}
+        if self.accept("name", "not"):
+            self.expect("name", "in")
+            return {"op": "not", "arg": {"op": "in", **ref, "values": self.parse_list()}}
+        if self.accept("op", "=="):
+            return {"op": "eq", **ref, "value": self.parse_literal()}
+        if self.accept("op", "!="):
+            return {"op": "ne", **ref, "value": self.parse_literal()}
+        raise self.error("Expected 'in', 'not in', '==' or '!='")
+
+    def parse_ref(self) -> dict:
+        name = self.expect("name")
+        if name == "answers":
+            self.expect("op", "[")
+            question_id = self.expect("string")
+            self.expect("op", "]")
+            return {"answer": question_id}
+        if name == "profile":
+            parts = []
+            while self.accept("op", "."):
+                parts.append(self.expect("name"))
+            if not parts:
+                raise self.error("Expected profile field")
+            return {"profile": ".".join(parts)}
+        raise self.error(f"Unknown reference {name!r}")
+
+    def parse_list(self) -> list:
+        self.expect("op", "[")
+        values = [self.parse_literal()]
+        while self.accept("op", ","):
+            values.append(self.parse_literal())
+        self.expect("op", "]")
+        return values
+
+    def parse_literal(self) -> object:
+        token = self.peek()
+        if token is not None and token[0] == "string":
+            self.index += 1
+            return token[1]
+        if token is not None and token[0] == "name" and token[1] in _LITERALS:
+            self.index += 1
+            return _LITERALS[token[1]]
+        raise self.error("Expected a string, true or false")
+
+
+def _combine(op: str, args: list[dict]) -> dict:
+    if len(args) == 1:
+        return args[0]
+    flattened: list[dict] = []
+    for arg in args:
+        flattened.extend(arg["args"] if arg["op"] == op else [arg])
+    return {"op": op, "args": flattened}
+
+
+@lru_cache(maxsize=None)
+def _parse_cached(expression: str) -> dict:
+    if not expression or expression.strip() == ALWAYS:
+        return {"op": ALWAYS}
+    return _Parser(expression).parse()
+
+
+def parse_condition(expression: str | None) -> dict:
+    return _copy_ast(_parse_cached(expression or ALWAYS))
+
+
+def _copy_ast(node: dict) -> dict:
+    copy = dict(node)
+    if "args" in copy:
+        copy["args"] = [_copy_ast(arg) for arg in copy["args"]]
+    if "arg" in copy:
+        copy["arg"] = _copy_ast(copy["arg"])
+    if "values" in copy:
+        copy["values"] = list(copy["values"])
+    return copy
+
+
+def iter_refs(node: dict) -> Iterable[tuple[str, str]]:
+    """Yield ``("answer", question_id)`` and ``("profile", field)`` refs."""
+    if "answer" in node:
+        yield "answer", node["answer"]
+    elif "profile" in node:
+        yield "profile", node["profile"]
+    for arg in node.get("args", ()):
+        yield from iter_refs(arg)
+    if "arg" in node:
+        yield from iter_refs(node["arg"])
+
+
+def _check_edge_subset(node: dict, parent: str | None = None) -> None:
+    """Reject what the edge functions' JavaScript rewrite cannot evaluate."""
+    op = node["op"]
+    if op in ("not", "ne"):
+        raise ConditionError(
+            f"{unparse_condition(node)!r}: 'not', 'not in' and '!=' are not supported"
+        )
+    if op == "or" and parent == "and":
+        raise ConditionError(f"{unparse_condition(node)!r}: 'or' cannot be nested in 'and'")
+    for index, arg in enumerate(node.get("args", ())):
+        if op == "or" and index < len(node["args"]) - 1:
+            if any(kind == "profile" for kind, _key in iter_refs(arg)):
+                raise ConditionError(
+                    f"{unparse_condition(arg)!r}: a profile comparison must be the last "
+                    "argument of 'or'"
+                )
+        _check_edge_subset(arg, op)
+
+
+def validate_condition(
+    node: dict,
+    answer_domains: Mapping[str, Iterable[object]],
+    profile_domains: Mapping[str, Iterable[object]],
+) -> None:
+    """Check the edge-evaluable subset, every ref and every compared value."""
+    _check_edge_subset(node)
+    _validate_refs(node, answer_domains, profile_domains)
+
+
+def _validate_refs(
+    node: dict,
+    answer_domains: Mapping[str, Iterable[object]],
+    profile_domains: Mapping[str, Iterable[object]],
+) -> None:
+    op = node["op"]
+    if op in ("and", "or"):
+        for arg in node["args"]:
+            _validate_refs(arg, answer_domains, profile_domains)
+        return
+    if op == ALWAYS:
+        return
+
+    if "answer" in node:
+        kind, key, domains = "answer", node["answer"], answer_domains
+    else:
+        kind, key, domains = "profile", node["profile"], profile_domains
+    if key not in domains:
+        raise ConditionError(f"Unknown {kind} reference {key!r}")
+    domain = set(domains[key])
+    values = node["values"] if op == "in" else [node["value"]]
+    unknown = [value for value in values if value not in domain]
+    if unknown:
+        raise ConditionError(f"Values {unknown!r} are not valid for {kind} {key!r}")
+
+
+def _literal(value: object) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    text = str(value)
+    return f'"{text}"' if "'" in text else f"'{text}'"
+
+
+def unparse_condition(node: dict) -> str:
+    """Render an AST back into the condition syntax accepted by the parser."""
+    op = node["op"]
+    if op == ALWAYS:
+        return ALWAYS
+    if op in ("and", "or"):
+        parts = []
+        for arg in node["args"]:
+            text = unparse_condition(arg)
+            parts.append(f"({text})" if op == "and" and arg["op"] == "or" else text)
+        return f" {op} ".join(parts)
+    if op == "not":
+        arg = node["arg"]
+        if arg["op"] == "in":
+            return _unparse_comparison(arg, "not in")
+        text = unparse_condition(arg)
+        return f"not {text}" if arg["op"] in ("eq", "ne") else f"not ({text})"
+    return _unparse_comparison(node, {"in": "in", "eq": "==", "ne": "!="}[op])
+
+
+def _unparse_comparison(node: dict, operator: str) -> str:
+    if "answer" in node:
+        ref = f"answers[{_literal(node['answer'])}]"
+    else:
+        ref = f"profile.{node['profile']}"
+    if "values" in node:
+        return f"{ref} {operator} [{','.join(_literal(value) for value in node['values'])}]"
+    return f"{ref} {operator} {_literal(node['value'])}"
+
+
+def complement_condition(
+    node: dict,
+    answer_domains: Mapping[str, Iterable[object]],
+    profile_domains: Mapping[str, Iterable[object]],
+) -> dict:
+    """Return the complement of a condition over answered inputs.
+
+    ``and``/``or`` are swapped by De Morgan, ``in`` keeps the remaining
+    domain values in domain order and boolean comparisons flip their value,
+    so for every assignment of domain values to the referenced inputs
+    exactly one of the two holds. While an input the condition reads is
+    missing both can be false (``==``/``in`` on it fail on either side), so
+    the complement only equals ``not`` the condition once every input is
+    set. The two never both hold.
+    """
+    op = node["op"]
+    if op in ("and", "or"):
+        args = [complement_condition(arg, answer_domains, profile_domains) for arg in node["args"]]
+        return _combine("or" if op == "and" else "and", args)
+    if op == "not":
+        return _copy_ast(node["arg"])
+    if op == ALWAYS:
+        raise ConditionError("'always' has no satisfiable complement")
+
+    kind = "answer" if "answer" in node else "profile"
+    key = node[kind]
+    domain = list((answer_domains if kind == "answer" else profile_domains)[key])
+    excluded = node["values"] if op == "in" else [node["value"]]
+    if op == "ne":
+        remaining = excluded
+    else:
+        remaining = [value for value in domain if value not in excluded]
+    if not remaining:
+        raise ConditionError(f"{unparse_condition(node)!r} covers every value of {key!r}")
+    if op == "in" or len(remaining) > 1:
+        return {"op": "in", kind: key, "values": remaining}
+    return {"op": "eq", kind: key, "value": remaining[0]}
+
+
+def prove_complement(
+    node: dict,
+    complement: dict,
+    answer_domains: Mapping[str, Iterable[object]],
+    profile_domains: Mapping[str, Iterable[object]],
+) -> int:
+    """Check that exactly one condition holds for every answered assignment.
+
+    Enumerates the full domain of every referenced input and returns the
+    number of assignments checked; raises ``ConditionError`` on the first
+    assignment where both or neither condition holds.
+    """
+    refs = list(dict.fromkeys([*iter_refs(node), *iter_refs(complement)]))
+    domains = [
+        list((answer_domains if kind == "answer" else profile_domains)[key]) for kind, key in refs
+    ]
+    condition, inverse = compile_ast(node), compile_ast(complement)
+    checked = 0
+    for values in product(*domains):
+        answers: dict = {}
+        profile: dict = {}
+        for (kind, key), value in zip(refs, values):
+            if kind == "answer":
+                answers[key] = value
+                continue
+            *parents, leaf = key.split(".")
+            target = profile
+            for part in parents:
+                target = target.setdefault(part, {})
+            target[leaf] = value
+        if condition(answers, profile) == inverse(answers, profile):
+            assignment = ", ".join(f"{key}={value!r}" for (_kind, key), value in zip(refs, values))
+            raise ConditionError(
+                f"{unparse_condition(complement)!r} is not the complement of "
+                f"{unparse_condition(node)!r} at {assignment}"
+            )
+        checked += 1
+    return checked
+
+
+def _profile_getter(field: str) -> Callable[[Mapping], object]:
+    parts = tuple(field.split("."))
+
+    def get(profile: Mapping) -> object:
+        current: object = profile
+        for part in parts:
+            # profile_json decodes to dicts; a dict check is far cheaper than Mapping.
+            if not isinstance(current, dict):
+                return None
+            current = current.get(part)
+        return current
+
+    return get
+
+
+def compile_ast(node: dict) -> Condition:
+    op = node["op"]
+    if op == ALWAYS:
+        return lambda answers, profile: True
+    if op == "not":
+        inner = compile_ast(node["arg"])
+        return lambda answers, profile: not inner(answers, profile)
+    if op == "and":
+        return reduce(_and, map(compile_ast, node["args"]))
+    if op == "or":
+        return reduce(_or, map(compile_ast, node["args"]))
+
+    if "answer" in node:
+        question_id = node["answer"]
+        if op == "in":
+            values = frozenset(node["values"])
+            return lambda answers, profile: answers.get(question_id) in values
+        value = node["value"]
+        if op == "eq":
+            return lambda answers, profile: answers.get(question_id) == value
+        return lambda answers, profile: answers.get(question_id) != value
+
+    get = _profile_getter(node["profile"])
+    if op == "in":
+        values = tuple(node["values"])
+        return lambda answers, profile: get(profile) in values
+    value = node["value"]
+    if op == "eq":
+        return lambda answers, profile: get(profile) == value
+    return lambda answers, profile: get(profile) != value
+
+
+def _and(left: Condition, right: Condition) -> Condition:
+    return lambda answers, profile: left(answers, profile) and right(answers, profile)
+
+
+def _or(left: Condition, right: Condition) -> Condition:
+    return lambda answers, profile: left(answers, profile) or right(answers, profile)
+
+
+@lru_cache(maxsize=None)
+def compile_condition(expression: str | None) -> Condition:
+    return compile_ast(_parse_cached(expression or ALWAYS))
+
+
+def schema_domains(schema: Mapping) -> tuple[dict, dict]:
+    answer_domains = {
+        q["id"]: [option["value"] for option in q["options"]] for q in schema["questions"]
+    }
+    profile_domains = {
+        q["field"]: list(q.get("value_map", {}).values())
+        or [option["value"] for option in q["options"]]
+        for q in schema["profile_questions"]
+    }
+    return answer_domains, profile_domains
+
+
+def validate_schema_conditions(schema: Mapping) -> None:
+    answer_domains, profile_domains = schema_domains(schema)
+    expressions = [(q["id"], q.get("applies_if")) for q in schema["questions"]]
+    for kind in ("profile_gates", "soft_gates"):
+        expressions += [
+            (f"{kind}[{index}]", gate["when"])
+            for index, gate in enumerate(schema.get(kind, []))
+        ]
+    for owner, expression in expressions:
+        try:
+            validate_condition(parse_condition(expression), answer_domains, profile_domains)
+        except ConditionError as error:
+            raise ConditionError(f"{owner}: {error}") from error
+
+
+def compile_schema(schema: Mapping) -> dict:
+    """Compile every question and gate condition of a schema exactly once."""
+    return {
+        "questions": [
+            (q["id"], q["section_id"], compile_condition(q.get("applies_if")))
+            for q in schema["questions"]
+        ],
+        "profile_gates": [
+            compile_condition(gate["when"]) for gate in schema.get("profile_gates", [])
+        ],
+        "soft_gates": [
+            compile_condition(gate["when"]) for gate in schema.get("soft_gates", [])
+        ],
+    }
+
+
+def compile_condition_table(table: Mapping[str, Mapping]) -> dict[str, Condition]:
+    """Compile a schema ``conditions`` table (id -> expression/ast/ops)."""
+    return {ref: compile_ast(entry["ast"]) for ref, entry in table.items()}
+
+
+def evaluate_condition_table(
+    compiled: Mapping[str, Condition], answers: Mapping, profile: Mapping
+) -> dict[str, bool]:
+    """Evaluate every distinct condition once for one assessment state."""
+    return {ref: condition(answers, profile) for ref, condition in compiled.items()}
+
+
+def applicable_questions(compiled: Mapping, answers: Mapping, profile: Mapping) -> list[str]:
+    return [
+        question_id
+        for question_id, _section_id, condition in compiled["questions"]
+        if condition(answers, profile)
+    ]
+
+
+def _value_sets(node: dict, sets: dict[tuple[str, str], list]) -> None:
+    """Collect the distinct literal sets each input is compared against."""
+    op = node["op"]
+    if op == ALWAYS:
+        return
+    if op == "not":
+        _value_sets(node["arg"], sets)
+        return
+    if op in ("and", "or"):
+        for arg in node["args"]:
+            _value_sets(arg, sets)
+        return
+    kind = "answer" if "answer" in node else "profile"
+    values = list(node["values"]) if op == "in" else [node["value"]]
+    compared = sets.setdefault((kind, node[kind]), [])
+    if values not in compared:
+        compared.append(values)
+
+
+class ApplicabilityCache:
+    """LRU memo of every question's applicability, keyed by the gating inputs.
+
+    A condition only compares its inputs for equality with literals, so an
+    input matters only through which of those literal sets contain its
+    value. The key packs one bit per (input, literal set) across every
+    ``applies_if``: many assessments share the gating answers (``1.1.B.*``,
+    ``2.1``, the profile flags) and collapse onto one entry. ``applicable``
+    returns the flags in schema question order.
+    """
+
+    def __init__(self, schema: Mapping, maxsize: int = 65_536):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._conditions = [compile_condition(q.get("applies_if")) for q in schema["questions"]]
+        sets: dict[tuple[str, str], list] = {}
+        for question in schema["questions"]:
+            _value_sets(parse_condition(question.get("applies_if")), sets)
+        self._answer_inputs: list[tuple[str, dict]] = []
+        self._profile_inputs: list[tuple[Callable[[Mapping], object], dict]] = []
+        bit = 0
+        for (kind, key), compared in sets.items():
+            bits: dict = {}
+            for values in compared:
+                for value in values:
+                    bits[value] = bits.get(value, 0) | 1 << bit
+                bit += 1
+            if kind == "answer":
+                self._answer_inputs.append((key, bits))
+            else:
+                self._profile_inputs.append((_profile_getter(key), bits))
+        self._entries: OrderedDict[int, tuple[bool, ...]] = OrderedDict()
+
+    def key(self, answers: Mapping, profile: Mapping) -> int:
+        key = 0
+        for question_id, bits in self._answer_inputs:
+            try:
+                key |= bits.get(answers.get(question_id), 0)
+            except TypeError:  # Unhashable values equal no literal.
+                pass
+        for get, bits in self._profile_inputs:
+            try:
+                key |= bits.get(get(profile), 0)
+            except TypeError:
+                pass
+        return key
+
+    def applicable(self, answers: Mapping, profile: Mapping) -> tuple[bool, ...]:
+        key = self.key(answers, profile)
+        entries = self._entries
+        flags = entries.get(key)
+        if flags is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return flags
+        self.misses += 1
+        flags = tuple([condition(answers, profile) for condition in self._conditions])
+        entries[key] = flags
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return flags
+
+    def info(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._entries),
+        }
+
+
+def condition_ops(node: dict) -> list[list]:
+    """Flatten an AST into a postfix opcode list for stack-based evaluators.
+
+    Leaves push a boolean: ``["always"]``, ``["in", kind, key, values]``,
+    ``["eq", kind, key, value]`` and ``["ne", kind, key, value]`` where
+    ``kind`` is ``"answer"`` or ``"profile"``. ``["not"]`` negates the top of
+    the stack and ``["and", n]`` / ``["or", n]`` replace the top ``n`` entries.
+    """
+    op = node["op"]
+    if op == ALWAYS:
+        return [[ALWAYS]]
+    if op == "not":
+        return condition_ops(node["arg"]) + [["not"]]
+    if op in ("and", "or"):
+        ops = [item for arg in node["args"] for item in condition_ops(arg)]
+        return ops + [[op, len(node["args"])]]
+    kind = "answer" if "answer" in node else "profile"
+    operand = node["values"] if op == "in" else node["value"]
+    return [[op, kind, node[kind], operand]]
+
+
+def evaluate_ops(ops: list[list], answers: Mapping, profile: Mapping) -> bool:
+    stack: list[bool] = []
+    for item in ops:
+        op = item[0]
+        if op == ALWAYS:
+            stack.append(True)
+        elif op == "not":
+            stack.append(not stack.pop())
+        elif op in ("and", "or"):
+            count = item[1]
+            args = stack[-count:]
+            del stack[-count:]
+            stack.append(all(args) if op == "and" else any(args))
+        else:
+            _op, kind, key, operand = item
+            value = answers.get(key) if kind == "answer" else _profile_getter(key)(profile)
+            if op == "in":
+                stack.append(value in operand)
+            elif op == "eq":
+                stack.append(value == operand)
+            else:
+                stack.append(value != operand)
+    return stack.pop()
@@ -0,0 +1,266 @@
+"""Marginal score gains: what each answer change is worth, for whole populations.
+
+For every applicable question that is unanswered or scored below its best
+answer, ``GainEngine`` computes how much the overall score would rise if
+that question moved to its best answer (``yes``, except where a
+``score_value`` inverts it). Gains use the unrounded section averages and
+unrounded overall, weighted as in ``BatchScorer``, so small moves still
+rank instead of disappearing into ``Math.round``.
+
+Questions that gate nothing get a closed form over ``(N, Q)`` arrays: only
+their own section's totals change, and the overall is re-averaged with that
+section included. Moving a question that other questions' ``applies_if``
+reads can change which answers count, so for those the gated conditions are
+re-evaluated and only the affected columns rescored::
+
+    python supabase/seed/readiness_gains.py exports.jsonl --top 5 > next_steps.jsonl
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Iterable, Mapping, TextIO
+
+import numpy as np
+
+from readiness_batch import DEFAULT_CHUNK_SIZE, SCHEMA_PATH, UNANSWERED, BatchScorer, load_schema
+from readiness_conditions import ALWAYS, iter_refs, parse_condition
+
+
+class GainEngine:
+    def __init__(self, schema: Mapping):
+        self.scorer = scorer = BatchScorer(schema)
+        question_count = len(scorer.question_ids)
+        code_count = len(scorer.answer_values) + 1
+
+        self.section_of = scorer.membership.argmax(axis=1)
+        self.section_weight_of = scorer.section_weights[self.section_of].astype(np.float32)
+        fractions = np.where(np.isnan(scorer.fractions), -np.inf, scorer.fractions)
+        self.best_codes = fractions.argmax(axis=1).astype(np.uint8)
+        self.best_fractions = fractions.max(axis=1)
+        self.has_best = np.isfinite(self.best_fractions)
+        self.best_points = np.where(
+            self.has_best, self.best_fractions * 100.0 * scorer.question_weights, 0.0
+        ).astype(np.float32)
+        self.question_weights = scorer.question_weights.astype(np.float32)
+        self.cell_fractions = scorer.fractions.ravel()
+        self.cell_offsets = (np.arange(question_count) * code_count).astype(np.intp)
+
+        # For each gating question: the grouped conditions that read it and
+        # the columns (itself plus the questions they gate) a move can change.
+        gated_by: dict[int, list] = {}
+        for indexes, condition in scorer.conditions:
+            expression = schema["questions"][indexes[0]].get("applies_if") or ALWAYS
+            for kind, key in iter_refs(parse_condition(expression)):
+                if kind == "answer":
+                    entries = gated_by.setdefault(scorer.question_index[key], [])
+                    if not entries or entries[-1][1] is not condition:
+                        entries.append((indexes, condition))
+        self.gating: list[tuple[int, list, np.ndarray]] = []
+        for q_index, entries in sorted(gated_by.items()):
+            columns = sorted({q_index, *(index for indexes, _ in entries for index in indexes)})
+            # Condition targets as positions within ``columns``.
+            local = [
+                ([columns.index(index) for index in indexes], condition)
+                for indexes, condition in entries
+            ]
+            self.gating.append((q_index, local, np.array(columns, dtype=np.intp)))
+
+    def _cells(
+        self, answers: np.ndarray, applicable: np.ndarray, columns: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-question weighted points and weights counted for every row.
+
+        ``columns`` says which questions ``answers``/``applicable`` hold.
+        """
+        offsets = self.cell_offsets if columns is None else self.cell_offsets[columns]
+        cells = answers.astype(np.intp) + offsets
+        points = self.scorer.cell_points.take(cells) * applicable
+        weights = self.scorer.cell_weights.take(cells) * applicable
+        return cells, points, weights
+
+    def _overall(self, totals: np.ndarray, weights: np.ndarray) -> tuple[np.ndarray, ...]:
+        """Unrounded section scores, counted section weights and overall."""
+        scores = np.divide(totals, weights, out=np.zeros_like(totals), where=weights > 0)
+        counted = (weights > 0) * self.scorer.section_weights
+        total_weight = counted.sum(axis=1)
+        overall = np.divide(
+            (scores * counted).sum(axis=1),
+            total_weight,
+            out=np.zeros_like(total_weight),
+            where=total_weight > 0,
+        )
+        return scores, counted, overall
+
+    def overall(self, answers: np.ndarray, profile: np.ndarray) -> np.ndarray:
+        """Unrounded overall score of every row."""
+        membership = self.scorer.membership
+        _cells, points, weights = self._cells(
+            answers, self.scorer.applicability(answers, profile)
+        )
+        totals = (points @ membership).astype(np.float64)
+        return self._overall(totals, (weights @ membership).astype(np.float64))[2]
+
+    def _gains_chunk(self, answers: np.ndarray, profile: np.ndarray) -> np.ndarray:
+        scorer = self.scorer
+        membership = scorer.membership
+        applicable = scorer.applicability(answers, profile)
+        cells, points, weights = self._cells(answers, applicable)
+        section_totals = (points @ membership).astype(np.float64)
+        section_weights = (weights @ membership).astype(np.float64)
+        scores, counted, overall = self._overall(section_totals, section_weights)
+
+        current_fraction = self.cell_fractions.take(cells)
+        candidates = (
+            applicable
+            & self.has_best
+            & ((answers == UNANSWERED) | (current_fraction < self.best_fractions))
+        )
+
+        # Closed form: swap the question's points and weight inside its section,
+        # then re-average the overall with that section counted. Points and
+        # weights are exact in float32; gathering with take() keeps the (N, Q)
+        # arrays C-contiguous, and in-place updates keep temporaries to a few.
+        section = self.section_of
+        numerator = (scores * counted).sum(axis=1)[:, None]
+        denominator = counted.sum(axis=1)[:, None]
+        gains = section_totals.astype(np.float32).take(section, axis=1)
+        gains -= points
+        gains += self.best_points
+        new_weights = section_weights.astype(np.float32).take(section, axis=1)
+        new_weights -= weights
+        new_weights += self.question_weights
+        gains /= new_weights
+        gains *= self.section_weight_of
+        gains += (numerator - scores * counted).astype(np.float32).take(section, axis=1)
+        new_weights = (denominator - counted).astype(np.float32).take(section, axis=1)
+        new_weights += self.section_weight_of
+        gains /= new_weights
+        gains -= overall.astype(np.float32)[:, None]
+        gains[~candidates] = np.nan
+
+        # Gating questions: re-evaluate the conditions they feed and rescore
+        # only the columns those conditions gate.
+        for q_index, entries, columns in self.gating:
+            rows = np.flatnonzero(candidates[:, q_index])
+            if not len(rows):
+                continue
+            block = np.ix_(rows, columns)
+            moved = answers[rows]
+            moved[:, q_index] = self.best_codes[q_index]
+            moved_profile = profile[rows]
+            moved_applicable = applicable[block]
+            for positions, condition in entries:
+                moved_applicable[:, positions] = condition(moved, moved_profile)[:, None]
+            _cells, moved_points, moved_weights = self._cells(
+                moved.take(columns, axis=1), moved_applicable, columns
+            )
+            column_membership = membership[columns]
+            moved_totals = section_totals[rows] + (moved_points - points[block]) @ column_membership
+            moved_section_weights = (
+                section_weights[rows] + (moved_weights - weights[block]) @ column_membership
+            )
+            gains[rows, q_index] = (
+                self._overall(moved_totals, moved_section_weights)[2] - overall[rows]
+            )
+        return gains
+
+    def gains(
+        self,
+        answers_matrix: np.ndarray,
+        profile_matrix: np.ndarray,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> np.ndarray:
+        """``(N, Q)`` overall-score gains; NaN where a question is not a candidate."""
+        result = np.empty(answers_matrix.shape, dtype=np.float32)
+        for start in range(0, len(answers_matrix), chunk_size):
+            stop = start + chunk_size
+            result[start:stop] = self._gains_chunk(
+                answers_matrix[start:stop], profile_matrix[start:stop]
+            )
+        return result
+
+    def top_gains(
+        self,
+        answers_matrix: np.ndarray,
+        profile_matrix: np.ndarray,
+        k: int,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """The ``k`` best ``(question indices, gains)`` per row, best first.
+
+        Only one chunk of the full gain matrix is held at a time. Rows with
+        fewer than ``k`` candidates are padded with index ``-1`` and NaN.
+        """
+        rows = len(answers_matrix)
+        k = max(0, min(k, answers_matrix.shape[1]))
+        indices = np.full((rows, k), -1, dtype=np.int16)
+        values = np.full((rows, k), np.nan, dtype=np.float32)
+        if not k:
+            return indices, values
+        for start in range(0, rows, chunk_size):
+            stop = start + chunk_size
+            gains = self._gains_chunk(answers_matrix[start:stop], profile_matrix[start:stop])
+            ranked = np.where(np.isnan(gains), -np.inf, gains)
+            top = np.argpartition(-ranked, k - 1, axis=1)[:, :k]
+            order = np.argsort(-np.take_along_axis(ranked, top, axis=1), axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            best = np.take_along_axis(gains, top, axis=1)
+            found = ~np.isnan(best)
+            indices[start:stop] = np.where(found, top, -1)
+            values[start:stop] = best
+        return indices, values
+
+
+def recommendations(engine: GainEngine, records: Iterable[Mapping], k: int) -> Iterable[dict]:
+    """Yield ``{"assessment_id", "recommendations"}`` for export records."""
+    records = list(records)
+    answers, profile = engine.scorer.encode(
+        (record.get("answers") or {}, record.get("profile") or {}) for record in records
+    )
+    indices, values = engine.top_gains(answers, profile, k)
+    question_ids = engine.scorer.question_ids
+    for record, row_indices, row_values in zip(records, indices.tolist(), values.tolist()):
+        yield {
+            "assessment_id": record.get("assessment_id"),
+            "recommendations": [
+                {"question_id": question_ids[index], "gain": round(gain, 4)}
+                for index, gain in zip(row_indices, row_values)
+                if index >= 0
+            ],
+        }
+
+
+def _read_chunks(handle: TextIO, size: int) -> Iterable[list[dict]]:
+    chunk: list[dict] = []
+    for line in handle:
+        if line.strip():
+            chunk.append(json.loads(line))
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rank next questions by overall-score gain.")
+    parser.add_argument("input", type=Path, help="JSONL export of assessments")
+    parser.add_argument("--schema", type=Path, default=SCHEMA_PATH)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    engine = GainEngine(load_schema(args.schema))
+    with args.input.open(encoding="utf-8") as handle:
+        for chunk in _read_chunks(handle, args.chunk_rows):
+            for result in recommendations(engine, chunk, args.top):
+                sys.stdout.write(json.dumps(result) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Seeded synthetic assessment populations for load tests and benchmarks.
+
+Each record is ``{"assessment_id", "profile", "answers"}`` with a nested
+``profile_json``-shaped profile and answers keyed by question id. Records
+are walked the way a respondent would see them: profile questions first,
+then questions in dependency order, answering a question only while its
+``applies_if`` holds and no profile or soft gate marks it ``na``. Gated
+questions such as ``1.1.A.2`` or ``5.4`` therefore only appear when they
+apply.
+
+Usage::
+
+    python supabase/seed/readiness_population.py --count 1000000 --seed 7 --output pop.jsonl
+"""
+
+import argparse
+import bisect
+import json
+import random
+import sys
+import uuid
+from pathlib import Path
+from typing import Iterator, Mapping, TextIO
+
+from readiness_batch import load_schema
+from readiness_conditions import compile_condition
+from readiness_tables import build_dependency_index
+
+DEFAULT_ANSWER_WEIGHTS = {"yes": 0.4, "partial": 0.2, "no": 0.2, "not_sure": 0.1, "na": 0.1}
+
+
+class PopulationGenerator:
+    """Produce reproducible assessment records from a schema.
+
+    ``answer_weights`` maps ``answer_scoring`` keys to relative weights;
+    options are weighted by their ``score_value`` when they have one.
+    ``profile_true_rate`` is the chance each profile flag is true.
+    ``completion_rate`` is the share of assessments answered to the end; the
+    rest stop after a uniformly random number of applicable questions.
+    Record ``i`` only depends on ``seed`` and ``i``, so ranges can be
+    generated independently and still line up.
+    """
+
+    def __init__(
+        self,
+        schema: Mapping,
+        *,
+        seed: int = 0,
+        answer_weights: Mapping[str, float] | None = None,
+        profile_true_rate: float = 0.5,
+        completion_rate: float = 1.0,
+    ):
+        weights = dict(DEFAULT_ANSWER_WEIGHTS if answer_weights is None else answer_weights)
+        unknown = set(weights) - set(schema["answer_scoring"])
+        if unknown:
+            raise ValueError(f"Unknown answer values in weights: {sorted(unknown)}")
+        if not 0 <= profile_true_rate <= 1 or not 0 <= completion_rate <= 1:
+            raise ValueError("profile_true_rate and completion_rate must be within [0, 1]")
+
+        self.seed = seed
+        self.profile_true_rate = profile_true_rate
+        self.completion_rate = completion_rate
+        self.profile_fields = []
+        for question in schema["profile_questions"]:
+            value_map = question.get("value_map", {})
+            *parents, leaf = question["field"].split(".")
+            self.profile_fields.append(
+                (parents, leaf, value_map.get("yes", True), value_map.get("no", False))
+            )
+
+        gated: dict[str, list] = {}
+        # Soft gates are derived from applies_if and their na gate never holds
+        # while it does, so only profile gates can mark an applicable question na.
+        for gate in schema.get("profile_gates", []):
+            if gate.get("result") == "na":
+                condition = compile_condition(gate["when"])
+                for question_id in gate["questions"]:
+                    gated.setdefault(question_id, []).append(condition)
+
+        questions = {q["id"]: q for q in schema["questions"]}
+        dependencies = schema.get("dependencies") or build_dependency_index(schema)
+        self.questions: list[tuple] = []
+        for question_id in dependencies["order"]:
+            question = questions[question_id]
+            values = [option["value"] for option in question["options"]]
+            option_weights = [
+                weights.get(option.get("score_value", option["value"]), 0.0)
+                for option in question["options"]
+            ]
+            if not any(option_weights):
+                option_weights = [1.0] * len(values)
+            self.questions.append(
+                (
+                    question_id,
+                    compile_condition(question.get("applies_if")),
+                    tuple(gated.get(question_id, ())),
+                    values,
+                    _cumulative(option_weights),
+                )
+            )
+
+    def record(self, index: int) -> dict:
+        rng = random.Random(f"{self.seed}:{index}")
+        profile: dict = {}
+        for parents, leaf, true_value, false_value in self.profile_fields:
+            target = profile
+            for part in parents:
+                target = target.setdefault(part, {})
+            target[leaf] = true_value if rng.random() < self.profile_true_rate else false_value
+
+        limit = None
+        if rng.random() >= self.completion_rate:
+            limit = rng.randrange(len(self.questions))
+        answers: dict[str, str] = {}
+        for question_id, condition, gates, values, cumulative in self.questions:
+            if limit is not None and len(answers) >= limit:
+                break
+            if not condition(answers, profile) or any(gate(answers, profile) for gate in gates):
+                continue
+            pick = bisect.bisect(cumulative, rng.random() * cumulative[-1])
+            answers[question_id] = values[min(pick, len(values) - 1)]
+
+        return {
+            "assessment_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "profile": profile,
+            "answers": answers,
+        }
+
+    def records(self, count: int, start: int = 0) -> Iterator[dict]:
+        for index in range(start, start + count):
+            yield self.record(index)
+
+
+def _cumulative(weights: list[float]) -> list[float]:
+    total = 0.0
+    cumulative = []
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    return cumulative
+
+
+def write_jsonl(records: Iterator[dict], handle: TextIO) -> int:
+    written = 0
+    for record in records:
+        handle.write(json.dumps(record, separators=(",", ":")))
+        handle.write("\n")
+        written += 1
+    return written
+
+
+def _parse_weights(text: str) -> dict[str, float]:
+    weights = {}
+    for item in text.split(","):
+        value, _sep, weight = item.partition("=")
+        weights[value.strip()] = float(weight)
+    return weights
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic readiness assessments as JSONL."
+    )
+    parser.add_argument("--count", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=int, default=0, help="index of the first record")
+    parser.add_argument(
+        "--answer-weights",
+        type=_parse_weights,
+        help="comma-separated value=weight pairs, e.g. yes=5,partial=2,no=2,not_sure=1,na=1",
+    )
+    parser.add_argument("--profile-true-rate", type=float, default=0.5)
+    parser.add_argument("--completion-rate", type=float, default=1.0)
+    parser.add_argument("--output", type=Path, help="JSONL file to write (default: stdout)")
+    args = parser.parse_args()
+
+    generator = PopulationGenerator(
+        load_schema(),
+        seed=args.seed,
+        answer_weights=args.answer_weights,
+        profile_true_rate=args.profile_true_rate,
+        completion_rate=args.completion_rate,
+    )
+    records = generator.records(args.count, args.start)
+    if args.output is None:
+        write_jsonl(records, sys.stdout)
+    else:
+        with args.output.open("w", encoding="utf-8") as handle:
+            write_jsonl(records, handle)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Per-section shards of the readiness schema for lazy loading.
+
+``build_shards`` splits a built schema into a small index, one shard per
+section and a ``tables`` shard. The index carries what every consumer needs
+up front (dimensions, sections, profile questions, profile gates with their
+conditions, scoring and bands) plus each shard's file, key and
+``content_hash``; a section shard carries that section's questions, soft
+gates, conditions, routing steps and max points. Edge functions working on
+section ``6`` then load ``index`` and ``section:6`` instead of the whole
+document.
+
+The ``tables`` shard holds the derived ``SHARDED_TABLES``, which only
+offline tooling reads. ``served_schema`` drops them from the
+``schema_json`` row every edge function fetches; the schema's
+``table_shard`` entry (see ``table_shard_ref``) points at that row instead.
+
+The generator writes the files next to the seed schema and upserts them as
+rows of ``readiness_v1.assessment_schema_shards``.
+"""
+
+import json
+from pathlib import Path
+from typing import Mapping
+
+from readiness_artifacts import HASH_KEY, read_content_hash, with_content_hash
+
+INDEX_KEY = "index"
+INDEX_FILE = "index.json"
+TABLES_KEY = "tables"
+TABLES_FILE = "tables.json"
+SHARDS_TABLE = "readiness_v1.assessment_schema_shards"
+
+# Derived schema keys served from the ``tables`` shard instead of ``schema_json``.
+# ``conditions`` stays in the row: its ``applies_if_ref``/``when_ref`` entries
+# resolve against it.
+SHARDED_TABLES = (
+    "dependencies",
+    "profile_applicability",
+    "routing",
+    "score_tables",
+    "encoding",
+)
+
+
+def shard_key(section_id: str) -> str:
+    return f"section:{section_id}"
+
+
+def shard_file(section_id: str) -> str:
+    return f"section_{section_id}.json"
+
+
+def build_tables_shard(schema: Mapping) -> dict:
+    tables = {key: schema[key] for key in SHARDED_TABLES if key in schema}
+    return with_content_hash(
+        {"assessment_id": schema["assessment_id"], "version": schema["version"], **tables}
+    )
+
+
+def table_shard_ref(schema: Mapping) -> dict:
+    """``table_shard`` entry of a built schema: where its ``SHARDED_TABLES`` are served."""
+    return {
+        "key": TABLES_KEY,
+        HASH_KEY: build_tables_shard(schema)[HASH_KEY],
+        "tables": [key for key in SHARDED_TABLES if key in schema],
+    }
+
+
+def served_schema(schema: Mapping) -> dict:
+    """The ``schema_json`` row: ``schema`` without the tables its ``table_shard`` lists.
+
+    ``content_hash`` still covers the whole build, and ``table_shard`` pins
+    the hash of the ``tables`` shard row holding what was dropped. Schemas
+    built before ``table_shard`` existed are served whole.
+    """
+    sharded = set((schema.get("table_shard") or {}).get("tables", ()))
+    return {key: value for key, value in schema.items() if key not in sharded}
+
+
+def build_shards(schema: Mapping) -> tuple[dict, dict[str, dict]]:
+    """Return ``(index, {shard_id: shard})``, each with its own content hash.
+
+    Shard ids are the section ids plus ``tables``. Shard hashes only cover
+    their own content, so editing one section changes that shard and the
+    index but leaves the other shards alone.
+    """
+    conditions = schema["conditions"]
+    steps = schema["routing"]["steps"]
+    max_points = schema["score_tables"]["question_max_points"]
+    section_of = {question["id"]: question["section_id"] for question in schema["questions"]}
+
+    shards: dict[str, dict] = {}
+    for bounds in schema["routing"]["sections"]:
+        section_id = bounds["section_id"]
+        questions = schema["questions"][bounds["start"] : bounds["stop"]]
+        soft_gates = [
+            gate
+            for gate in schema["soft_gates"]
+            if any(section_of.get(qid) == section_id for qid in gate["questions"])
+        ]
+        refs = [question.get("applies_if_ref") for question in questions]
+        refs += [gate.get("when_ref") for gate in soft_gates]
+        shard = {
+            "assessment_id": schema["assessment_id"],
+            "version": schema["version"],
+            "section_id": section_id,
+            "section": next(s for s in schema["sections"] if s["id"] == section_id),
+            "questions": questions,
+            "soft_gates": soft_gates,
+            "conditions": {ref: conditions[ref] for ref in sorted(filter(None, set(refs)))},
+            "routing": {
+                "start": bounds["start"],
+                "stop": bounds["stop"],
+                "steps": steps[bounds["start"] : bounds["stop"]],
+            },
+            "question_max_points": {
+                question["id"]: max_points[question["id"]] for question in questions
+            },
+        }
+        shards[section_id] = with_content_hash(shard)
+    entries = {
+        section_id: {
+            "key": shard_key(section_id),
+            "file": shard_file(section_id),
+            HASH_KEY: shard[HASH_KEY],
+            "question_count": len(shard["questions"]),
+        }
+        for section_id, shard in shards.items()
+    }
+    shards[TABLES_KEY] = build_tables_shard(schema)
+    entries[TABLES_KEY] = {
+        "key": TABLES_KEY,
+        "file": TABLES_FILE,
+        HASH_KEY: shards[TABLES_KEY][HASH_KEY],
+    }
+
+    gate_refs = sorted(filter(None, {gate.get("when_ref") for gate in schema["profile_gates"]}))
+    index = {
+        "assessment_id": schema["assessment_id"],
+        "version": schema["version"],
+        "schema_content_hash": schema[HASH_KEY],
+        "dimensions": schema["dimensions"],
+        "sections": schema["sections"],
+        "profile_questions": schema["profile_questions"],
+        "profile_gates": schema["profile_gates"],
+        "conditions": {ref: conditions[ref] for ref in gate_refs},
+        "answer_scoring": schema["answer_scoring"],
+        "flags": schema["flags"],
+        "score_bands": schema["score_bands"],
+        "score_tables": {
+            key: value
+            for key, value in schema["score_tables"].items()
+            if key != "question_max_points"
+        },
+        "shards": entries,
+    }
+    return with_content_hash(index), shards
+
+
+def shard_json(shard: Mapping) -> str:
+    return json.dumps(shard, separators=(",", ":"), ensure_ascii=True)
+
+
+def shard_files(index: Mapping, shards: Mapping[str, Mapping]) -> dict[str, str]:
+    """File name -> serialized text for the index and every shard."""
+    files = {INDEX_FILE: shard_json(index)}
+    for shard_id, shard in shards.items():
+        files[index["shards"][shard_id]["file"]] = shard_json(shard)
+    return files
+
+
+def read_index(directory: Path) -> dict | None:
+    try:
+        return json.loads((directory / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def load_shard(directory: Path, shard_id: str, index: Mapping | None = None) -> dict:
+    """Load one section's (or the ``tables``) shard, checking it against the index hash."""
+    index = index or read_index(directory)
+    if index is None:
+        raise FileNotFoundError(f"No shard index in {directory}")
+    entry = index["shards"][shard_id]
+    path = directory / entry["file"]
+    if read_content_hash(path) != entry[HASH_KEY]:
+        raise ValueError(f"Shard {path.name} does not match the index content_hash")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def shard_rows_sql(
+    index: Mapping, shards: Mapping[str, Mapping], previous: Mapping | None = None
+) -> str | None:
+    """Upsert the index and changed shards; ``None`` when nothing changed.
+
+    ``previous`` is the index the stored rows were generated from. Rows of
+    shards no longer in the index are deleted.
+    """
+    if previous is not None and previous.get(HASH_KEY) == index[HASH_KEY]:
+        return None
+    previous_hashes = {
+        entry["key"]: entry[HASH_KEY] for entry in (previous or {}).get("shards", {}).values()
+    }
+    entries = index["shards"]
+    rows = [(INDEX_KEY, index)]
+    rows += [
+        (entries[shard_id]["key"], shard)
+        for shard_id, shard in shards.items()
+        if previous_hashes.get(entries[shard_id]["key"]) != shard[HASH_KEY]
+    ]
+    assessment_id, version = index["assessment_id"], index["version"]
+    values = ",\n".join(
+        f"  ('{assessment_id}', '{version}', '{key}', '{document[HASH_KEY]}', "
+        f"$json${shard_json(document)}$json$::jsonb)"
+        for key, document in rows
+    )
+    keys = ", ".join(f"'{key}'" for key in [INDEX_KEY, *(e["key"] for e in entries.values())])
+    return f"""-- Readiness schema shards {index[HASH_KEY][:12]} ({len(rows)} rows)
+insert into {SHARDS_TABLE} (assessment_id, version, shard_key, content_hash, shard_json)
+values
+{values}
+on conflict (assessment_id, version, shard_key)
+ do update set content_hash = excluded.content_hash,
+   shard_json = excluded.shard_json,
+   updated_at = now();
+
+delete from {SHARDS_TABLE}
+where assessment_id = '{assessment_id}'
+  and version = '{version}'
+  and shard_key not in ({keys});
+"""
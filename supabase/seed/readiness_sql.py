@@ -0,0 +1,164 @@
+"""Set-based SQL scoring generated from the readiness schema.
+
+``scoring_function_sql`` renders ``readiness_v1.score_assessments``, a
+``language sql`` function that scores stored assessments next to the data::
+
+    select * from readiness_v1.score_assessments();                   -- all
+    select * from readiness_v1.score_assessments(array['<uuid>']::uuid[]);
+
+Every ``applies_if`` is translated into a SQL predicate over the aggregated
+answers and the subject's ``profile_json`` with the same semantics as
+``readiness_conditions``. Schemas only use the comparisons the edge functions
+can evaluate (see ``validate_schema_conditions``), so a missing input never
+matches. Answers are scored through ``answer_scoring``
+(honouring option ``score_value``) and combined exactly like
+``BatchScorer``: weighted section averages rounded half up, then an overall
+average weighted by section weight over the sections with scores.
+"""
+
+import json
+from typing import Mapping
+
+from readiness_conditions import ALWAYS, parse_condition
+
+SCORING_FUNCTION = "readiness_v1.score_assessments"
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _number(value: float) -> str:
+    return format(value, "g") if value != int(value) else str(int(value))
+
+
+def condition_sql(node: dict, *, answers: str = "i.answers", profile: str = "i.profile") -> str:
+    """Translate a parsed condition into a SQL boolean that is never null."""
+    op = node["op"]
+    if op == ALWAYS:
+        return "true"
+    if op == "not":
+        return f"not ({condition_sql(node['arg'], answers=answers, profile=profile)})"
+    if op in ("and", "or"):
+        parts = [condition_sql(arg, answers=answers, profile=profile) for arg in node["args"]]
+        return "(" + f" {op} ".join(parts) + ")"
+
+    values = node["values"] if op == "in" else [node["value"]]
+    if "answer" in node:
+        operand = f"{answers}->>{_literal(node['answer'])}"
+        literals = [_literal(value) for value in values]
+    else:
+        path = "{" + ",".join(node["profile"].split(".")) + "}"
+        operand = f"{profile}#>{_literal(path)}"
+        literals = [
+            _literal(json.dumps(value, separators=(",", ":"))) + "::jsonb" for value in values
+        ]
+    if len(literals) == 1:
+        comparison = f"{operand} = {literals[0]}"
+    else:
+        comparison = f"{operand} in ({', '.join(literals)})"
+    # ``is true`` folds the null of a missing input into false.
+    return f"({comparison}) is {'not ' if op == 'ne' else ''}true"
+
+
+def _fraction_sql(question: Mapping, answer_scoring: Mapping, answers: str) -> str:
+    # The last option with a repeated value decides its score, as in ``BatchScorer``.
+    scores = {
+        option["value"]: answer_scoring.get(option.get("score_value", option["value"]))
+        for option in question["options"]
+    }
+    whens = " ".join(
+        f"when {_literal(value)} then {_number(score)}"
+        for value, score in scores.items()
+        if score is not None
+    )
+    if not whens:
+        return "null::numeric"
+    return f"case {answers}->>{_literal(question['id'])} {whens} end"
+
+
+def scoring_function_sql(schema: Mapping) -> str:
+    """Render ``create or replace function readiness_v1.score_assessments``.
+
+    The function returns ``(id, overall_score, dimension_scores)`` for the
+    schema's ``assessment_id``/``version``, either for every assessment or
+    only for the ids passed in; ``dimension_scores`` maps every section id
+    to its score (0 when nothing in it was scored).
+    """
+    cells = []
+    for question in schema["questions"]:
+        fraction = _fraction_sql(question, schema["answer_scoring"], "i.answers")
+        expression = question.get("applies_if") or ALWAYS
+        if expression != ALWAYS:
+            fraction = f"case when {condition_sql(parse_condition(expression))} then {fraction} end"
+        cells.append(
+            f"      ({_literal(question['section_id'])}, "
+            f"{_number(question.get('weight', 1))}::numeric, {fraction})"
+        )
+    section_weights = ",\n      ".join(
+        f"({_literal(section['id'])}, {_number(section['weight'])}::numeric)"
+        for section in schema["sections"]
+    )
+    cell_rows = ",\n".join(cells)
+
+    return f"""-- Set-based readiness scoring for {schema['assessment_id']} {schema['version']}
+create or replace function {SCORING_FUNCTION}(assessment_ids uuid[] default null)
+returns table (id uuid, overall_score integer, dimension_scores jsonb)
+language sql
+stable
+as $function$
+  with inputs as (
+    select
+      a.id,
+      coalesce(p.profile_json, '{{}}'::jsonb) as profile,
+      coalesce(
+        (
+          select jsonb_object_agg(aa.question_id, aa.answer_value)
+          from readiness_v1.assessment_answers aa
+          where aa.assessment_id = a.id
+        ),
+        '{{}}'::jsonb
+      ) as answers
+    from readiness_v1.assessments a
+    left join readiness_v1.profile_intake p on p.subject_id = a.subject_id
+    where a.assessment_id = {_literal(schema['assessment_id'])}
+      and a.schema_version = {_literal(schema['version'])}
+      and (assessment_ids is null or a.id = any(assessment_ids))
+  ),
+  cells as (
+    select i.id, c.section_id, c.weight, c.fraction
+    from inputs i
+    cross join lateral (values
+{cell_rows}
+    ) as c(section_id, weight, fraction)
+  ),
+  scored as (
+    select
+      c.id,
+      c.section_id,
+      floor(sum(c.fraction * 100 * c.weight) / sum(c.weight) + 0.5)::integer as score
+    from cells c
+    where c.fraction is not null
+    group by c.id, c.section_id
+  )
+  select
+    i.id,
+    coalesce(
+      floor(
+        sum(s.score * w.weight)
+          / nullif(sum(w.weight) filter (where s.score is not null), 0)
+          + 0.5
+      )::integer,
+      0
+    ) as overall_score,
+    jsonb_object_agg(w.section_id, coalesce(s.score, 0)) as dimension_scores
+  from inputs i
+  cross join (values
+      {section_weights}
+  ) as w(section_id, weight)
+  left join scored s on s.id = i.id and s.section_id = w.section_id
+  group by i.id
+$function$;
+
+grant execute on function {SCORING_FUNCTION}(uuid[]) to authenticated, service_role;
+"""
@@ -0,0 +1,260 @@
+"""Incrementally maintained readiness score state for replays and live sessions.
+
+``AssessmentState`` keeps question applicability, per-section sums and counts
+and the overall weighted score. ``apply_answer`` and ``apply_profile`` only
+touch the changed question and the questions whose conditions read the
+changed input (from the schema's ``dependencies`` index), so a single event
+costs O(dependents) instead of a full pass over every question and section.
+"""
+
+import math
+from typing import Iterable, Mapping
+
+from readiness_conditions import ApplicabilityCache, compile_condition
+from readiness_tables import (
+    build_dependency_index,
+    build_routing_table,
+    build_score_tables,
+    next_open_question,
+)
+
+
+def _round(value: float) -> int:
+    return math.floor(value + 0.5)
+
+
+def _set_path(target: dict, field: str, value: object) -> None:
+    *parents, leaf = field.split(".")
+    for part in parents:
+        child = target.get(part)
+        if not isinstance(child, dict):
+            child = target[part] = {}
+        target = child
+    if value is None:
+        target.pop(leaf, None)
+    else:
+        target[leaf] = value
+
+
+class _Section:
+    __slots__ = (
+        "id",
+        "weight",
+        "applicable",
+        "answered",
+        "points",
+        "scored_weight",
+        "score",
+        "counted",
+    )
+
+    def __init__(self, section_id: str, weight: int):
+        self.id = section_id
+        self.weight = weight
+        self.applicable = 0
+        self.answered = 0
+        self.points = 0.0
+        self.scored_weight = 0
+        self.score = 0
+        self.counted = False
+
+
+class AssessmentState:
+    def __init__(
+        self,
+        schema: Mapping,
+        answers: Mapping[str, str] | None = None,
+        profile: Mapping | None = None,
+        *,
+        applicability: ApplicabilityCache | None = None,
+    ):
+        """Score ``answers`` and ``profile`` from scratch.
+
+        A replay can share one ``applicability`` cache, built from the same
+        schema, across its states so assessments with the same gating inputs
+        reuse one evaluation of every ``applies_if``.
+        """
+        scoring = schema["answer_scoring"]
+        self._questions: dict[str, tuple] = {}
+        for question in schema["questions"]:
+            # The last option with a value decides its score, as in BatchScorer.
+            fractions: dict[str, float | None] = {
+                option["value"]: scoring.get(option.get("score_value", option["value"]))
+                for option in question["options"]
+            }
+            self._questions[question["id"]] = (
+                question["section_id"],
+                question.get("weight", 1),
+                compile_condition(question.get("applies_if")),
+                fractions,
+            )
+
+        dependencies = schema.get("dependencies") or build_dependency_index(schema)
+        self._answer_dependents = {
+            key: entry["questions"] for key, entry in dependencies["answers"].items()
+        }
+        self._profile_dependents = {
+            key: entry["questions"] for key, entry in dependencies["profile"].items()
+        }
+        self._routing = schema.get("routing") or build_routing_table(schema)
+        self._order = [step["id"] for step in self._routing["steps"]]
+        self._position = {question_id: index for index, question_id in enumerate(self._order)}
+        # Every question before the frontier is answered or not applicable.
+        self._frontier = 0
+        score_tables = schema.get("score_tables") or build_score_tables(schema)
+        self._band_labels = [
+            schema["score_bands"][index]["label"] for index in score_tables["band_lookup"]
+        ]
+
+        self.answers: dict[str, str] = dict(answers or {})
+        self.profile: dict = _copy_profile(profile or {})
+        self.applicable: dict[str, bool] = {}
+        self.sections = {s["id"]: _Section(s["id"], s["weight"]) for s in schema["sections"]}
+        self._weighted_sum = 0
+        self._total_weight = 0
+
+        if applicability is None:
+            flags = [
+                condition(self.answers, self.profile)
+                for _section_id, _weight, condition, _fractions in self._questions.values()
+            ]
+        else:
+            flags = applicability.applicable(self.answers, self.profile)
+        for question_id, applicable in zip(self._questions, flags):
+            self.applicable[question_id] = applicable
+            self._count(question_id, 1)
+        for section in self.sections.values():
+            self._refresh(section)
+
+    def _count(self, question_id: str, sign: int) -> _Section | None:
+        """Add (``sign=1``) or remove (``-1``) a question from its section sums."""
+        if not self.applicable[question_id]:
+            return None
+        section_id, weight, _condition, fractions = self._questions[question_id]
+        section = self.sections[section_id]
+        section.applicable += sign
+        value = self.answers.get(question_id)
+        if value is not None:
+            section.answered += sign
+            fraction = fractions.get(value)
+            if fraction is not None:
+                section.points += sign * fraction * 100 * weight
+                section.scored_weight += sign * weight
+        return section
+
+    def _refresh(self, section: _Section) -> None:
+        if section.counted:
+            self._weighted_sum -= section.score * section.weight
+            self._total_weight -= section.weight
+        section.counted = section.scored_weight > 0
+        section.score = _round(section.points / section.scored_weight) if section.counted else 0
+        if section.counted:
+            self._weighted_sum += section.score * section.weight
+            self._total_weight += section.weight
+
+    def _reevaluate(self, question_ids: Iterable[str], touched: set[str]) -> None:
+        for question_id in question_ids:
+            condition = self._questions[question_id][2]
+            applicable = condition(self.answers, self.profile)
+            if applicable == self.applicable[question_id]:
+                continue
+            section = self._count(question_id, -1)
+            self.applicable[question_id] = applicable
+            section = self._count(question_id, 1) or section
+            touched.add(section.id)
+            if applicable:
+                self._frontier = min(self._frontier, self._position[question_id])
+
+    def apply_answer(self, question_id: str, value: str | None) -> None:
+        """Set (or clear with ``None``) one answer and patch affected aggregates."""
+        if question_id not in self._questions:
+            raise KeyError(f"Unknown question {question_id!r}")
+        if self.answers.get(question_id) == value:
+            return
+        touched: set[str] = set()
+        section = self._count(question_id, -1)
+        if value is None:
+            self.answers.pop(question_id, None)
+            self._frontier = min(self._frontier, self._position[question_id])
+        else:
+            self.answers[question_id] = value
+        if self._count(question_id, 1) or section:
+            touched.add(self._questions[question_id][0])
+        self._reevaluate(self._answer_dependents.get(question_id, ()), touched)
+        for section_id in touched:
+            self._refresh(self.sections[section_id])
+
+    def apply_profile(self, field: str, value: object) -> None:
+        """Set (or clear with ``None``) one profile field such as ``pets.has_pets``."""
+        _set_path(self.profile, field, value)
+        touched: set[str] = set()
+        self._reevaluate(self._profile_dependents.get(field, ()), touched)
+        for section_id in touched:
+            self._refresh(self.sections[section_id])
+
+    def next_question(self) -> str | None:
+        """First applicable, unanswered question in schema order, or ``None``.
+
+        Matches the interactive flow's scan over ``questions`` but resumes
+        from the earliest question any event could have reopened.
+        """
+        index = next_open_question(
+            self._routing,
+            lambda position: self.applicable[self._order[position]],
+            lambda position: self._order[position] in self.answers,
+            self._frontier,
+        )
+        self._frontier = len(self._order) if index is None else index
+        return None if index is None else self._order[index]
+
+    @property
+    def overall_score(self) -> int:
+        if self._total_weight <= 0:
+            return 0
+        return _round(self._weighted_sum / self._total_weight)
+
+    @property
+    def band(self) -> str:
+        return self._band_labels[self.overall_score]
+
+    @property
+    def section_scores(self) -> dict[str, int]:
+        return {section_id: section.score for section_id, section in self.sections.items()}
+
+    @property
+    def overall_progress(self) -> int:
+        applicable = sum(section.applicable for section in self.sections.values())
+        answered = sum(section.answered for section in self.sections.values())
+        return _round(answered / applicable * 100) if applicable else 0
+
+    def section_states(self) -> list[dict]:
+        """Section summaries shaped like the agent edge function's ``sections``."""
+        states = []
+        for section in self.sections.values():
+            total = section.applicable
+            status = "locked"
+            if total:
+                status = (
+                    "completed"
+                    if section.answered == total
+                    else "in_progress" if section.answered else "available"
+                )
+            states.append(
+                {
+                    "id": section.id,
+                    "is_applicable": total > 0,
+                    "score": section.score if total else 0,
+                    "progress": _round(section.answered / total * 100) if total else 0,
+                    "questions_total": total,
+                    "questions_answered": section.answered,
+                    "status": status,
+                }
+            )
+        return states
+
+
+def _copy_profile(profile: Mapping) -> dict:
+    return {
+        key: _copy_profile(value) if isinstance(value, Mapping) else value
+        for key, value in profile.items()
+    }
@@ -0,0 +1,525 @@
+"""Derived lookup tables emitted into the readiness schema by the generator."""
+
+import copy
+import hashlib
+import heapq
+import json
+from typing import Callable, Mapping
+
+from readiness_conditions import (
+    ALWAYS,
+    compile_condition,
+    complement_condition,
+    condition_ops,
+    iter_refs,
+    parse_condition,
+    prove_complement,
+    schema_domains,
+    unparse_condition,
+)
+
+GATE_KINDS = ("profile_gates", "soft_gates")
+OPTION_KINDS = ("profile_questions", "questions")
+ANSWER_BITS = 3
+PROFILE_BITS = 2
+PROFILE_CODES = {"unknown": 0, "false": 1, "true": 2}
+# Packed layout: a version byte, the encoding digest, PROFILE_CAPACITY profile
+# slots, then question slots.
+ENCODING_LAYOUT = 1
+ENCODING_DIGEST_BYTES = 4
+PROFILE_CAPACITY = 16
+
+
+def _profile_from_bits(fields: list[str], state: int) -> dict:
+    profile: dict = {}
+    for bit, field in enumerate(fields):
+        *parents, leaf = field.split(".")
+        target = profile
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = bool(state >> bit & 1)
+    return profile
+
+
+def _condition_refs(expression: str | None) -> list[tuple[str, str]]:
+    return list(dict.fromkeys(iter_refs(parse_condition(expression))))
+
+
+def _content_id(prefix: str, value: object) -> str:
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return prefix + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:8]
+
+
+def condition_id(node: dict) -> str:
+    return _content_id("c_", node)
+
+
+def derive_soft_gates(schema: Mapping) -> list[dict]:
+    """Build an ``ask``/``na`` gate pair for every answer-dependent question.
+
+    The ``ask`` gate reuses the question's ``applies_if`` and the ``na`` gate
+    is its complement over the referenced inputs' domains, checked
+    exhaustively with ``prove_complement``. The ``na`` gate directly follows
+    its ``ask`` gate.
+
+    The two never both hold, and once every input the condition reads
+    (answers and profile fields) is present ``na`` holds exactly when
+    ``ask`` does not. While an input is missing both can be false.
+    """
+    answer_domains, profile_domains = schema_domains(schema)
+    gates: list[dict] = []
+    for question in schema["questions"]:
+        expression = question.get("applies_if")
+        node = parse_condition(expression)
+        if not any(kind == "answer" for kind, _key in iter_refs(node)):
+            continue
+        complement = complement_condition(node, answer_domains, profile_domains)
+        prove_complement(node, complement, answer_domains, profile_domains)
+        gates += [
+            {"when": expression, "questions": [question["id"]], "result": "ask"},
+            {
+                "when": unparse_condition(complement),
+                "questions": [question["id"]],
+                "result": "na",
+                "flag": "follow_up",
+            },
+        ]
+    return gates
+
+
+def intern_conditions(schema: dict) -> dict:
+    """Collect each distinct condition once and point questions and gates at it.
+
+    Adds ``applies_if_ref`` to questions and ``when_ref`` to gates (next to the
+    legacy strings) and returns the ``conditions`` table keyed by those ids.
+    Ids hash the canonical AST, so they stay stable as conditions are added
+    and equivalent spellings share one entry. ``always`` gets no ref.
+    """
+    table: dict[str, dict] = {}
+
+    def intern(expression: str | None) -> str | None:
+        node = parse_condition(expression)
+        if node["op"] == ALWAYS:
+            return None
+        ref = condition_id(node)
+        table.setdefault(ref, {"expression": expression, "ast": node, "ops": condition_ops(node)})
+        return ref
+
+    for question in schema["questions"]:
+        ref = intern(question.get("applies_if"))
+        if ref:
+            question["applies_if_ref"] = ref
+    for gate_kind in GATE_KINDS:
+        for gate in schema.get(gate_kind, []):
+            gate["when_ref"] = intern(gate["when"])
+    return table
+
+
+def intern_option_sets(schema: Mapping) -> dict:
+    """Return a copy of the schema with identical option lists stored once.
+
+    Questions and profile questions get ``options_ref`` pointing into an
+    ``option_sets`` table in place of their inline ``options``;
+    ``expand_option_sets`` reverses it. The served ``schema_json`` row stays
+    expanded because the edge functions read inline ``options``; labels vary
+    enough that interning saves under a tenth of it.
+    """
+    compact = copy.deepcopy(dict(schema))
+    option_sets: dict[str, list[dict]] = {}
+
+    def intern(question: dict) -> dict:
+        ref = _content_id("o_", question["options"])
+        option_sets.setdefault(ref, question["options"])
+        return _replace_key(question, "options", "options_ref", ref)
+
+    for kind in OPTION_KINDS:
+        compact[kind] = [intern(question) for question in compact[kind]]
+    compact["option_sets"] = option_sets
+    return compact
+
+
+def expand_option_sets(schema: Mapping) -> dict:
+    """Inverse of ``intern_option_sets``: inline every question's options."""
+    if "option_sets" not in schema:
+        return copy.deepcopy(dict(schema))
+    expanded = copy.deepcopy(dict(schema))
+    option_sets = expanded.pop("option_sets")
+    for kind in OPTION_KINDS:
+        expanded[kind] = [
+            _replace_key(
+                question, "options_ref", "options", copy.deepcopy(option_sets[question["options_ref"]])
+            )
+            for question in expanded[kind]
+        ]
+    return expanded
+
+
+def _replace_key(item: Mapping, old: str, new: str, value: object) -> dict:
+    """Swap one key for another while keeping the serialized key order."""
+    return {new if key == old else key: value if key == old else current for key, current in item.items()}
+
+
+def validate_score_bands(bands: list[Mapping]) -> None:
+    """Require ``score_bands`` to cover every score 0-100 exactly once."""
+    owners: dict[int, str] = {}
+    for band in bands:
+        if not 0 <= band["min"] <= band["max"] <= 100:
+            raise ValueError(f"Score band {band['label']!r} has an invalid range")
+        for score in range(band["min"], band["max"] + 1):
+            if score in owners:
+                raise ValueError(
+                    f"Score bands {owners[score]!r} and {band['label']!r} overlap at {score}"
+                )
+            owners[score] = band["label"]
+    missing = [score for score in range(101) if score not in owners]
+    if missing:
+        raise ValueError(f"Score bands leave scores uncovered: {missing[0]}..{missing[-1]}")
+
+
+def build_score_tables(schema: Mapping) -> dict:
+    """Precompute band lookup and weighting tables for scoring consumers.
+
+    ``band_lookup[score]`` is the index into ``score_bands`` for every score
+    0-100. ``section_weight_shares`` is each section's weight over the total
+    and ``question_max_points`` the most a question can add to its section's
+    weighted points (weight x 100 x best scored fraction); unscored
+    questions get 0. ``section_max_points`` sums those per section.
+    """
+    validate_score_bands(schema["score_bands"])
+    band_lookup = [0] * 101
+    for band_index, band in enumerate(schema["score_bands"]):
+        band_lookup[band["min"] : band["max"] + 1] = [band_index] * (band["max"] - band["min"] + 1)
+
+    total_weight = sum(section["weight"] for section in schema["sections"])
+    scoring = schema["answer_scoring"]
+    question_max_points: dict[str, float] = {}
+    section_max_points = {section["id"]: 0.0 for section in schema["sections"]}
+    for question in schema["questions"]:
+        # Keyed by value so the last option with a repeated value wins.
+        fractions = {
+            option["value"]: scoring.get(option.get("score_value", option["value"]))
+            for option in question["options"]
+        }
+        best = max(
+            (fraction for fraction in fractions.values() if fraction is not None), default=0.0
+        )
+        points = question.get("weight", 1) * 100 * best
+        question_max_points[question["id"]] = points
+        section_max_points[question["section_id"]] += points
+
+    return {
+        "band_lookup": band_lookup,
+        "section_weight_total": total_weight,
+        "section_weight_shares": {
+            section["id"]: section["weight"] / total_weight for section in schema["sections"]
+        },
+        "question_max_points": question_max_points,
+        "section_max_points": section_max_points,
+    }
+
+
+def build_dependency_index(schema: Mapping) -> dict:
+    """Map each answer and profile field to the questions and gates reading it.
+
+    ``answers`` and ``profile`` only list inputs that something depends on;
+    gates are referenced by their index in ``profile_gates``/``soft_gates``.
+    ``order`` lists question ids so that every question comes after the
+    questions its conditions (and the gates controlling it) read.
+    """
+    question_ids = [q["id"] for q in schema["questions"]]
+    position = {qid: index for index, qid in enumerate(question_ids)}
+    index: dict[str, dict[str, dict[str, list]]] = {"answer": {}, "profile": {}}
+
+    def dependents(kind: str, key: str) -> dict[str, list]:
+        return index[kind].setdefault(
+            key, {"questions": [], "profile_gates": [], "soft_gates": []}
+        )
+
+    edges: dict[str, set[str]] = {qid: set() for qid in question_ids}
+    for question in schema["questions"]:
+        for kind, key in _condition_refs(question.get("applies_if")):
+            dependents(kind, key)["questions"].append(question["id"])
+            if kind == "answer":
+                edges[key].add(question["id"])
+    for gate_kind in GATE_KINDS:
+        for gate_index, gate in enumerate(schema.get(gate_kind, [])):
+            for kind, key in _condition_refs(gate["when"]):
+                dependents(kind, key)[gate_kind].append(gate_index)
+                if kind == "answer":
+                    edges[key].update(gate["questions"])
+
+    return {
+        "answers": index["answer"],
+        "profile": index["profile"],
+        "order": _topological_order(question_ids, edges, position),
+    }
+
+
+def _topological_order(
+    question_ids: list[str], edges: Mapping[str, set[str]], position: Mapping[str, int]
+) -> list[str]:
+    incoming = {qid: 0 for qid in question_ids}
+    for targets in edges.values():
+        for target in targets:
+            incoming[target] += 1
+
+    ready = [position[qid] for qid, count in incoming.items() if count == 0]
+    heapq.heapify(ready)
+    order: list[str] = []
+    while ready:
+        qid = question_ids[heapq.heappop(ready)]
+        order.append(qid)
+        for target in edges[qid]:
+            incoming[target] -= 1
+            if incoming[target] == 0:
+                heapq.heappush(ready, position[target])
+
+    if len(order) != len(question_ids):
+        raise ValueError(f"Condition dependency cycle: {' -> '.join(_find_cycle(edges))}")
+    return order
+
+
+def _find_cycle(edges: Mapping[str, set[str]]) -> list[str]:
+    visiting: list[str] = []
+    done: set[str] = set()
+
+    def visit(node: str) -> list[str] | None:
+        if node in visiting:
+            return visiting[visiting.index(node) :] + [node]
+        if node in done:
+            return None
+        visiting.append(node)
+        for target in sorted(edges[node]):
+            cycle = visit(target)
+            if cycle:
+                return cycle
+        visiting.pop()
+        done.add(node)
+        return None
+
+    for node in edges:
+        cycle = visit(node)
+        if cycle:
+            return cycle
+    return []
+
+
+def build_profile_applicability(schema: Mapping) -> dict:
+    """Precompute profile-gated applicability for every boolean profile state.
+
+    ``fields`` are the profile fields some gate or ``applies_if`` reads, in
+    ``profile_questions`` order; fields no condition reads would only
+    duplicate rows. A profile state index sets bit ``i`` when ``fields[i]``
+    is true. For each
+    state, ``question_masks`` is a hex bitmask over ``questions`` (bit ``i``
+    is question ``i``) of the questions not ruled out by the profile;
+    questions whose conditions also read answers stay set and still need
+    their soft gate evaluated. ``section_counts`` holds the number of such
+    questions per section and ``section_masks`` sets bit ``i`` when section
+    ``i`` is applicable.
+    """
+    expressions = [q.get("applies_if") for q in schema["questions"]]
+    expressions += [gate["when"] for kind in GATE_KINDS for gate in schema.get(kind, [])]
+    read = {
+        key
+        for expression in expressions
+        for kind, key in _condition_refs(expression)
+        if kind == "profile"
+    }
+    fields = [q["field"] for q in schema["profile_questions"] if q["field"] in read]
+    section_ids = [s["id"] for s in schema["sections"]]
+    section_index = {sid: index for index, sid in enumerate(section_ids)}
+    gates = [
+        (compile_condition(gate["when"]), set(gate["questions"]))
+        for gate in schema.get("profile_gates", [])
+    ]
+    profile_only = []
+    for question in schema["questions"]:
+        refs = _condition_refs(question.get("applies_if"))
+        reads_answers = any(kind == "answer" for kind, _key in refs)
+        profile_only.append(None if reads_answers else compile_condition(question.get("applies_if")))
+
+    question_masks: list[str] = []
+    section_counts: list[list[int]] = []
+    section_masks: list[int] = []
+    for state in range(1 << len(fields)):
+        profile = _profile_from_bits(fields, state)
+        excluded: set[str] = set()
+        for condition, gated in gates:
+            if condition({}, profile):
+                excluded |= gated
+
+        mask = 0
+        counts = [0] * len(section_ids)
+        for bit, question in enumerate(schema["questions"]):
+            condition = profile_only[bit]
+            if question["id"] in excluded or (condition and not condition({}, profile)):
+                continue
+            mask |= 1 << bit
+            counts[section_index[question["section_id"]]] += 1
+        question_masks.append(hex(mask))
+        section_counts.append(counts)
+        section_masks.append(sum(1 << index for index, count in enumerate(counts) if count))
+
+    return {
+        "fields": fields,
+        "question_masks": question_masks,
+        "section_counts": section_counts,
+        "section_masks": section_masks,
+    }
+
+
+def build_routing_table(schema: Mapping) -> dict:
+    """Precompute next-question candidates in ``questions`` order.
+
+    ``steps[i]["next"]`` lists the indices after question ``i`` up to and
+    including the first question without a condition: the next applicable
+    question after ``i`` is always one of them, or there is none. Each step
+    carries the ``applies_if_ref`` gating it (``None`` when always asked).
+    ``sections`` gives each section's ``[start, stop)`` range of indices.
+    """
+    steps: list[dict] = []
+    for question in schema["questions"]:
+        node = parse_condition(question.get("applies_if"))
+        ref = None if node["op"] == ALWAYS else condition_id(node)
+        steps.append({"id": question["id"], "applies_if_ref": ref, "next": []})
+
+    pending: list[int] = []
+    for index in range(len(steps) - 1, -1, -1):
+        steps[index]["next"] = list(pending)
+        if steps[index]["applies_if_ref"] is None:
+            pending = [index]
+        else:
+            pending.insert(0, index)
+
+    sections: list[dict] = []
+    for index, question in enumerate(schema["questions"]):
+        if sections and sections[-1]["section_id"] == question["section_id"]:
+            sections[-1]["stop"] = index + 1
+            continue
+        if any(section["section_id"] == question["section_id"] for section in sections):
+            raise ValueError(f"Questions of section {question['section_id']} are not contiguous")
+        sections.append({"section_id": question["section_id"], "start": index, "stop": index + 1})
+    return {"sections": sections, "steps": steps}
+
+
+def next_open_question(
+    routing: Mapping,
+    is_applicable: Callable[[int], bool],
+    is_answered: Callable[[int], bool],
+    start: int = 0,
+    stop: int | None = None,
+) -> int | None:
+    """Index of the first applicable, unanswered question in ``[start, stop)``.
+
+    Follows ``next`` candidates from ``build_routing_table``; an answered
+    applicable question jumps straight to its own candidates, so only gated
+    questions and the answered chain are visited.
+    """
+    steps = routing["steps"]
+    stop = len(steps) if stop is None else stop
+    if start >= stop:
+        return None
+    candidates = [start, *steps[start]["next"]]
+    while True:
+        for index in candidates:
+            if index >= stop:
+                return None
+            if is_applicable(index):
+                if not is_answered(index):
+                    return index
+                candidates = steps[index]["next"]
+                break
+        else:
+            return None
+
+
+def profile_state_index(profile: Mapping, fields: list[str]) -> int | None:
+    """Return the ``profile_applicability`` row for a profile, or ``None``
+    while any of its boolean fields is still unanswered."""
+    state = 0
+    for bit, field in enumerate(fields):
+        value: object = profile
+        for part in field.split("."):
+            value = value.get(part) if isinstance(value, Mapping) else None
+        if not isinstance(value, bool):
+            return None
+        state |= int(value) << bit
+    return state
+
+
+def _stable_slots(keys: list[str], previous: Mapping[str, int], slots: int) -> tuple[dict, int]:
+    """Keep previously assigned slots and give new keys fresh ones at the end."""
+    assigned: dict[str, int] = {}
+    for key in keys:
+        if key in previous:
+            assigned[key] = previous[key]
+        else:
+            assigned[key] = slots
+            slots += 1
+    return assigned, slots
+
+
+def build_encoding(schema: Mapping, previous: Mapping | None = None) -> dict:
+    """Assign compact integer codes for packing assessments into bytes.
+
+    ``questions``/``profile_fields`` map ids to bit-field slots and
+    ``answer_codes`` maps answer values to 1..7 (0 is unanswered). Slots
+    only stay stable through ``previous``, the encoding that packed data
+    already uses (the generator keeps it in ``readiness_v1_encoding``):
+    existing slots and codes are kept and new ones take the persisted
+    ``next_answer_code``/``*_slots`` counters, so removed questions, fields
+    and values never have their slots or codes reused.
+
+    A packed assessment (layout ``ENCODING_LAYOUT``) is one layout byte and
+    ``ENCODING_DIGEST_BYTES`` of the encoding's ``digests[-1]``, then
+    ``PROFILE_CAPACITY`` slots of ``PROFILE_BITS`` and ``ANSWER_BITS`` per
+    question slot, least significant bit first. Profile fields fill the
+    reserved slots and new questions only extend the end, so bytes packed
+    under an earlier encoding in ``digests`` are a prefix that decodes
+    zero-extended; any other digest was packed with different slots.
+    """
+    previous = previous or {}
+    previous_codes = previous.get("answer_codes", {})
+    codes, next_code = _stable_slots(
+        list(schema["answer_scoring"]),
+        previous_codes,
+        previous.get("next_answer_code", max(previous_codes.values(), default=0) + 1),
+    )
+    if next_code > 1 << ANSWER_BITS:
+        raise ValueError(
+            f"More than {(1 << ANSWER_BITS) - 1} answer codes do not fit the encoding"
+        )
+    fields, profile_slots = _stable_slots(
+        [question["field"] for question in schema["profile_questions"]],
+        previous.get("profile_fields", {}),
+        previous.get("profile_slots", 0),
+    )
+    if profile_slots > PROFILE_CAPACITY:
+        raise ValueError(
+            f"More than {PROFILE_CAPACITY} profile slots need a new encoding layout"
+        )
+    questions, question_slots = _stable_slots(
+        [question["id"] for question in schema["questions"]],
+        previous.get("questions", {}),
+        previous.get("question_slots", 0),
+    )
+    bits = PROFILE_CAPACITY * PROFILE_BITS + question_slots * ANSWER_BITS
+    encoding = {
+        "layout": ENCODING_LAYOUT,
+        "answer_bits": ANSWER_BITS,
+        "profile_bits": PROFILE_BITS,
+        "answer_codes": codes,
+        "next_answer_code": next_code,
+        "profile_codes": dict(PROFILE_CODES),
+        "profile_capacity": PROFILE_CAPACITY,
+        "profile_slots": profile_slots,
+        "profile_fields": fields,
+        "question_slots": question_slots,
+        "questions": questions,
+        "byte_length": 1 + ENCODING_DIGEST_BYTES + (bits + 7) // 8,
+    }
+    canonical = json.dumps(encoding, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[: 2 * ENCODING_DIGEST_BYTES]
+    encoding["digests"] = [d for d in previous.get("digests", ()) if d != digest] + [digest]
+    return encoding
@@ -0,0 +1,111 @@
+"""Packing slots of the readiness_v1 encoding, kept for every later build.
+
+Written by generate_readiness_schema.py; do not edit by hand. Stored packed
+assessments depend on these slots, so ``build_schema`` always extends this
+table instead of assigning slots from scratch (see ``build_encoding``).
+"""
+
+ENCODING = {
+    "layout": 1,
+    "answer_bits": 3,
+    "profile_bits": 2,
+    "answer_codes": {
+        "yes": 1,
+        "partial": 2,
+        "no": 3,
+        "not_sure": 4,
+        "na": 5
+    },
+    "next_answer_code": 6,
+    "profile_codes": {
+        "unknown": 0,
+        "false": 1,
+        "true": 2
+    },
+    "profile_capacity": 16,
+    "profile_slots": 8,
+    "profile_fields": {
+        "financial.has_beneficiary_accounts": 0,
+        "household.has_dependents": 1,
+        "pets.has_pets": 2,
+        "digital.owns_crypto": 3,
+        "family.supports_aging_parent": 4,
+        "home.owns_real_property": 5,
+        "home.has_significant_personal_property": 6,
+        "emotional.has_spiritual_practices": 7
+    },
+    "question_slots": 67,
+    "questions": {
+        "1.1.A.1": 0,
+        "1.1.A.2": 1,
+        "1.1.A.3": 2,
+        "1.1.A.4": 3,
+        "1.1.A.5": 4,
+        "1.1.A.6": 5,
+        "1.1.A.7": 6,
+        "1.1.B.1": 7,
+        "1.1.B.2": 8,
+        "1.1.B.3": 9,
+        "1.1.B.4": 10,
+        "1.1.B.4a": 11,
+        "1.1.B.5": 12,
+        "1.1.B.6": 13,
+        "1.1.B.7": 14,
+        "1.1.B.8": 15,
+        "1.1.B.9": 16,
+        "1.1.B.10": 17,
+        "1.1.B.11": 18,
+        "2.1": 19,
+        "2.2": 20,
+        "2.3": 21,
+        "2.4": 22,
+        "2.5": 23,
+        "2.6": 24,
+        "2.7": 25,
+        "2.8": 26,
+        "3.1": 27,
+        "3.2": 28,
+        "3.4": 29,
+        "3.5": 30,
+        "3.6": 31,
+        "3.7": 32,
+        "3.8": 33,
+        "3.9": 34,
+        "4.2": 35,
+        "4.3": 36,
+        "4.4": 37,
+        "5.1": 38,
+        "5.2": 39,
+        "5.4": 40,
+        "5.5": 41,
+        "6.1": 42,
+        "6.2": 43,
+        "6.3": 44,
+        "6.4": 45,
+        "6.5": 46,
+        "6.7": 47,
+        "6.8": 48,
+        "7.1": 49,
+        "7.2": 50,
+        "7.3": 51,
+        "7.4": 52,
+        "8.1": 53,
+        "8.2": 54,
+        "8.3": 55,
+        "9.2": 56,
+        "9.3": 57,
+        "9.4": 58,
+        "10.1": 59,
+        "10.2": 60,
+        "10.3": 61,
+        "10.5": 62,
+        "11.1": 63,
+        "11.2": 64,
+        "11.3": 65,
+        "11.4": 66
+    },
+    "byte_length": 35,
+    "digests": [
+        "90a0194a"
+    ]
+}
@@ -0,0 +1,178 @@
+"""Bulk rescoring of stored assessments after a schema change.
+
+Streams ``readiness_v1.assessments`` (with their answers and the subject's
+``profile_json``) through a server-side cursor, scores each batch with
+``BatchScorer`` off the event loop, ``COPY``s the results into a temporary
+staging table and finishes with one set-based ``update``::
+
+    DATABASE_URL=postgres://... python supabase/seed/rescore_job.py --batch-size 5000
+
+Scores are rewritten with the formula the Readiness page used to store them
+(``src/pages/Readiness.tsx``), so rows only move when the schema changed
+their inputs. Each section scores the mean fraction of its applicable,
+scored answers (every question weighs 1); ``overall_score`` is the
+section-weighted average of those unrounded means, rounded half up once
+(``app_overall_score``), and ``dimension_scores`` maps each section with a
+scored answer to its mean times 100, rounded. Sections with nothing
+scored are left out, as the page leaves them out. Rows are only updated
+where either value changed. Requires ``asyncpg``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Mapping, Sequence
+
+from readiness_batch import BatchScorer, load_schema
+
+try:
+    import asyncpg
+except ImportError:  # only needed to talk to the database
+    asyncpg = None
+
+DEFAULT_BATCH_SIZE = 5_000
+STAGING_TABLE = "rescore_staging"
+
+SELECT_ASSESSMENTS = """
+select
+  a.id,
+  coalesce(p.profile_json, '{}'::jsonb) as profile_json,
+  coalesce(
+    (
+      select jsonb_object_agg(aa.question_id, aa.answer_value)
+      from readiness_v1.assessment_answers aa
+      where aa.assessment_id = a.id
+    ),
+    '{}'::jsonb
+  ) as answers
+from readiness_v1.assessments a
+left join readiness_v1.profile_intake p on p.subject_id = a.subject_id
+where a.assessment_id = $1 and a.schema_version = $2
+order by a.id
+"""
+
+CREATE_STAGING = f"""
+create temporary table if not exists {STAGING_TABLE} (
+  id uuid primary key,
+  overall_score integer not null,
+  dimension_scores text not null
+)
+"""
+
+APPLY_STAGING = f"""
+update readiness_v1.assessments a
+set overall_score = s.overall_score,
+    dimension_scores = s.dimension_scores::jsonb
+from {STAGING_TABLE} s
+where a.id = s.id
+  and (a.overall_score is distinct from s.overall_score
+       or a.dimension_scores is distinct from s.dimension_scores::jsonb)
+"""
+
+
+def score_rows(scorer: BatchScorer, rows: Sequence[Mapping]) -> list[tuple]:
+    """Score fetched rows into ``(id, overall_score, dimension_scores)`` records."""
+    answers, profile = scorer.encode((row["answers"], row["profile_json"]) for row in rows)
+    result = scorer.score_batch(answers, profile)
+    records = []
+    for row, overall, sections, scored in zip(
+        rows,
+        result["app_overall_score"].tolist(),
+        result["app_section_scores"].tolist(),
+        result["section_scored"].tolist(),
+    ):
+        dimensions = {
+            section_id: score
+            for section_id, score, counted in zip(scorer.section_ids, sections, scored)
+            if counted
+        }
+        records.append((row["id"], overall, json.dumps(dimensions)))
+    return records
+
+
+async def _decode_jsonb(connection) -> None:
+    await connection.set_type_codec(
+        "jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+    )
+
+
+async def _read_batches(reader, schema: Mapping, batch_size: int, queue: asyncio.Queue) -> None:
+    """Feed row batches into ``queue``, then ``None`` (or the read error)."""
+    try:
+        async with reader.transaction(readonly=True):
+            cursor = await reader.cursor(
+                SELECT_ASSESSMENTS, schema["assessment_id"], schema["version"]
+            )
+            while rows := await cursor.fetch(batch_size):
+                await queue.put(rows)
+    except Exception as error:
+        await queue.put(error)
+        return
+    await queue.put(None)
+
+
+async def rescore(
+    dsn: str, schema: Mapping | None = None, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict:
+    """Rescore every assessment of the schema's ``assessment_id``/``version``.
+
+    Reading, scoring and copying overlap: the reader keeps up to two batches
+    queued while the previous one is scored in a worker thread and copied.
+    Returns the number of assessments scored and rows updated.
+    """
+    if asyncpg is None:
+        raise RuntimeError("rescore_job requires asyncpg (pip install asyncpg)")
+    schema = schema or load_schema()
+    scorer = BatchScorer(schema)
+    loop = asyncio.get_running_loop()
+
+    reader = await asyncpg.connect(dsn)
+    writer = await asyncpg.connect(dsn)
+    try:
+        await _decode_jsonb(reader)
+        await writer.execute(CREATE_STAGING)
+        await writer.execute(f"truncate {STAGING_TABLE}")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        producer = asyncio.create_task(_read_batches(reader, schema, batch_size, queue))
+        scored = 0
+        try:
+            while (rows := await queue.get()) is not None:
+                if isinstance(rows, Exception):
+                    raise rows
+                records = await loop.run_in_executor(None, score_rows, scorer, rows)
+                await writer.copy_records_to_table(
+                    STAGING_TABLE,
+                    records=records,
+                    columns=["id", "overall_score", "dimension_scores"],
+                )
+                scored += len(records)
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+        async with writer.transaction():
+            status = await writer.execute(APPLY_STAGING)
+        await writer.execute(f"drop table if exists {STAGING_TABLE}")
+        return {"scored": scored, "updated": int(status.split()[-1])}
+    finally:
+        await asyncio.gather(reader.close(), writer.close())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rescore stored readiness assessments.")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("pass --dsn or set DATABASE_URL")
+
+    result = asyncio.run(rescore(args.dsn, batch_size=args.batch_size))
+    print(f"scored {result['scored']:,} assessments, updated {result['updated']:,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""Score exported readiness assessments in parallel.
+
+Reads a JSONL export (one ``{"assessment_id", "profile", "answers"}`` object
+per line, as written by ``readiness_population``) or a wide CSV export (an
+``assessment_id`` column, one column per question id and one
+``profile.<field>`` column per profile question, holding JSON such as
+``true``), scores chunks of rows in a
+``ProcessPoolExecutor`` with ``BatchScorer`` and writes one result per input
+row, in input order::
+
+    python supabase/seed/score_exports.py exports.jsonl --output scores.jsonl
+    python supabase/seed/score_exports.py exports.csv --output scores.csv --workers 8
+
+Only a bounded number of chunks is in flight at once, so memory stays flat
+regardless of the export size.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, TextIO
+
+import numpy as np
+
+from readiness_batch import (
+    PROFILE_UNKNOWN,
+    SCHEMA_PATH,
+    UNANSWERED,
+    BatchScorer,
+    load_schema,
+    profile_code,
+)
+
+DEFAULT_CHUNK_ROWS = 10_000
+PROFILE_PREFIX = "profile."
+
+_scorer: BatchScorer | None = None
+
+
+def _init_worker(schema: Mapping) -> None:
+    global _scorer
+    _scorer = BatchScorer(schema)
+
+
+def _encode_jsonl(scorer: BatchScorer, lines: list[str]) -> tuple[list, np.ndarray, np.ndarray]:
+    records = [json.loads(line) for line in lines]
+    answers, profile = scorer.encode(
+        (record.get("answers") or {}, record.get("profile") or {}) for record in records
+    )
+    return [record.get("assessment_id") for record in records], answers, profile
+
+
+@lru_cache(maxsize=256)
+def _csv_profile_code(cell: str) -> int:
+    """Read a profile cell as the JSON value a JSONL export would hold.
+
+    ``true``/``false`` are booleans and anything that is not JSON stays a
+    string, so ``"yes"`` is unknown on both paths (see ``profile_code``).
+    """
+    try:
+        value = json.loads(cell)
+    except ValueError:
+        value = cell
+    return profile_code(value)
+
+
+def _encode_csv(
+    scorer: BatchScorer, header: list[str], rows: list[list[str]]
+) -> tuple[list, np.ndarray, np.ndarray]:
+    id_column = header.index("assessment_id")
+    answer_columns = [
+        (column, scorer.question_index[name])
+        for column, name in enumerate(header)
+        if name in scorer.question_index
+    ]
+    profile_columns = [
+        (column, scorer.profile_index[name[len(PROFILE_PREFIX) :]])
+        for column, name in enumerate(header)
+        if name.startswith(PROFILE_PREFIX) and name[len(PROFILE_PREFIX) :] in scorer.profile_index
+    ]
+    answers = np.full((len(rows), len(scorer.question_ids)), UNANSWERED, dtype=np.uint8)
+    profile = np.full((len(rows), len(scorer.profile_fields)), PROFILE_UNKNOWN, dtype=np.int8)
+    codes = scorer.answer_codes
+    for row_index, row in enumerate(rows):
+        answer_row = answers[row_index]
+        for column, question in answer_columns:
+            answer_row[question] = codes.get(row[column], UNANSWERED)
+        profile_row = profile[row_index]
+        for column, field in profile_columns:
+            profile_row[field] = _csv_profile_code(row[column])
+    return [row[id_column] for row in rows], answers, profile
+
+
+def score_chunk(
+    kind: str, rows: list, header: list[str] | None = None, output: str = "jsonl"
+) -> str:
+    """Parse, score and serialize one chunk; runs inside a pool worker."""
+    scorer = _scorer
+    if kind == "csv":
+        ids, answers, profile = _encode_csv(scorer, header, rows)
+    else:
+        ids, answers, profile = _encode_jsonl(scorer, rows)
+    result = scorer.score_batch(answers, profile)
+
+    overall = result["overall_score"].tolist()
+    bands = [scorer.band_labels[band] for band in result["band"].tolist()]
+    sections = result["section_scores"].tolist()
+    if output == "csv":
+        return "".join(
+            ",".join([_csv_field(str(assessment_id)), str(score), _csv_field(band), *map(str, row)])
+            + "\n"
+            for assessment_id, score, band, row in zip(ids, overall, bands, sections)
+        )
+    return "".join(
+        json.dumps(
+            {
+                "assessment_id": assessment_id,
+                "overall_score": score,
+                "band": band,
+                "section_scores": dict(zip(scorer.section_ids, row)),
+            },
+            separators=(",", ":"),
+        )
+        + "\n"
+        for assessment_id, score, band, row in zip(ids, overall, bands, sections)
+    )
+
+
+def _csv_field(value: str) -> str:
+    if any(char in value for char in ',"\n\r'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _chunks(rows: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class _InlineExecutor:
+    """Runs chunks in the calling process when a pool would only add overhead."""
+
+    def submit(self, func, *args) -> Future:
+        future: Future = Future()
+        future.set_result(func(*args))
+        return future
+
+
+def score_stream(
+    source: TextIO,
+    sink: TextIO,
+    schema: Mapping,
+    *,
+    kind: str = "jsonl",
+    output: str = "jsonl",
+    workers: int | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> int:
+    """Score every row of ``source`` into ``sink``; returns the row count."""
+    header = None
+    if kind == "csv":
+        reader = csv.reader(source)
+        header = next(reader)
+        rows: Iterable = reader
+    else:
+        rows = (line for line in source if line.strip())
+    if output == "csv":
+        section_ids = [s["id"] for s in schema["sections"]]
+        sink.write(",".join(["assessment_id", "overall_score", "band", *section_ids]) + "\n")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(schema)
+        executor: Executor | _InlineExecutor = _InlineExecutor()
+    else:
+        executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(schema,))
+
+    count = 0
+    pending: deque[tuple[Future, int]] = deque()
+    try:
+        for chunk in _chunks(rows, chunk_rows):
+            pending.append((executor.submit(score_chunk, kind, chunk, header, output), len(chunk)))
+            if len(pending) >= 2 * workers:
+                future, size = pending.popleft()
+                sink.write(future.result())
+                count += size
+        while pending:
+            future, size = pending.popleft()
+            sink.write(future.result())
+            count += size
+    finally:
+        if isinstance(executor, ProcessPoolExecutor):
+            executor.shutdown(cancel_futures=True)
+    return count
+
+
+def _format(path: Path | None, default: str) -> str:
+    return "csv" if path is not None and path.suffix.lower() == ".csv" else default
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Score JSONL or CSV readiness exports.")
+    parser.add_argument("input", type=Path, help="export file (.jsonl or .csv)")
+    parser.add_argument("--output", type=Path, help="result file (default: stdout)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="input format override")
+    parser.add_argument("--output-format", choices=("jsonl", "csv"))
+    parser.add_argument("--schema", type=Path, default=SCHEMA_PATH)
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    kind = args.format or _format(args.input, "jsonl")
+    output = args.output_format or _format(args.output, kind)
+    with args.input.open(encoding="utf-8", newline="") as source:
+        sink = sys.stdout if args.output is None else args.output.open("w", encoding="utf-8")
+        try:
+            count = score_stream(
+                source,
+                sink,
+                load_schema(args.schema),
+                kind=kind,
+                output=output,
+                workers=args.workers,
+                chunk_rows=args.chunk_rows,
+            )
+        finally:
+            if sink is not sys.stdout:
+                sink.close()
+    print(f"scored {count:,} assessments", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import importlib
+import json
+import re
+import sys
+from pathlib import Path
+
+import generate_readiness_schema as generator
+from readiness_artifacts import with_built_at
+from readiness_batch import SCHEMA_PATH
+from readiness_sql import scoring_function_sql
+from readiness_v1_encoding import ENCODING
+
+
+def test_import_has_no_filesystem_side_effects(monkeypatch):
+    writes = []
+    monkeypatch.setattr("readiness_artifacts.write_if_changed", lambda *args: writes.append(args))
+    monkeypatch.setattr(sys, "argv", ["pytest", "--force"])
+
+    importlib.reload(generator)
+
+    assert writes == []
+    monkeypatch.undo()
+    importlib.reload(generator)
+
+
+def test_build_schema_is_fresh_and_matches_the_seed_file():
+    first, second = generator.build_schema(), generator.build_schema()
+
+    assert first == second
+    assert first is not second and first["questions"] is not second["questions"]
+    first["questions"].clear()
+    assert generator.build_schema()["questions"]
+
+    previous = generator.read_previous_schema(SCHEMA_PATH)
+    stamped = with_built_at(generator.build_schema(), previous)
+    assert generator.dump_schema_json(stamped) == SCHEMA_PATH.read_text(encoding="utf-8")
+    assert generator.cached_schema()["encoding"] == previous["encoding"] == ENCODING
+    source = generator.encoding_source(ENCODING)
+    assert generator.ENCODING_PATH.read_text(encoding="utf-8") == source
+
+
+def test_cached_forms_are_pure_and_shared(monkeypatch):
+    def no_reads(*args, **kwargs):
+        raise AssertionError("cached_schema must not read files")
+
+    generator.cached_schema.cache_clear()
+    generator.schema_json.cache_clear()
+    monkeypatch.setattr(Path, "read_text", no_reads)
+
+    assert generator.cached_schema() is generator.cached_schema()
+    assert generator.schema_json() is generator.schema_json()
+    assert "built_at" not in generator.cached_schema()
+
+
+def test_check_reports_up_to_date_outputs(capsys):
+    assert generator.main(["--check"]) == 0
+    assert "up to date" in capsys.readouterr().out
+
+
+def test_scoring_function_is_current_only_in_the_newest_definition(tmp_path, monkeypatch):
+    monkeypatch.setattr(generator, "MIGRATIONS_DIR", tmp_path)
+    sql = scoring_function_sql(generator.cached_schema())
+    assert not generator.scoring_function_current(sql)
+
+    (tmp_path / "20260101000000_scoring.sql").write_text(sql, encoding="utf-8")
+    assert generator.scoring_function_current(sql)
+
+    stale = sql.replace("'3.9' when 'yes' then 0", "'3.9' when 'yes' then 1")
+    (tmp_path / "20260102000000_scoring.sql").write_text(stale, encoding="utf-8")
+    assert not generator.scoring_function_current(sql)
+
+
+def test_profile_questions_match_the_applied_profile_migration():
+    # 20260326022336 rewrote profile_questions in place; regenerating must not revert it.
+    applied = (generator.MIGRATIONS_DIR / "20260326022336_3e46490a-c1ee-402e-b7fd-556db39011f8.sql")
+    text = applied.read_text(encoding="utf-8")
+    profile_questions = json.loads(re.search(r"'(\[.*\])'::jsonb", text, re.S).group(1))
+    assert generator.build_schema()["profile_questions"] == profile_questions
+
+
+def test_full_migration_carries_every_shard_row(tmp_path, monkeypatch):
+    shards_dir = tmp_path / "shards"
+    shards_dir.mkdir()
+    for shard in generator.SHARDS_DIR.iterdir():
+        (shards_dir / shard.name).write_text(shard.read_text(encoding="utf-8"), encoding="utf-8")
+    schema_path = tmp_path / SCHEMA_PATH.name
+    schema_path.write_text(SCHEMA_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+    migrations = tmp_path / "migrations"
+    migrations.mkdir()
+    monkeypatch.setattr(generator, "SCHEMA_PATH", schema_path)
+    monkeypatch.setattr(generator, "ENCODING_PATH", tmp_path / generator.ENCODING_PATH.name)
+    monkeypatch.setattr(generator, "SHARDS_DIR", shards_dir)
+    monkeypatch.setattr(generator, "MIGRATIONS_DIR", migrations)
+    monkeypatch.setattr(generator, "ROOT", tmp_path)
+
+    # The shard files are current, but the database behind a full upsert may hold none.
+    assert generator.main(["--full"]) == 0
+    (migration,) = migrations.iterdir()
+    index = json.loads((shards_dir / "index.json").read_text(encoding="utf-8"))
+    assert f"({len(index['shards']) + 1} rows)" in migration.read_text(encoding="utf-8")
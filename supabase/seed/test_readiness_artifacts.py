@@ -0,0 +1,126 @@
+import copy
+import os
+import stat
+from datetime import datetime, timezone
+
+from readiness_artifacts import (
+    content_hash,
+    full_migration_sql,
+    json_patch,
+    patch_migration_sql,
+    read_content_hash,
+    stored_content_hash,
+    with_built_at,
+    with_content_hash,
+    write_if_changed,
+)
+from readiness_batch import SCHEMA_PATH, load_schema
+
+
+def test_content_hash_ignores_key_order_and_embedded_hash():
+    schema = {"assessment_id": "readiness_v1", "version": "v1", "questions": [{"id": "1"}]}
+    reordered = {"questions": [{"id": "1"}], "version": "v1", "assessment_id": "readiness_v1"}
+    hashed = with_content_hash(schema)
+
+    assert content_hash(schema) == content_hash(reordered) == content_hash(hashed)
+    assert list(hashed) == ["assessment_id", "version", "content_hash", "questions"]
+    assert content_hash({**schema, "version": "v2"}) != content_hash(schema)
+
+
+def test_built_at_is_outside_the_hash_and_kept_while_it_matches():
+    schema = with_content_hash({"assessment_id": "readiness_v1", "version": "v1", "questions": []})
+    later = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+    stamped = with_built_at(schema, now=later)
+
+    assert list(stamped) == ["assessment_id", "version", "content_hash", "built_at", "questions"]
+    assert stamped["built_at"] == "2026-10-18T12:00:00Z"
+    assert content_hash(stamped) == schema["content_hash"]
+    assert with_built_at(schema, stamped) == stamped
+    changed = with_content_hash({**schema, "questions": [{"id": "1"}]})
+    assert with_built_at(changed, stamped)["built_at"] != stamped["built_at"]
+
+
+def test_generated_schema_embeds_its_own_hash():
+    schema = load_schema()
+    assert schema["content_hash"] == content_hash(schema)
+    assert read_content_hash(SCHEMA_PATH) == schema["content_hash"]
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    target = tmp_path / "schema.json"
+
+    assert write_if_changed(target, '{"content_hash": "a"}') is True
+    modified = target.stat().st_mtime_ns
+    assert write_if_changed(target, '{"content_hash": "a"}') is False
+    assert target.stat().st_mtime_ns == modified
+    assert write_if_changed(target, '{"content_hash": "b"}') is True
+    assert read_content_hash(target) == "b"
+    assert [path.name for path in tmp_path.iterdir()] == ["schema.json"]
+    assert read_content_hash(tmp_path / "missing.json") is None
+
+
+def test_write_if_changed_keeps_file_modes_and_forces_rewrites(tmp_path):
+    existing = tmp_path / "schema.json"
+    existing.write_text("{}", encoding="utf-8")
+    existing.chmod(0o640)
+    created = tmp_path / "migration.sql"
+
+    assert write_if_changed(existing, '{"a": 1}') and write_if_changed(created, "select 1;")
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(created.stat().st_mode) == 0o666 & ~umask
+
+    assert write_if_changed(existing, '{"a": 1}') is False
+    assert write_if_changed(existing, '{"a": 1}', force=True) is True
+
+
+def test_json_patch_targets_changed_questions_only():
+    old = load_schema()
+    new = copy.deepcopy(old)
+    new["questions"][3]["prompt"] = "Updated prompt"
+    new["score_bands"] = new["score_bands"][:-1]
+    new["new_table"] = {"a": 1}
+    del new["flags"]
+
+    assert json_patch(old, new) == [
+        ("set", ("score_bands",), new["score_bands"]),
+        ("set", ("questions", "3"), new["questions"][3]),
+        ("set", ("new_table",), {"a": 1}),
+        ("remove", ("flags",)),
+    ]
+    assert json_patch(old, copy.deepcopy(old)) == []
+
+
+def test_patch_migration_is_one_guarded_update():
+    ops = [("set", ("questions", "3"), {"prompt": "It's"}), ("remove", ("flags",))]
+    sql = patch_migration_sql(
+        ops, assessment_id="readiness_v1", version="v1", old_hash="a" * 64, new_hash="b" * 64
+    )
+
+    assert sql.count("update readiness_v1.assessment_schemas") == 1
+    assert "set schema_json = (jsonb_set(schema_json," in sql
+    assert """'{"questions","3"}', $json${"prompt":"It's"}$json$::jsonb)""" in sql
+    assert """#- '{"flags"}')""" in sql
+    assert f"and schema_json->>'content_hash' = '{'a' * 64}';" in sql
+    assert "raise exception" in sql
+
+
+def test_stored_hash_follows_the_newest_schema_migration(tmp_path):
+    def migration(name: str, text: str) -> None:
+        (tmp_path / f"{name}.sql").write_text(text, encoding="utf-8")
+
+    ids = {"assessment_id": "readiness_v1", "version": "v1"}
+    migration("20260109005000_update", "-- Update readiness schema\ninsert into readiness_v1.assessment_schemas")
+    assert stored_content_hash(tmp_path) is None
+
+    migration("20261018000000_update", full_migration_sql("{}", **ids, new_hash="a" * 64))
+    migration("20261018000001_shards", "create table readiness_v1.assessment_schema_shards ();")
+    assert stored_content_hash(tmp_path) == "a" * 64
+
+    patch = patch_migration_sql([], **ids, old_hash="a" * 64, new_hash="b" * 64)
+    migration("20261018000002_patch", patch)
+    assert stored_content_hash(tmp_path) == "b" * 64
+
+    migration("20261019000000_manual", "UPDATE readiness_v1.assessment_schemas SET schema_json = '{}';")
+    assert stored_content_hash(tmp_path) is None
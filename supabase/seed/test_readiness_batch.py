@@ -0,0 +1,101 @@
+import random
+
+import numpy as np
+import pytest
+
+from readiness_batch import BatchScorer, js_round, load_schema
+from readiness_conditions import compile_condition
+
+SCHEMA = load_schema()
+SCORER = BatchScorer(SCHEMA)
+
+
+def reference_score(answers: dict, profile: dict) -> tuple[int, dict]:
+    """Straight port of the agent edge function's section/overall scoring."""
+    applicable = [
+        q for q in SCHEMA["questions"] if compile_condition(q["applies_if"])(answers, profile)
+    ]
+    weighted_sum = 0
+    total_weight = 0
+    section_scores = {}
+    for section in SCHEMA["sections"]:
+        total = 0.0
+        weight = 0
+        for q in applicable:
+            if q["section_id"] != section["id"] or q["id"] not in answers:
+                continue
+            option = next(o for o in q["options"] if o["value"] == answers[q["id"]])
+            fraction = SCHEMA["answer_scoring"][option.get("score_value", option["value"])]
+            if fraction is not None:
+                total += fraction * 100 * q["weight"]
+                weight += q["weight"]
+        score = int(js_round(np.float64(total / weight))) if weight else 0
+        section_scores[section["id"]] = score
+        if weight:
+            weighted_sum += score * section["weight"]
+            total_weight += section["weight"]
+    overall = int(js_round(np.float64(weighted_sum / total_weight))) if total_weight else 0
+    return overall, section_scores
+
+
+def random_assessment(rng: random.Random) -> tuple[dict, dict]:
+    profile: dict = {}
+    for field in SCORER.profile_fields:
+        if rng.random() < 0.9:
+            group, name = field.split(".")
+            profile.setdefault(group, {})[name] = rng.random() < 0.5
+    answers = {}
+    for question in SCHEMA["questions"]:
+        if rng.random() < 0.8:
+            answers[question["id"]] = rng.choice(question["options"])["value"]
+    return answers, profile
+
+
+def test_matches_reference_scoring_on_random_population():
+    rng = random.Random(7)
+    population = [random_assessment(rng) for _ in range(300)]
+    answers_matrix, profile_matrix = SCORER.encode(population)
+    results = SCORER.score_batch(answers_matrix, profile_matrix, chunk_size=64)
+
+    for row, (answers, profile) in enumerate(population):
+        overall, sections = reference_score(answers, profile)
+        assert results["overall_score"][row] == overall
+        assert list(results["section_scores"][row]) == [sections[sid] for sid in SCORER.section_ids]
+        label = results["band_labels"][results["band"][row]]
+        band = next(b for b in SCHEMA["score_bands"] if b["min"] <= overall <= b["max"])
+        assert label == band["label"]
+
+
+def test_score_value_overrides_are_applied():
+    answers_matrix, profile_matrix = SCORER.encode([({"3.9": "yes"}, {}), ({"3.9": "no"}, {})])
+    results = SCORER.score_batch(answers_matrix, profile_matrix)
+    section = SCORER.section_ids.index("3")
+    assert list(results["section_scores"][:, section]) == [0, 100]
+
+
+def test_profile_gates_and_unanswered_rows():
+    answers_matrix, profile_matrix = SCORER.encode(
+        [({}, {}), ({"5.4": "yes"}, {"pets": {"has_pets": False}}), ({"5.4": "yes"}, {"pets": {"has_pets": True}})]
+    )
+    results = SCORER.score_batch(answers_matrix, profile_matrix)
+    pets_question = SCORER.question_ids.index("5.4")
+
+    assert list(results["overall_score"]) == [0, 0, 100]
+    assert list(results["applicable"][:, pets_question]) == [False, False, True]
+
+
+def test_non_boolean_profile_values_are_unknown_like_compiled_conditions():
+    pets_field = SCORER.profile_index["pets.has_pets"]
+    profiles = [{"pets": {"has_pets": value}} for value in ["no", "yes", "", None, True, False]]
+    _answers, profile_matrix = SCORER.encode(({}, profile) for profile in profiles)
+    assert list(profile_matrix[:, pets_field]) == [-1, -1, -1, -1, 1, 0]
+
+    pets = compile_condition("profile.pets.has_pets == true")
+    applicable = SCORER.applicability(*SCORER.encode(({}, profile) for profile in profiles))
+    pets_question = SCORER.question_index["5.4"]
+    assert list(applicable[:, pets_question]) == [pets({}, profile) for profile in profiles]
+
+
+@pytest.mark.parametrize("value, expected", [(0.5, 1.0), (1.5, 2.0), (2.5, 3.0), (-0.5, 0.0)])
+def test_js_round_rounds_half_up(value, expected):
+    assert js_round(np.float64(value)) == expected
@@ -0,0 +1,89 @@
+import copy
+
+import numpy as np
+import pytest
+
+from readiness_batch import BatchScorer, load_schema
+from readiness_codec import AssessmentCodec
+from readiness_population import PopulationGenerator
+from readiness_tables import build_encoding
+
+SCHEMA = load_schema()
+RECORDS = list(PopulationGenerator(SCHEMA, seed=6, completion_rate=0.7).records(30))
+
+
+def test_pack_round_trips_into_fixed_size_bytes():
+    codec = AssessmentCodec(SCHEMA)
+    for record in RECORDS:
+        data = codec.pack(record["answers"], record["profile"])
+        assert len(data) == SCHEMA["encoding"]["byte_length"] < 40
+        assert codec.unpack(data) == (record["answers"], record["profile"])
+    assert codec.unpack(codec.pack({})) == ({}, {})
+
+
+def test_to_matrices_matches_batch_encoding():
+    codec = AssessmentCodec(SCHEMA)
+    blobs = [codec.pack(record["answers"], record["profile"]) for record in RECORDS]
+
+    answers, profile = codec.to_matrices(blobs)
+    expected = BatchScorer(SCHEMA).encode((r["answers"], r["profile"]) for r in RECORDS)
+    assert np.array_equal(answers, expected[0]) and answers.dtype == expected[0].dtype
+    assert np.array_equal(profile, expected[1]) and profile.dtype == expected[1].dtype
+    assert codec.to_matrices([])[0].shape == (0, len(SCHEMA["questions"]))
+
+
+def test_pack_rejects_values_it_cannot_encode():
+    codec = AssessmentCodec(SCHEMA)
+    with pytest.raises(ValueError, match="has no code"):
+        codec.pack({"1.1.A.1": "maybe"})
+    with pytest.raises(ValueError, match="no encoding slot"):
+        codec.pack({"99.9": "yes"})
+    with pytest.raises(ValueError, match="Expected encoding layout"):
+        codec.unpack(b"\0")
+    with pytest.raises(ValueError, match="at most"):
+        codec.unpack(codec.pack({}) + b"\0")
+
+
+def test_blobs_packed_with_different_slots_are_rejected():
+    # A question inserted mid-list shifts every later slot in a fresh encoding.
+    inserted = copy.deepcopy(SCHEMA)
+    inserted["questions"].insert(3, {**inserted["questions"][0], "id": "1.1.A.0"})
+    inserted["encoding"] = build_encoding(inserted)
+    data = AssessmentCodec(inserted).pack(RECORDS[0]["answers"], RECORDS[0]["profile"])
+
+    codec = AssessmentCodec(SCHEMA)
+    with pytest.raises(ValueError, match="digest"):
+        codec.unpack(data)
+    with pytest.raises(ValueError, match="digest"):
+        codec.to_matrices([data, codec.pack({})])
+
+
+def test_profile_values_pack_like_the_batch_encoding():
+    codec = AssessmentCodec(SCHEMA)
+    profile = {"pets": {"has_pets": "no"}, "home": {"owns_real_property": False}}
+    assert codec.unpack(codec.pack({}, profile)) == ({}, {"home": {"owns_real_property": False}})
+
+
+def test_blobs_packed_under_an_older_schema_still_decode():
+    older = copy.deepcopy(SCHEMA)
+    removed_questions = {question["id"] for question in older["questions"][-5:]}
+    del older["questions"][-5:]
+    removed_field = older["profile_questions"].pop()["field"]
+    older["encoding"] = build_encoding(older)
+    newer = {**SCHEMA, "encoding": build_encoding(SCHEMA, older["encoding"])}
+    old_codec, codec = AssessmentCodec(older), AssessmentCodec(newer)
+
+    records = []
+    for record in RECORDS:
+        answers = {qid: value for qid, value in record["answers"].items() if qid not in removed_questions}
+        profile = copy.deepcopy(record["profile"])
+        group, leaf = removed_field.split(".")
+        profile.get(group, {}).pop(leaf, None)
+        records.append((answers, {key: value for key, value in profile.items() if value}))
+    blobs = [old_codec.pack(answers, profile) for answers, profile in records]
+
+    assert len(blobs[0]) < codec.byte_length
+    assert [codec.unpack(data) for data in blobs] == records
+    answers, profile = codec.to_matrices(blobs + [codec.pack(*records[0])])
+    expected = BatchScorer(SCHEMA).encode(records + records[:1])
+    assert np.array_equal(answers, expected[0]) and np.array_equal(profile, expected[1])
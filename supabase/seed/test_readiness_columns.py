@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from readiness_batch import BatchScorer, load_schema
+from readiness_columns import ColumnStore, write_store
+from readiness_population import PopulationGenerator
+
+SCHEMA = load_schema()
+RECORDS = list(PopulationGenerator(SCHEMA, seed=9, completion_rate=0.8).records(50))
+
+
+def test_store_round_trips_encoded_matrices(tmp_path):
+    assert write_store(tmp_path, iter(RECORDS), SCHEMA, chunk_rows=16) == 50
+
+    store = ColumnStore(tmp_path, SCHEMA)
+    answers, profile = BatchScorer(SCHEMA).encode((r["answers"], r["profile"]) for r in RECORDS)
+    assert isinstance(store.answers("11.3"), np.memmap)
+    assert np.array_equal(store.answer_matrix(), answers)
+    assert np.array_equal(store.profile_matrix(), profile)
+    assert [value.decode() for value in store.ids()] == [r["assessment_id"] for r in RECORDS]
+
+
+def test_aggregations_read_single_columns(tmp_path):
+    write_store(tmp_path, iter(RECORDS), SCHEMA)
+    store = ColumnStore(tmp_path, SCHEMA)
+
+    counts = store.answer_counts("5.4")
+    assert sum(counts.values()) == 50
+    assert counts[None] == sum("5.4" not in r["answers"] for r in RECORDS)
+    assert counts["yes"] == sum(r["answers"].get("5.4") == "yes" for r in RECORDS)
+    assert list(store.section_answer_counts("5")) == [
+        q["id"] for q in SCHEMA["questions"] if q["section_id"] == "5"
+    ]
+
+
+def test_store_rejects_a_different_schema(tmp_path):
+    write_store(tmp_path, iter(RECORDS[:3]), SCHEMA)
+
+    with pytest.raises(ValueError, match="was built for schema"):
+        ColumnStore(tmp_path, {**SCHEMA, "content_hash": "0" * 64})
+    assert not list(tmp_path.glob(".*.raw"))
@@ -0,0 +1,241 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from readiness_conditions import (
+    ApplicabilityCache,
+    ConditionError,
+    applicable_questions,
+    compile_condition,
+    compile_condition_table,
+    compile_schema,
+    complement_condition,
+    condition_ops,
+    evaluate_condition_table,
+    evaluate_ops,
+    parse_condition,
+    prove_complement,
+    schema_domains,
+    unparse_condition,
+    validate_condition,
+    validate_schema_conditions,
+)
+
+SCHEMA = json.loads(
+    (Path(__file__).resolve().parent / "readiness_v1_schema.json").read_text(encoding="utf-8")
+)
+
+LEGAL_DOCS = (
+    "answers['1.1.B.1'] in ['yes','partial'] or "
+    "answers['1.1.B.3'] in ['yes','partial'] or "
+    "answers['1.1.B.5'] in ['yes','partial']"
+)
+
+
+def test_parses_always_and_empty_expressions():
+    assert parse_condition("always") == {"op": "always"}
+    assert parse_condition(None) == {"op": "always"}
+    assert compile_condition("always")({}, {}) is True
+
+
+def test_parses_or_chain_into_flat_node():
+    node = parse_condition(LEGAL_DOCS)
+    assert node["op"] == "or"
+    assert [arg["answer"] for arg in node["args"]] == ["1.1.B.1", "1.1.B.3", "1.1.B.5"]
+    assert node["args"][0] == {"op": "in", "answer": "1.1.B.1", "values": ["yes", "partial"]}
+
+
+def test_parses_profile_comparisons_and_precedence():
+    node = parse_condition(
+        "profile.pets.has_pets == true and not (answers['5.1'] in ['no'] or answers['5.2'] != 'yes')"
+    )
+    assert node["op"] == "and"
+    assert node["args"][0] == {"op": "eq", "profile": "pets.has_pets", "value": True}
+    assert node["args"][1]["op"] == "not"
+    assert node["args"][1]["arg"]["op"] == "or"
+
+
+def test_compiled_conditions_match_edge_function_semantics():
+    condition = compile_condition(LEGAL_DOCS)
+    assert condition({"1.1.B.3": "partial"}, {}) is True
+    assert condition({"1.1.B.1": "no", "1.1.B.3": "not_sure"}, {}) is False
+    assert condition({}, {}) is False
+
+    pets = compile_condition("profile.pets.has_pets == true")
+    assert pets({}, {"pets": {"has_pets": True}}) is True
+    assert pets({}, {"pets": {"has_pets": False}}) is False
+    assert pets({}, {}) is False
+    assert pets({}, {"pets": True}) is False
+
+
+@pytest.mark.parametrize(
+    "expression, message",
+    [
+        ("answers['5.2'] != 'yes'", "not supported"),
+        ("answers['5.2'] not in ['yes']", "not supported"),
+        ("not answers['5.2'] in ['yes']", "not supported"),
+        ("answers['5.1'] in ['no'] and (answers['5.2'] in ['yes'] or answers['5.3'] in ['yes'])", "nested"),
+        ("profile.pets.has_pets == true or answers['5.2'] in ['yes']", "last argument"),
+    ],
+)
+def test_validation_rejects_what_the_edge_functions_cannot_evaluate(expression, message):
+    answer_domains, profile_domains = schema_domains(SCHEMA)
+    with pytest.raises(ConditionError, match=message):
+        validate_condition(parse_condition(expression), answer_domains, profile_domains)
+
+
+def test_missing_inputs_fail_every_admitted_comparison():
+    answer_domains, profile_domains = schema_domains(SCHEMA)
+    expression = "answers['5.2'] in ['yes'] or profile.pets.has_pets == false"
+    validate_condition(parse_condition(expression), answer_domains, profile_domains)
+    assert compile_condition(expression)({}, {}) is False
+    assert compile_condition(expression)({}, {"pets": {"has_pets": False}}) is True
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "answers['1.1.A.1'] in ['yes'",
+        "answers['1.1.A.1'] ~ ['yes']",
+        "answers['1.1.A.1'] in ['yes'] or",
+        "settings.enabled == true",
+        "profile == true",
+    ],
+)
+def test_rejects_malformed_expressions(expression):
+    with pytest.raises(ConditionError):
+        parse_condition(expression)
+
+
+def test_validation_rejects_unknown_refs_and_values():
+    answer_domains, profile_domains = schema_domains(SCHEMA)
+    with pytest.raises(ConditionError, match="Unknown answer"):
+        validate_condition(parse_condition("answers['99.9'] in ['yes']"), answer_domains, profile_domains)
+    with pytest.raises(ConditionError, match="not valid"):
+        validate_condition(
+            parse_condition("answers['1.1.A.1'] in ['maybe']"), answer_domains, profile_domains
+        )
+    with pytest.raises(ConditionError, match="Unknown profile"):
+        validate_condition(parse_condition("profile.pets.owns_cat == true"), answer_domains, profile_domains)
+
+
+def test_generated_schema_conditions_are_valid():
+    validate_schema_conditions(SCHEMA)
+
+
+def test_applicable_questions_follow_profile_and_soft_gates():
+    compiled = compile_schema(SCHEMA)
+    profile = {"pets": {"has_pets": True}, "digital": {"owns_crypto": False}}
+    applicable = applicable_questions(compiled, {"1.1.A.1": "yes"}, profile)
+
+    assert "1.1.A.2" in applicable
+    assert "1.1.A.4" not in applicable
+    assert "5.4" in applicable
+    assert "6.7" not in applicable
+    assert len(compiled["profile_gates"]) == len(SCHEMA["profile_gates"])
+
+
+def test_applicability_cache_keys_only_on_what_conditions_compare():
+    cache = ApplicabilityCache(SCHEMA, maxsize=2)
+    compiled = compile_schema(SCHEMA)
+    states = [
+        ({"1.1.A.1": "yes", "3.1": "no"}, {"pets": {"has_pets": True}}),
+        # Differs only in a non-gating answer, a gating "no" vs unanswered and
+        # a non-boolean profile value, none of which any condition tells apart.
+        ({"1.1.A.1": "partial", "2.1": "no"}, {"pets": {"has_pets": "yes"}, "home": []}),
+        ({"1.1.A.1": "no"}, {}),
+    ]
+    for answers, profile in states:
+        flags = cache.applicable(answers, profile)
+        expected = applicable_questions(compiled, answers, profile)
+        assert [q["id"] for q, flag in zip(SCHEMA["questions"], flags) if flag] == expected
+
+    assert cache.key(*states[1]) == cache.key({"1.1.A.1": "yes"}, {"pets": {"has_pets": False}})
+    assert cache.info() == {"hits": 0, "misses": 3, "maxsize": 2, "currsize": 2}
+    cache.applicable({"1.1.A.1": "no", "3.1": "yes"}, {"home": {}})
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.applicable(*states[0])
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_condition_table_agrees_with_legacy_strings():
+    answers = {"1.1.A.1": "partial", "1.1.B.7": "yes", "2.1": "no", "2.3": "not_sure"}
+    profile = {"pets": {"has_pets": False}, "home": {"owns_real_property": True}}
+    table = SCHEMA["conditions"]
+    results = evaluate_condition_table(compile_condition_table(table), answers, profile)
+
+    for question in SCHEMA["questions"]:
+        expected = compile_condition(question["applies_if"])(answers, profile)
+        ref = question.get("applies_if_ref")
+        assert (results[ref] if ref else True) is expected
+        if ref:
+            assert table[ref]["ast"] == parse_condition(question["applies_if"])
+            assert evaluate_ops(table[ref]["ops"], answers, profile) is expected
+    for gate in SCHEMA["profile_gates"] + SCHEMA["soft_gates"]:
+        assert results[gate["when_ref"]] is compile_condition(gate["when"])(answers, profile)
+
+
+def test_repeated_conditions_share_one_table_entry():
+    refs = [q["applies_if_ref"] for q in SCHEMA["questions"] if q["id"] in ("1.1.A.7", "1.1.B.10", "1.1.B.11")]
+    assert len(set(refs)) == 1
+    assert SCHEMA["soft_gates"][4]["when_ref"] == refs[0]
+    references = [q["applies_if_ref"] for q in SCHEMA["questions"] if q.get("applies_if_ref")]
+    references += [g["when_ref"] for g in SCHEMA["profile_gates"] + SCHEMA["soft_gates"]]
+    assert sorted(SCHEMA["conditions"]) == sorted(set(references))
+    assert len(SCHEMA["conditions"]) < len(references)
+
+
+def test_condition_ops_are_postfix():
+    ops = condition_ops(parse_condition("not answers['2.1'] in ['yes'] and profile.pets.has_pets == true"))
+    assert ops == [
+        ["in", "answer", "2.1", ["yes"]],
+        ["not"],
+        ["eq", "profile", "pets.has_pets", True],
+        ["and", 2],
+    ]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        LEGAL_DOCS,
+        "profile.pets.has_pets == false",
+        "(answers['2.1'] in ['yes'] or profile.pets.has_pets != true) and answers['2.3'] not in ['no']",
+        "not (answers['2.1'] in ['yes'] and not profile.pets.has_pets == true)",
+    ],
+)
+def test_unparse_round_trips(expression):
+    node = parse_condition(expression)
+    assert unparse_condition(node) == expression
+    assert parse_condition(unparse_condition(node)) == node
+
+
+def test_complement_follows_de_morgan_over_option_order():
+    answer_domains, profile_domains = schema_domains(SCHEMA)
+    node = parse_condition(
+        "answers['1.1.B.8'] in ['yes','partial'] or profile.pets.has_pets == true"
+    )
+    complement = complement_condition(node, answer_domains, profile_domains)
+
+    assert unparse_condition(complement) == (
+        "answers['1.1.B.8'] in ['no','not_sure','na'] and profile.pets.has_pets == false"
+    )
+    assert prove_complement(node, complement, answer_domains, profile_domains) == 10
+    assert not compile_condition(unparse_condition(complement))({}, {})
+
+
+def test_prove_complement_rejects_overlaps_and_gaps():
+    answer_domains, profile_domains = schema_domains(SCHEMA)
+    node = parse_condition("answers['2.1'] in ['yes','partial']")
+
+    with pytest.raises(ConditionError, match="2.1='not_sure'"):
+        prove_complement(
+            node, parse_condition("answers['2.1'] in ['no']"), answer_domains, profile_domains
+        )
+    with pytest.raises(ConditionError, match="covers every value"):
+        complement_condition(
+            parse_condition("answers['2.1'] in ['yes','partial','no','not_sure']"),
+            answer_domains,
+            profile_domains,
+        )
@@ -0,0 +1,58 @@
+import json
+
+import numpy as np
+
+from readiness_batch import BatchScorer, load_schema
+from readiness_gains import GainEngine, recommendations
+from readiness_population import PopulationGenerator
+
+SCHEMA = load_schema()
+ENGINE = GainEngine(SCHEMA)
+RECORDS = list(PopulationGenerator(SCHEMA, seed=8, completion_rate=0.6).records(40))
+ANSWERS, PROFILE = BatchScorer(SCHEMA).encode((r["answers"], r["profile"]) for r in RECORDS)
+
+
+def test_gains_match_rescoring_each_move():
+    gains = ENGINE.gains(ANSWERS, PROFILE, chunk_size=16)
+    base = ENGINE.overall(ANSWERS, PROFILE)
+
+    assert np.isfinite(gains).any()
+    for q_index in range(ANSWERS.shape[1]):
+        rows = np.flatnonzero(~np.isnan(gains[:, q_index]))
+        moved = ANSWERS[rows].copy()
+        moved[:, q_index] = ENGINE.best_codes[q_index]
+        expected = ENGINE.overall(moved, PROFILE[rows]) - base[rows]
+        np.testing.assert_allclose(gains[rows, q_index], expected, atol=1e-4)
+
+
+def test_only_applicable_improvable_questions_are_candidates():
+    gains = ENGINE.gains(ANSWERS, PROFILE)
+    applicable = ENGINE.scorer.applicability(ANSWERS, PROFILE)
+    best = ANSWERS == ENGINE.best_codes
+
+    assert not (~np.isnan(gains) & ~applicable).any()
+    assert np.isnan(gains[best]).all()
+    # 3.9 is scored through score_value, so its best answer is "no".
+    best_code = ENGINE.best_codes[ENGINE.scorer.question_index["3.9"]]
+    assert ENGINE.scorer.answer_values[best_code - 1] == "no"
+    gating = {q_index: list(columns) for q_index, _entries, columns in ENGINE.gating}
+    assert gating[ENGINE.scorer.question_index["1.1.A.1"]] == [0, 1]
+
+
+def test_top_gains_rank_candidates_best_first():
+    gains = ENGINE.gains(ANSWERS, PROFILE)
+    indices, values = ENGINE.top_gains(ANSWERS, PROFILE, 5, chunk_size=7)
+
+    for row, (row_indices, row_values) in enumerate(zip(indices, values)):
+        found = row_indices >= 0
+        assert np.all(np.diff(row_values[found]) <= 0)
+        np.testing.assert_allclose(row_values[found], gains[row, row_indices[found]])
+        expected = np.sort(gains[row][~np.isnan(gains[row])])[::-1][:5]
+        np.testing.assert_allclose(row_values[found], expected)
+
+    results = list(recommendations(ENGINE, RECORDS[:3], 2))
+    assert [result["assessment_id"] for result in results] == [
+        record["assessment_id"] for record in RECORDS[:3]
+    ]
+    assert all(len(result["recommendations"]) <= 2 for result in results)
+    assert json.loads(json.dumps(results)) == results
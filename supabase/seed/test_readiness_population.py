@@ -0,0 +1,64 @@
+import io
+import json
+
+import pytest
+
+from readiness_batch import load_schema
+from readiness_conditions import compile_condition
+from readiness_population import PopulationGenerator, write_jsonl
+
+SCHEMA = load_schema()
+
+
+def test_records_only_answer_applicable_questions():
+    generator = PopulationGenerator(SCHEMA, seed=3)
+    gates = [
+        (compile_condition(gate["when"]), gate["questions"])
+        for kind in ("profile_gates", "soft_gates")
+        for gate in SCHEMA[kind]
+        if gate["result"] == "na"
+    ]
+    seen: set[str] = set()
+    for record in generator.records(300):
+        answers, profile = record["answers"], record["profile"]
+        excluded = {qid for condition, qids in gates if condition(answers, profile) for qid in qids}
+        for question in SCHEMA["questions"]:
+            applies = compile_condition(question.get("applies_if"))(answers, profile)
+            expected = applies and question["id"] not in excluded
+            assert (question["id"] in answers) == expected, question["id"]
+        seen.update(answers)
+    assert {"1.1.A.2", "5.4"} <= seen
+
+
+def test_records_are_reproducible_per_index():
+    generator = PopulationGenerator(SCHEMA, seed=11, completion_rate=0.5)
+    full = list(generator.records(20))
+
+    assert list(generator.records(5, start=15)) == full[15:]
+    assert PopulationGenerator(SCHEMA, seed=11, completion_rate=0.5).record(7) == full[7]
+    assert PopulationGenerator(SCHEMA, seed=12).record(7) != full[7]
+    assert len({record["assessment_id"] for record in full}) == 20
+
+
+def test_answer_weights_and_completion_rate():
+    only_yes = PopulationGenerator(SCHEMA, answer_weights={"yes": 1}, completion_rate=0.0)
+    records = list(only_yes.records(50))
+
+    scored_as = {
+        (q["id"], option["value"]): option.get("score_value", option["value"])
+        for q in SCHEMA["questions"]
+        for option in q["options"]
+    }
+    assert {scored_as[item] for r in records for item in r["answers"].items()} == {"yes"}
+    assert all(len(r["answers"]) < len(SCHEMA["questions"]) for r in records)
+    with pytest.raises(ValueError, match="maybe"):
+        PopulationGenerator(SCHEMA, answer_weights={"maybe": 1})
+
+
+def test_write_jsonl_streams_one_record_per_line():
+    handle = io.StringIO()
+    count = write_jsonl(PopulationGenerator(SCHEMA).records(4), handle)
+
+    lines = handle.getvalue().splitlines()
+    assert count == len(lines) == 4
+    assert set(json.loads(lines[0])) == {"assessment_id", "profile", "answers"}
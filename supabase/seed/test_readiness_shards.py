@@ -0,0 +1,83 @@
+import copy
+import json
+
+import pytest
+
+from readiness_batch import SCHEMA_PATH, load_schema
+from readiness_shards import (
+    SHARDED_TABLES,
+    TABLES_KEY,
+    build_shards,
+    load_shard,
+    served_schema,
+    shard_files,
+    shard_rows_sql,
+)
+
+SCHEMA = load_schema()
+SHARDS_DIR = SCHEMA_PATH.parent / "readiness_v1_shards"
+SECTION_IDS = [section["id"] for section in SCHEMA["sections"]]
+
+
+def test_shards_split_questions_by_section_with_their_conditions():
+    index, shards = build_shards(SCHEMA)
+    sections = [shards[section_id] for section_id in SECTION_IDS]
+
+    assert [q for shard in sections for q in shard["questions"]] == SCHEMA["questions"]
+    assert list(index["shards"]) == [*SECTION_IDS, TABLES_KEY]
+    for shard in sections:
+        refs = {q["applies_if_ref"] for q in shard["questions"] if "applies_if_ref" in q}
+        refs |= {gate["when_ref"] for gate in shard["soft_gates"]}
+        assert set(shard["conditions"]) == refs
+    assert set(index["conditions"]) == {gate["when_ref"] for gate in SCHEMA["profile_gates"]}
+    assert len(json.dumps(shards["6"])) < len(json.dumps(SCHEMA)) / 10
+
+
+def test_editing_one_section_only_changes_its_shard():
+    index, shards = build_shards(SCHEMA)
+    edited = copy.deepcopy(SCHEMA)
+    next(q for q in edited["questions"] if q["section_id"] == "6")["prompt"] += "?"
+    new_index, new_shards = build_shards(edited)
+
+    changed = [sid for sid, shard in shards.items() if shard != new_shards[sid]]
+    assert changed == ["6"]
+    assert new_index["content_hash"] != index["content_hash"]
+    sql = shard_rows_sql(new_index, new_shards, index)
+    assert "(2 rows)" in sql and "'v1', 'section:6'" in sql and "'v1', 'section:5'" not in sql
+    assert shard_rows_sql(index, shards, index) is None
+
+
+def test_generated_files_load_and_verify_against_the_index(tmp_path):
+    index, shards = build_shards(SCHEMA)
+    assert load_shard(SHARDS_DIR, "6") == shards["6"]
+
+    for name, text in shard_files(index, shards).items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+    (tmp_path / "section_6.json").write_text(json.dumps({**shards["6"], "content_hash": "x"}))
+    with pytest.raises(ValueError, match="does not match"):
+        load_shard(tmp_path, "6")
+
+
+def test_served_schema_references_the_tables_shard_instead_of_embedding_it():
+    index, shards = build_shards(SCHEMA)
+    served = served_schema(SCHEMA)
+
+    assert not set(SHARDED_TABLES) & set(served)
+    assert served["table_shard"] == SCHEMA["table_shard"] == {
+        "key": TABLES_KEY,
+        "content_hash": index["shards"][TABLES_KEY]["content_hash"],
+        "tables": list(SHARDED_TABLES),
+    }
+    assert {key: shards[TABLES_KEY][key] for key in SHARDED_TABLES} == {
+        key: SCHEMA[key] for key in SHARDED_TABLES
+    }
+    assert served["content_hash"] == SCHEMA["content_hash"]
+    refs = [q["applies_if_ref"] for q in served["questions"] if q.get("applies_if_ref")]
+    refs += [g["when_ref"] for kind in ("profile_gates", "soft_gates") for g in served[kind]]
+    assert set(refs) == set(served["conditions"])
+    # Derived tables are most of the build; edge functions fetch the served row per request.
+    tables_size = sum(len(json.dumps(SCHEMA[key])) for key in SHARDED_TABLES)
+    assert len(json.dumps(served)) + tables_size < len(json.dumps(SCHEMA))
+    assert load_shard(SHARDS_DIR, TABLES_KEY) == shards[TABLES_KEY]
+    legacy = {key: value for key, value in SCHEMA.items() if key != "table_shard"}
+    assert served_schema(legacy) == legacy
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import os
+import uuid
+
+import pytest
+
+from readiness_batch import load_schema
+from readiness_conditions import parse_condition
+from readiness_population import PopulationGenerator
+from readiness_sql import SCORING_FUNCTION, condition_sql, scoring_function_sql
+from readiness_state import AssessmentState
+
+SCHEMA = load_schema()
+
+# Point this at a disposable database, e.g. `docker run -p 5432:5432 postgres:16`.
+TEST_DSN = os.environ.get("READINESS_TEST_DSN")
+
+
+def test_conditions_treat_missing_inputs_like_the_evaluator():
+    assert condition_sql(parse_condition("answers['2.1'] in ['yes','partial']")) == (
+        "(i.answers->>'2.1' in ('yes', 'partial')) is true"
+    )
+    assert condition_sql(parse_condition("profile.pets.has_pets != true")) == (
+        "(i.profile#>'{pets,has_pets}' = 'true'::jsonb) is not true"
+    )
+    assert condition_sql(
+        parse_condition("not (answers['1.1.A.1'] == 'no' or profile.family.has_children == false)")
+    ) == (
+        "not (((i.answers->>'1.1.A.1' = 'no') is true"
+        " or (i.profile#>'{family,has_children}' = 'false'::jsonb) is true))"
+    )
+    assert condition_sql(parse_condition("always")) == "true"
+
+
+def test_function_covers_every_question_and_section_weight():
+    sql = scoring_function_sql(SCHEMA)
+
+    assert sql.count(f"create or replace function {SCORING_FUNCTION}(") == 1
+    for question in SCHEMA["questions"]:
+        assert f"case i.answers->>'{question['id']}' " in sql
+    for section in SCHEMA["sections"]:
+        assert f"('{section['id']}', {section['weight']}::numeric)" in sql
+    # 3.9 scores through score_value: "yes" counts as no and vice versa.
+    assert "case i.answers->>'3.9' when 'yes' then 0 when 'no' then 1 " in sql
+    assert "'na' then" not in sql
+
+
+@pytest.mark.skipif(not TEST_DSN, reason="set READINESS_TEST_DSN to a disposable Postgres")
+def test_function_matches_assessment_state():
+    asyncpg = pytest.importorskip("asyncpg")
+    from test_rescore_job import SETUP_SQL
+
+    records = list(PopulationGenerator(SCHEMA, seed=4, completion_rate=0.7).records(25))
+
+    async def scenario() -> list:
+        connection = await asyncpg.connect(TEST_DSN)
+        try:
+            await connection.execute(SETUP_SQL)
+            await connection.execute(scoring_function_sql(SCHEMA).split("\ngrant ")[0])
+            ids = [uuid.UUID(record["assessment_id"]) for record in records]
+            for assessment_id, record in zip(ids, records):
+                subject_id = uuid.uuid4()
+                await connection.execute(
+                    "insert into readiness_v1.profile_intake values ($1, $2::jsonb)",
+                    subject_id,
+                    json.dumps(record["profile"]),
+                )
+                await connection.execute(
+                    "insert into readiness_v1.assessments (id, subject_id) values ($1, $2)",
+                    assessment_id,
+                    subject_id,
+                )
+                await connection.executemany(
+                    "insert into readiness_v1.assessment_answers values ($1, $2, $3)",
+                    [(assessment_id, qid, value) for qid, value in record["answers"].items()],
+                )
+            return await connection.fetch(
+                f"select id, overall_score, dimension_scores::text from {SCORING_FUNCTION}($1)", ids
+            )
+        finally:
+            await connection.close()
+
+    rows = {str(row["id"]): row for row in asyncio.run(scenario())}
+    for record in records:
+        state = AssessmentState(SCHEMA, record["answers"], record["profile"])
+        row = rows[record["assessment_id"]]
+        assert row["overall_score"] == state.overall_score
+        assert json.loads(row["dimension_scores"]) == state.section_scores
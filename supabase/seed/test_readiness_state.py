@@ -0,0 +1,133 @@
+import copy
+import random
+
+from readiness_batch import BatchScorer, load_schema
+from readiness_conditions import ApplicabilityCache, applicable_questions, compile_schema
+from readiness_sql import scoring_function_sql
+from readiness_state import AssessmentState
+
+SCHEMA = load_schema()
+SCORER = BatchScorer(SCHEMA)
+
+
+def full_pass(answers: dict, profile: dict) -> tuple[int, list[int]]:
+    results = SCORER.score_batch(*SCORER.encode([(answers, profile)]))
+    return int(results["overall_score"][0]), [int(score) for score in results["section_scores"][0]]
+
+
+def test_incremental_updates_match_full_rescoring():
+    rng = random.Random(11)
+    state = AssessmentState(SCHEMA)
+    questions = SCHEMA["questions"]
+    fields = [q["field"] for q in SCHEMA["profile_questions"]]
+
+    for _ in range(2000):
+        if rng.random() < 0.15:
+            state.apply_profile(rng.choice(fields), rng.choice([True, False, None]))
+        else:
+            question = rng.choice(questions)
+            value = rng.choice(question["options"] + [None])
+            state.apply_answer(question["id"], value and value["value"])
+
+        overall, sections = full_pass(state.answers, state.profile)
+        assert state.overall_score == overall
+        assert list(state.section_scores.values()) == sections
+
+    rebuilt = AssessmentState(SCHEMA, state.answers, state.profile)
+    assert rebuilt.section_states() == state.section_states()
+    assert rebuilt.overall_progress == state.overall_progress
+
+
+def test_duplicate_option_values_score_by_the_last_option_everywhere():
+    schema = copy.deepcopy(SCHEMA)
+    question = next(q for q in schema["questions"] if q["id"] == "2.1")
+    question["options"] += [
+        {"value": "yes", "label": "Yes (counted as no)", "score_value": "no"},
+        {"value": "partial", "label": "Partial (not scored)", "score_value": "na"},
+    ]
+    scorer = BatchScorer(schema)
+    section = scorer.section_ids.index("2")
+    for value, expected in [("yes", 0), ("partial", 0), ("no", 0), ("not_sure", 25)]:
+        state = AssessmentState(schema, {"2.1": value})
+        results = scorer.score_batch(*scorer.encode([({"2.1": value}, {})]))
+        assert state.section_scores["2"] == results["section_scores"][0, section] == expected
+    assert state.sections["2"].scored_weight == 1
+    assert AssessmentState(schema, {"2.1": "partial"}).sections["2"].scored_weight == 0
+
+    sql = scoring_function_sql(schema)
+    assert "case i.answers->>'2.1' when 'yes' then 0 when 'no' then 0 when 'not_sure' then 0.25 end" in sql
+
+
+def test_gating_answer_changes_dependent_applicability():
+    state = AssessmentState(SCHEMA, {"1.1.B.2": "yes"})
+    assert state.applicable["1.1.B.2"] is False
+    assert state.section_scores["1"] == 0
+
+    state.apply_answer("1.1.B.1", "partial")
+    assert state.applicable["1.1.B.2"] is True
+    assert state.section_scores["1"] == 75
+
+    state.apply_answer("1.1.B.1", "no")
+    assert state.applicable["1.1.B.2"] is False
+    assert state.section_scores["1"] == 0
+    assert state.band == "Low Readiness / High Risk"
+
+
+def test_profile_changes_unlock_sections():
+    state = AssessmentState(SCHEMA, {"9.2": "yes"})
+    section = next(s for s in state.section_states() if s["id"] == "9")
+    assert section["status"] == "locked"
+
+    state.apply_profile("family.supports_aging_parent", True)
+    section = next(s for s in state.section_states() if s["id"] == "9")
+    assert section["status"] == "in_progress"
+    assert state.profile == {"family": {"supports_aging_parent": True}}
+    assert state.overall_score == 100
+
+
+def test_next_question_matches_a_full_scan():
+    rng = random.Random(5)
+    state = AssessmentState(SCHEMA)
+    questions = SCHEMA["questions"]
+    fields = [q["field"] for q in SCHEMA["profile_questions"]]
+    compiled = compile_schema(SCHEMA)
+
+    for _ in range(1500):
+        roll = rng.random()
+        if roll < 0.1:
+            state.apply_profile(rng.choice(fields), rng.choice([True, False, None]))
+        elif roll < 0.25:
+            state.apply_answer(rng.choice(questions)["id"], None)
+        else:
+            question = rng.choice(questions[:30]) if roll < 0.4 else None
+            target = question["id"] if question else state.next_question()
+            if target:
+                options = next(q["options"] for q in questions if q["id"] == target)
+                state.apply_answer(target, rng.choice(options)["value"])
+
+        expected = next(
+            (
+                qid
+                for qid in applicable_questions(compiled, state.answers, state.profile)
+                if qid not in state.answers
+            ),
+            None,
+        )
+        assert state.next_question() == expected
+
+
+def test_shared_applicability_cache_matches_fresh_states():
+    cache = ApplicabilityCache(SCHEMA)
+    rng = random.Random(5)
+    for _ in range(200):
+        answers = {
+            q["id"]: rng.choice(q["options"])["value"]
+            for q in SCHEMA["questions"]
+            if rng.random() < 0.6
+        }
+        profile = {"pets": {"has_pets": rng.choice([True, False, "yes"])}}
+        cached = AssessmentState(SCHEMA, answers, profile, applicability=cache)
+        fresh = AssessmentState(SCHEMA, answers, profile)
+        assert cached.applicable == fresh.applicable
+        assert cached.section_states() == fresh.section_states()
+    assert cache.hits + cache.misses == 200 and cache.hits > 0
@@ -0,0 +1,212 @@
+import copy
+import json
+
+import pytest
+
+from readiness_batch import load_schema
+from readiness_conditions import compile_condition, iter_refs, parse_condition
+from readiness_tables import (
+    build_dependency_index,
+    build_encoding,
+    build_routing_table,
+    build_score_tables,
+    derive_soft_gates,
+    expand_option_sets,
+    intern_option_sets,
+    next_open_question,
+    profile_state_index,
+    validate_score_bands,
+)
+
+SCHEMA = load_schema()
+
+
+def test_dependency_index_lists_questions_and_gates_per_input():
+    index = build_dependency_index(SCHEMA)
+
+    b7 = index["answers"]["1.1.B.7"]
+    assert b7["questions"] == ["1.1.A.7", "1.1.B.10", "1.1.B.11", "2.4"]
+    assert all("1.1.B.7" in SCHEMA["soft_gates"][i]["when"] for i in b7["soft_gates"])
+
+    pets = index["profile"]["pets.has_pets"]
+    assert pets["questions"] == ["5.4", "5.5"]
+    assert [SCHEMA["profile_gates"][i]["questions"] for i in pets["profile_gates"]] == [["5.4", "5.5"]]
+    assert "household.has_dependents" not in index["profile"]
+
+
+def test_dependency_order_puts_inputs_before_dependents():
+    index = build_dependency_index(SCHEMA)
+    order = {qid: position for position, qid in enumerate(index["order"])}
+
+    assert sorted(order) == sorted(q["id"] for q in SCHEMA["questions"])
+    for key, dependents in index["answers"].items():
+        for qid in dependents["questions"]:
+            assert order[key] < order[qid]
+    assert SCHEMA["dependencies"] == index
+
+
+def test_dependency_cycles_are_rejected():
+    schema = copy.deepcopy(SCHEMA)
+    first = next(q for q in schema["questions"] if q["id"] == "1.1.A.1")
+    first["applies_if"] = "answers['1.1.A.2'] in ['yes']"
+
+    with pytest.raises(ValueError, match="1.1.A.1 -> 1.1.A.2 -> 1.1.A.1"):
+        build_dependency_index(schema)
+
+
+def test_profile_applicability_rows_match_gate_evaluation():
+    table = SCHEMA["profile_applicability"]
+    fields = table["fields"]
+    assert len(table["question_masks"]) == 2 ** len(fields) == 128
+    assert "household.has_dependents" not in fields
+
+    profile = {
+        "financial": {"has_beneficiary_accounts": False},
+        "household": {"has_dependents": True},
+        "pets": {"has_pets": True},
+        "digital": {"owns_crypto": False},
+        "family": {"supports_aging_parent": False},
+        "home": {"owns_real_property": True, "has_significant_personal_property": False},
+        "emotional": {"has_spiritual_practices": True},
+    }
+    state = profile_state_index(profile, fields)
+    mask = int(table["question_masks"][state], 16)
+    excluded = {
+        qid
+        for gate in SCHEMA["profile_gates"]
+        if compile_condition(gate["when"])({}, profile)
+        for qid in gate["questions"]
+    }
+    for bit, question in enumerate(SCHEMA["questions"]):
+        assert bool(mask >> bit & 1) == (question["id"] not in excluded), question["id"]
+
+    section_ids = [s["id"] for s in SCHEMA["sections"]]
+    assert table["section_counts"][state][section_ids.index("9")] == 0
+    assert not table["section_masks"][state] >> section_ids.index("9") & 1
+    assert table["section_masks"][state] >> section_ids.index("5") & 1
+
+
+def test_profile_state_index_requires_every_field():
+    fields = SCHEMA["profile_applicability"]["fields"]
+    assert profile_state_index({"pets": {"has_pets": True}}, fields) is None
+
+
+def test_option_sets_round_trip_to_the_expanded_schema():
+    compact = intern_option_sets(SCHEMA)
+
+    assert "options" not in compact["questions"][0]
+    assert len(compact["option_sets"]) < len(SCHEMA["questions"])
+    assert len({q["options_ref"] for q in compact["profile_questions"]}) == 1
+    assert json.dumps(expand_option_sets(compact)) == json.dumps(SCHEMA)
+    assert len(json.dumps(compact)) < len(json.dumps(SCHEMA))
+
+
+def test_soft_gates_pair_applies_if_with_its_complement():
+    gates = derive_soft_gates(SCHEMA)
+    questions = {q["id"]: q for q in SCHEMA["questions"]}
+    dependent = [
+        q["id"]
+        for q in SCHEMA["questions"]
+        if any(kind == "answer" for kind, _key in iter_refs(parse_condition(q["applies_if"])))
+    ]
+
+    assert [gate["questions"][0] for gate in gates[::2]] == dependent
+    for ask, na in zip(gates[::2], gates[1::2]):
+        assert (ask["result"], na["result"]) == ("ask", "na")
+        assert ask["when"] == questions[ask["questions"][0]]["applies_if"]
+    a7 = gates[[gate["questions"] for gate in gates].index(["1.1.A.7"]) + 1]
+    assert "answers['1.1.B.8'] in ['no','not_sure','na']" in a7["when"]
+    assert [{k: v for k, v in g.items() if k != "when_ref"} for g in SCHEMA["soft_gates"]] == gates
+
+
+def test_routing_candidates_reach_the_next_open_question():
+    routing = build_routing_table(SCHEMA)
+    assert SCHEMA["routing"] == routing
+    ids = [q["id"] for q in SCHEMA["questions"]]
+    conditions = [compile_condition(q.get("applies_if")) for q in SCHEMA["questions"]]
+    assert [step["id"] for step in routing["steps"]] == ids
+    assert all(step["next"][0] == index + 1 for index, step in enumerate(routing["steps"][:-1]))
+
+    answers = {"1.1.A.1": "no", "1.1.A.3": "yes", "1.1.A.5": "yes", "1.1.A.6": "no"}
+    profile = {"pets": {"has_pets": False}}
+    visited = []
+
+    def is_applicable(index: int) -> bool:
+        visited.append(index)
+        return conditions[index](answers, profile)
+
+    found = next_open_question(routing, is_applicable, lambda index: ids[index] in answers)
+    assert ids[found] == "1.1.A.4"
+    assert visited == [0, 1, 2, 3]
+
+    section_5 = next(s for s in routing["sections"] if s["section_id"] == "5")
+    answers.update({qid: "yes" for qid in ids[section_5["start"] : section_5["stop"]]})
+    assert next_open_question(
+        routing, is_applicable, lambda i: ids[i] in answers, section_5["start"], section_5["stop"]
+    ) is None
+
+
+def test_score_tables_index_bands_and_weights():
+    tables = build_score_tables(SCHEMA)
+    assert SCHEMA["score_tables"] == tables
+
+    labels = [SCHEMA["score_bands"][index]["label"] for index in tables["band_lookup"]]
+    assert len(labels) == 101
+    assert (labels[0], labels[39], labels[40], labels[79], labels[80]) == (
+        "Low Readiness / High Risk",
+        "Low Readiness / High Risk",
+        "Limited Preparedness",
+        "Moderately Prepared",
+        "Highly Prepared",
+    )
+    assert sum(tables["section_weight_shares"].values()) == pytest.approx(1.0)
+    assert tables["question_max_points"]["3.9"] == 100
+    section_1 = [q["id"] for q in SCHEMA["questions"] if q["section_id"] == "1"]
+    assert tables["section_max_points"]["1"] == sum(
+        tables["question_max_points"][qid] for qid in section_1
+    )
+
+
+@pytest.mark.parametrize(
+    ("bands", "message"),
+    [
+        ([{"min": 0, "max": 50, "label": "a"}, {"min": 50, "max": 100, "label": "b"}], "overlap at 50"),
+        ([{"min": 0, "max": 40, "label": "a"}, {"min": 45, "max": 100, "label": "b"}], "41..44"),
+        ([{"min": 0, "max": 101, "label": "a"}], "invalid range"),
+    ],
+)
+def test_score_bands_must_partition_0_to_100(bands, message):
+    with pytest.raises(ValueError, match=message):
+        validate_score_bands(bands)
+
+
+def test_encoding_keeps_slots_when_questions_change():
+    encoding = SCHEMA["encoding"]
+    assert list(encoding["questions"].values()) == list(range(len(SCHEMA["questions"])))
+    assert encoding["answer_codes"] == {"yes": 1, "partial": 2, "no": 3, "not_sure": 4, "na": 5}
+
+    changed = copy.deepcopy(SCHEMA)
+    removed = changed["questions"].pop(0)
+    changed["questions"].append({**removed, "id": "12.1"})
+    result = build_encoding(changed, encoding)
+
+    assert removed["id"] not in result["questions"]
+    assert result["questions"]["12.1"] == encoding["question_slots"]
+    assert result["question_slots"] == encoding["question_slots"] + 1
+    kept = {qid: slot for qid, slot in encoding["questions"].items() if qid != removed["id"]}
+    assert {qid: result["questions"][qid] for qid in kept} == kept
+
+
+def test_encoding_never_reuses_retired_answer_codes():
+    encoding = SCHEMA["encoding"]
+    assert encoding["next_answer_code"] == 6
+
+    retired = copy.deepcopy(SCHEMA)
+    del retired["answer_scoring"]["na"]
+    result = build_encoding(retired, encoding)
+    assert result["next_answer_code"] == 6
+
+    restored = copy.deepcopy(SCHEMA)
+    restored["answer_scoring"]["unknown"] = None
+    assert build_encoding(restored, result)["answer_codes"]["na"] == 6
+    assert build_encoding(restored, result)["answer_codes"]["unknown"] == 7
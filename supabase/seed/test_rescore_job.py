@@ -0,0 +1,132 @@
+import asyncio
+import json
+import math
+import os
+import uuid
+
+import pytest
+
+from readiness_batch import BatchScorer, load_schema
+from readiness_conditions import applicable_questions, compile_schema
+from readiness_population import PopulationGenerator
+from readiness_state import AssessmentState
+from rescore_job import rescore, score_rows
+
+SCHEMA = load_schema()
+RECORDS = list(PopulationGenerator(SCHEMA, seed=2, completion_rate=0.6).records(12))
+
+# Point this at a disposable database, e.g. `docker run -p 5432:5432 postgres:16`.
+TEST_DSN = os.environ.get("READINESS_TEST_DSN")
+
+SETUP_SQL = """
+create schema if not exists readiness_v1;
+create table if not exists readiness_v1.profile_intake (
+  subject_id uuid primary key,
+  profile_json jsonb not null default '{}'::jsonb
+);
+create table if not exists readiness_v1.assessments (
+  id uuid primary key,
+  subject_id uuid not null,
+  assessment_id text not null default 'readiness_v1',
+  schema_version text not null default 'v1',
+  overall_score numeric,
+  dimension_scores jsonb not null default '{}'::jsonb
+);
+create table if not exists readiness_v1.assessment_answers (
+  assessment_id uuid not null,
+  question_id text not null,
+  answer_value text not null
+);
+"""
+
+
+def app_scores(answers: dict, profile: dict) -> tuple[int, dict[str, int]]:
+    """The ``results`` memo of ``src/pages/Readiness.tsx``, which stores ``overall_score``."""
+    applicable = set(applicable_questions(compile_schema(SCHEMA), answers, profile))
+    section_scores: dict[str, int] = {}
+    weighted_total = weight_sum = 0.0
+    for section in SCHEMA["sections"]:
+        fractions = []
+        for question in SCHEMA["questions"]:
+            if question["section_id"] != section["id"] or question["id"] not in applicable:
+                continue
+            option = next((o for o in question["options"] if o["value"] == answers.get(question["id"])), None)
+            if option is None:
+                continue
+            score_value = option.get("score_value", option["value"])
+            fraction = None if score_value == "na" else SCHEMA["answer_scoring"].get(score_value)
+            if fraction is not None:
+                fractions.append(fraction)
+        if not fractions:
+            continue
+        average = sum(fractions) / len(fractions)
+        section_scores[section["id"]] = math.floor(average * 100 + 0.5)
+        weighted_total += average * section["weight"]
+        weight_sum += section["weight"]
+    overall = math.floor(weighted_total / weight_sum * 100 + 0.5) if weight_sum > 0 else 0
+    return overall, section_scores
+
+
+def test_score_rows_match_the_stored_app_scores():
+    records = list(PopulationGenerator(SCHEMA, seed=9, completion_rate=0.7).records(3000))
+    rows = [
+        {"id": record["assessment_id"], "answers": record["answers"], "profile_json": record["profile"]}
+        for record in RECORDS + records
+    ]
+    agent_differs = 0
+    for row, (assessment_id, overall, sections) in zip(rows, score_rows(BatchScorer(SCHEMA), rows)):
+        assert assessment_id == row["id"]
+        assert (overall, json.loads(sections)) == app_scores(row["answers"], row["profile_json"])
+        agent_differs += overall != AssessmentState(SCHEMA, row["answers"], row["profile_json"]).overall_score
+    assert agent_differs > 0
+    assert score_rows(BatchScorer(SCHEMA), [{"id": "empty", "answers": {}, "profile_json": {}}]) == [
+        ("empty", 0, "{}")
+    ]
+
+
+@pytest.mark.skipif(not TEST_DSN, reason="set READINESS_TEST_DSN to a disposable Postgres")
+def test_rescore_updates_stale_rows_in_one_pass():
+    asyncpg = pytest.importorskip("asyncpg")
+
+    async def scenario() -> tuple[dict, dict, list]:
+        connection = await asyncpg.connect(TEST_DSN)
+        try:
+            await connection.execute(SETUP_SQL)
+            ids = [uuid.UUID(record["assessment_id"]) for record in RECORDS]
+            await connection.execute(
+                "delete from readiness_v1.assessment_answers where assessment_id = any($1)", ids
+            )
+            await connection.execute("delete from readiness_v1.assessments where id = any($1)", ids)
+            for assessment_id, record in zip(ids, RECORDS):
+                subject_id = uuid.uuid4()
+                await connection.execute(
+                    "insert into readiness_v1.profile_intake values ($1, $2::jsonb)",
+                    subject_id,
+                    json.dumps(record["profile"]),
+                )
+                await connection.execute(
+                    "insert into readiness_v1.assessments (id, subject_id, overall_score) "
+                    "values ($1, $2, 0)",
+                    assessment_id,
+                    subject_id,
+                )
+                await connection.executemany(
+                    "insert into readiness_v1.assessment_answers values ($1, $2, $3)",
+                    [(assessment_id, qid, value) for qid, value in record["answers"].items()],
+                )
+
+            first = await rescore(TEST_DSN, SCHEMA, batch_size=5)
+            second = await rescore(TEST_DSN, SCHEMA, batch_size=5)
+            stored = await connection.fetch(
+                "select id, overall_score from readiness_v1.assessments where id = any($1)", ids
+            )
+            return first, second, stored
+        finally:
+            await connection.close()
+
+    first, second, stored = asyncio.run(scenario())
+    scores = {str(row["id"]): int(row["overall_score"]) for row in stored}
+    for record in RECORDS:
+        assert scores[record["assessment_id"]] == app_scores(record["answers"], record["profile"])[0]
+    assert first["scored"] >= len(RECORDS)
+    assert second["updated"] == 0
@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+
+from readiness_batch import load_schema
+from readiness_population import PopulationGenerator, write_jsonl
+from readiness_state import AssessmentState
+from score_exports import score_stream
+
+SCHEMA = load_schema()
+RECORDS = list(PopulationGenerator(SCHEMA, seed=5, completion_rate=0.7).records(40))
+
+
+def _expected(record: dict) -> tuple[int, str | None]:
+    state = AssessmentState(SCHEMA, record["answers"], record["profile"])
+    return state.overall_score, state.band
+
+
+def _jsonl() -> io.StringIO:
+    source = io.StringIO()
+    write_jsonl(iter(RECORDS), source)
+    source.seek(0)
+    return source
+
+
+def test_jsonl_scores_in_input_order_across_workers():
+    sink = io.StringIO()
+    count = score_stream(_jsonl(), sink, SCHEMA, workers=2, chunk_rows=7)
+
+    results = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert count == len(results) == len(RECORDS)
+    for record, result in zip(RECORDS, results):
+        assert result["assessment_id"] == record["assessment_id"]
+        assert (result["overall_score"], result["band"]) == _expected(record)
+        assert list(result["section_scores"]) == [s["id"] for s in SCHEMA["sections"]]
+
+
+def test_wide_csv_matches_jsonl_scores():
+    question_ids = [q["id"] for q in SCHEMA["questions"]]
+    fields = [q["field"] for q in SCHEMA["profile_questions"]]
+    source = io.StringIO()
+    writer = csv.writer(source)
+    writer.writerow(["assessment_id", *question_ids, *(f"profile.{field}" for field in fields)])
+    for record in RECORDS:
+        profile = []
+        for field in fields:
+            group, name = field.split(".", 1)
+            profile.append(str(record["profile"][group][name]).lower())
+        answers = [record["answers"].get(qid, "") for qid in question_ids]
+        writer.writerow([record["assessment_id"], *answers, *profile])
+    source.seek(0)
+
+    sink = io.StringIO()
+    score_stream(source, sink, SCHEMA, kind="csv", output="csv", workers=1, chunk_rows=9)
+
+    rows = list(csv.reader(io.StringIO(sink.getvalue())))
+    assert rows[0][:3] == ["assessment_id", "overall_score", "band"]
+    for record, row in zip(RECORDS, rows[1:], strict=True):
+        assert row[0] == record["assessment_id"]
+        assert (int(row[1]), row[2]) == _expected(record)
+
+
+def test_csv_profile_cells_code_like_jsonl_values():
+    question_ids = [q["id"] for q in SCHEMA["questions"]]
+    # Only a known true has_pets makes the "no" pet answers count.
+    answers = {qid: "no" if qid in ("5.4", "5.5") else "yes" for qid in question_ids}
+    cells = ["true", "false", "1", "0", "yes", "no", "True", '"true"', ""]
+    source = io.StringIO()
+    writer = csv.writer(source)
+    writer.writerow(["assessment_id", *question_ids, "profile.pets.has_pets"])
+    lines = []
+    for index, cell in enumerate(cells):
+        writer.writerow([str(index), *answers.values(), cell])
+        try:
+            value = json.loads(cell)
+        except ValueError:
+            value = cell
+        record = {"assessment_id": str(index), "answers": answers}
+        lines.append(json.dumps({**record, "profile": {"pets": {"has_pets": value}}}) + "\n")
+    source.seek(0)
+
+    from_csv, from_jsonl = io.StringIO(), io.StringIO()
+    score_stream(source, from_csv, SCHEMA, kind="csv", workers=1)
+    score_stream(io.StringIO("".join(lines)), from_jsonl, SCHEMA, workers=1)
+    assert from_csv.getvalue() == from_jsonl.getvalue()
+    scores = [json.loads(line)["section_scores"]["5"] for line in from_csv.getvalue().splitlines()]
+    assert [score < 100 for score in scores] == [True, False, True] + [False] * 6